@@ -0,0 +1,85 @@
+"""Requests per second of the JSON API under uvicorn.
+
+Usage: python benchmarks/bench_api.py [seconds] [connections]
+
+Starts ``python -m trigcalc.api`` on a free local port and drives it with
+keep-alive HTTP/1.1 connections from an asyncio client, first with single
+requests and then with batches of 100.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+SINGLE = {'case': 'SSS', 'a': 7, 'b': 8, 'c': 9}
+BATCH_SIZE = 100
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def client(port, request, deadline, counts):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    while time.perf_counter() < deadline:
+        writer.write(request)
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+            if line in (b'\r\n', b''):
+                break
+        await reader.readexactly(length)
+        counts[0] += 1
+    writer.close()
+
+
+async def drive(port, path, payload, seconds, connections):
+    body = json.dumps(payload).encode()
+    request = (f'POST {path} HTTP/1.1\r\nHost: localhost\r\n'
+               f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n').encode() + body
+    counts = [0]
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(client(port, request, deadline, counts) for _ in range(connections)))
+    return counts[0] / (time.perf_counter() - start)
+
+
+async def wait_ready(port):
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise SystemExit("server did not start")
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    connections = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    port = free_port()
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    server = subprocess.Popen([sys.executable, '-m', 'trigcalc.api', '--port', str(port)],
+                              cwd=root)
+    try:
+        asyncio.run(wait_ready(port))
+        rate = asyncio.run(drive(port, '/triangle/oblique', SINGLE, seconds, connections))
+        print(f"single requests:  {rate:8.0f} req/s")
+        rate = asyncio.run(drive(port, '/triangle/oblique', [SINGLE] * BATCH_SIZE, seconds, connections))
+        print(f"batches of {BATCH_SIZE}:   {rate:8.0f} req/s = {rate * BATCH_SIZE:.0f} solves/s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Throughput of the batch CLI (python -m trigcalc) on generated files.
+
+Usage: python benchmarks/bench_cli_batch.py [rows]
+
+Writes a random oblique-triangle file and a random right-triangle file in
+CSV and Parquet to a temporary directory and solves each one.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.parquet
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc.cli import solve_file
+from trigcalc.triangles import OBLIQUE_CASES
+
+
+def make_table(kind, n, seed=0):
+    rng = np.random.default_rng(seed)
+    cols = {'id': np.arange(n)}
+    if kind == 'oblique':
+        cols['case'] = np.array(OBLIQUE_CASES)[rng.integers(0, len(OBLIQUE_CASES), n)]
+    cols.update({k: rng.uniform(1, 20, n) for k in 'abc'})
+    cols.update({k: rng.uniform(5, 80, n) for k in ('AB' if kind == 'right' else 'ABC')})
+    if kind == 'right':
+        # Blank out values so rows use every combination of givens
+        for k in 'abcAB':
+            cols[k][rng.random(n) < 0.6] = np.nan
+    return pa.table(cols)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in ('right', 'oblique'):
+            table = make_table(kind, n)
+            for ext in ('csv', 'parquet'):
+                src = os.path.join(tmp, f'{kind}.{ext}')
+                dst = os.path.join(tmp, f'{kind}_out.{ext}')
+                if ext == 'csv':
+                    pa.csv.write_csv(table, src)
+                else:
+                    pa.parquet.write_table(table, src)
+
+                start = time.perf_counter()
+                rows, counts = solve_file(kind, src, dst)
+                elapsed = time.perf_counter() - start
+                print(f"{kind:8s} {ext:8s} {rows} rows  {elapsed:6.2f} s  "
+                      f"{rows / elapsed / 1e6 * 60:6.1f} M rows/min")
+
+
+if __name__ == "__main__":
+    main()
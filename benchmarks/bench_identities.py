@@ -0,0 +1,58 @@
+"""Time verify_identities on a problem set, cold and with warm caches.
+
+Usage: python benchmarks/bench_identities.py [students]
+
+Each student gets the same textbook identities (and some non-identities)
+in their own variable name, so every student's set is parsed and checked
+from scratch on the first (cold) pass.
+"""
+
+import os
+import sys
+import time
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc.identities import verify_identities
+
+PROBLEMS = [
+    "sin²θ + cos²θ = 1",
+    "tan²θ + 1 = sec²θ",
+    "1 + cot²θ = csc²θ",
+    "tan θ + cot θ = sec θ csc θ",
+    "sec θ - cos θ = sin θ tan θ",
+    "(1 - cos θ)/sin θ = sin θ/(1 + cos θ)",
+    "sin^4θ - cos^4θ = sin²θ - cos²θ",
+    "1/(1 - sin θ) + 1/(1 + sin θ) = 2sec²θ",
+    "sin(2θ) = 2sin θ cos θ",
+    "cos(2θ) = 1 - 2sin²θ",
+    "sin(π/2 - θ) = cos θ",
+    "tan(2θ) = 2tan θ/(1 - tan²θ)",
+    "sin θ = cos θ",
+    "sec²θ = 1 - tan²θ",
+    "sqrt(sin²θ) = sin θ",
+]
+NAMES = "abcdfghjkmnpqrstuvwxyz"
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    names = [NAMES[i % len(NAMES)] + str(i // len(NAMES) or "") for i in range(students)]
+    problems = [p.replace("θ", f" {name} ") for name in names for p in PROBLEMS]
+
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        results = verify_identities(problems)
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {len(problems):,} identities in {elapsed * 1e3:.0f} ms "
+              f"({elapsed / len(problems) * 1e3:.3f} ms each)")
+
+    symbolic = sum(r['method'] == 'symbolic' for r in results)
+    identical = sum(bool(r['identical']) for r in results)
+    print(f"{identical:,} identical ({symbolic:,} shown algebraically), "
+          f"{len(results) - identical:,} not")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare a Python loop over solve_oblique with solve_oblique_batch.
+
+Usage: python benchmarks/bench_oblique_batch.py [rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc import solve_oblique
+from trigcalc.batch import solve_oblique_batch, ERR_OK
+from trigcalc.triangles import OBLIQUE_CASES
+
+BATCH_REPEATS = 5
+
+
+def make_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    cases = rng.integers(0, len(OBLIQUE_CASES), n)
+    cols = {k: rng.uniform(1, 20, n) for k in 'abc'}
+    cols.update({k: rng.uniform(5, 120, n) for k in 'ABC'})
+    return cases, cols
+
+
+def loop(cases, cols):
+    names = [OBLIQUE_CASES[i] for i in cases]
+    values = {k: v.tolist() for k, v in cols.items()}
+    solved = 0
+    for i, name in enumerate(names):
+        try:
+            solve_oblique(name, **{k: v[i] for k, v in values.items()})
+            solved += 1
+        except ValueError:
+            pass
+    return solved
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cases, cols = make_rows(n)
+
+    start = time.perf_counter()
+    solved_loop = loop(cases, cols)
+    t_loop = time.perf_counter() - start
+
+    # The first call also pays for faulting in fresh output arrays, so
+    # report it separately and compare the loop with the best of the rest
+    times = []
+    for _ in range(1 + BATCH_REPEATS):
+        start = time.perf_counter()
+        result = solve_oblique_batch(cases, **cols)
+        times.append(time.perf_counter() - start)
+    t_cold, t_batch = times[0], min(times[1:])
+    solved_batch = int(np.count_nonzero(result['error'] == ERR_OK))
+
+    print(f"rows:   {n}")
+    print(f"loop:   {t_loop:.3f} s ({solved_loop} solved)")
+    print(f"batch:  {t_batch:.3f} s, best of {BATCH_REPEATS} ({solved_batch} solved; first call {t_cold:.3f} s)")
+    print(f"speedup: {t_loop / t_batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Scaling of ParallelSolver with the number of worker processes.
+
+Usage: python benchmarks/bench_parallel.py [rows] [kind]
+
+Solves the same random batch with solve_batch in this process and then
+with 1, 2, 4, ... workers up to the CPU count, checking that every run
+returns the same result. Pool start-up is excluded from the timings.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc.batch import solve_batch
+from trigcalc.parallel import ParallelSolver
+from trigcalc.triangles import OBLIQUE_CASES
+
+
+def make_columns(kind, n, seed=0):
+    rng = np.random.default_rng(seed)
+    if kind == 'vector':
+        return {k: rng.uniform(-20, 20, n) for k in 'xy'}, None
+    columns = {k: rng.uniform(1, 20, n) for k in 'abc'}
+    columns.update({k: rng.uniform(5, 80, n) for k in 'ABC'})
+    if kind == 'right':
+        for k in 'abcAB':
+            columns[k][rng.random(n) < 0.6] = np.nan
+        return columns, None
+    return columns, rng.integers(0, len(OBLIQUE_CASES), n)
+
+
+def worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if cpus > 1:
+        counts.append(cpus)
+    return counts
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    kind = sys.argv[2] if len(sys.argv) > 2 else 'oblique'
+    columns, case = make_columns(kind, n)
+
+    start = time.perf_counter()
+    expected = solve_batch(kind, columns, case=case)
+    serial = time.perf_counter() - start
+    print(f"{kind}, {n} rows, {os.cpu_count()} CPUs")
+    print(f"in-process    {serial:7.2f} s")
+
+    for workers in worker_counts():
+        with ParallelSolver(workers) as solver:
+            solver.solve(kind, {k: v[:workers] for k, v in columns.items()},
+                         case=None if case is None else case[:workers])
+            start = time.perf_counter()
+            result = solver.solve(kind, columns, case=case)
+            elapsed = time.perf_counter() - start
+        same = all(np.array_equal(expected[k], result[k], equal_nan=True) for k in expected)
+        print(f"{workers:3d} workers   {elapsed:7.2f} s  {serial / elapsed:5.2f}x"
+              f"{'' if same else '  MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
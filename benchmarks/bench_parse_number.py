@@ -0,0 +1,74 @@
+"""Per-call latency of parse_number against the old regex/replace version.
+
+Usage: python benchmarks/bench_parse_number.py [reruns]
+
+The corpus is what a session's text inputs typically hold; every rerun
+parses all of it again, as Streamlit does.
+"""
+
+import math
+import os
+import re
+import sys
+import time
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc import parse_number
+from trigcalc.utils import PI
+
+CORPUS = [
+    '', '3', '4', '5', '12.5', '-2', '0.75', '45', '30', '60', '120', '225',
+    'π', 'π/4', '-π/6', '2π', '5π/6', '√2', '√3/2', '-√2/2', 'sqrt(3)',
+    '1/2', '-1/2', '3/5', '9.81', '50', '1e3', 'N30°E', '100',
+]
+
+
+def parse_number_regex(s):
+    """The previous implementation: two re.sub calls, replaces and a split."""
+    if not s or str(s).strip() == '':
+        return float('nan')
+    s = str(s).strip()
+    s = re.sub(r'√(\d+)', lambda m: str(math.sqrt(float(m.group(1)))), s)
+    s = re.sub(r'sqrt\((\d+)\)', lambda m: str(math.sqrt(float(m.group(1)))), s, flags=re.IGNORECASE)
+    s = s.replace('π', str(PI)).replace('pi', str(PI)).replace('PI', str(PI))
+    if '/' in s:
+        parts = s.split('/')
+        if len(parts) == 2:
+            try:
+                return float(parts[0]) / float(parts[1])
+            except (ValueError, ZeroDivisionError):
+                return float('nan')
+    try:
+        return float(s)
+    except ValueError:
+        return float('nan')
+
+
+def per_call(func, reruns):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        for s in CORPUS:
+            func(s)
+    return (time.perf_counter() - start) / (reruns * len(CORPUS)) * 1e6
+
+
+def main():
+    reruns = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    old = per_call(parse_number_regex, reruns)
+    parse_number.cache_clear()
+    cold = per_call(lambda s: (parse_number.cache_clear(), parse_number(s)), reruns)
+    parse_number.cache_clear()
+    warm = per_call(parse_number, reruns)
+
+    print(f"calls:            {reruns * len(CORPUS)}")
+    print(f"regex (before):   {old:.3f} µs/call")
+    print(f"tokenizer, cold:  {cold:.3f} µs/call")
+    print(f"tokenizer, warm:  {warm:.3f} µs/call")
+    print(parse_number.cache_info())
+
+
+if __name__ == "__main__":
+    main()
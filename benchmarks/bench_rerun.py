@@ -0,0 +1,73 @@
+"""Script execution time of one Streamlit rerun per calculator section.
+
+Usage: python benchmarks/bench_rerun.py [app.py] [reruns]
+
+Each rerun is what a single widget interaction costs the server. Only the
+execution of the script is timed, not AppTest's own polling. Pass an older
+app.py to compare; sections are selected through the section radios when
+the app has them (with st.tabs every section runs anyway).
+"""
+
+import os
+import sys
+import time
+
+from streamlit.runtime.scriptrunner import script_runner
+from streamlit.testing.v1 import AppTest
+
+_timings = []
+_exec = script_runner.exec_func_with_error_handling
+
+
+def _timed_exec(func, ctx):
+    start = time.perf_counter()
+    try:
+        return _exec(func, ctx)
+    finally:
+        _timings.append(time.perf_counter() - start)
+
+
+script_runner.exec_func_with_error_handling = _timed_exec
+
+SECTIONS = {
+    "📚 Foundations": ("foundations_tab", [
+        "📐 Angles & Arcs", "📏 Right Triangles", "📊 Trig Evaluator",
+        "🌊 Sinusoidal Functions", "🔺 Oblique Triangles",
+    ]),
+    "🎓 Advanced": ("advanced_tab", [
+        "📊 Trig Equations", "🎯 Vectors", "🔄 Polar & Complex",
+        "📈 Parametric & Motion",
+    ]),
+}
+
+
+def time_reruns(at, reruns):
+    del _timings[:]
+    for _ in range(reruns):
+        at.run()
+    return sum(_timings) / len(_timings) * 1000
+
+
+def main():
+    app = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "..", "app.py")
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    at = AppTest.from_file(app, default_timeout=60)
+    at.run()
+    total = []
+    for level, (key, tabs) in SECTIONS.items():
+        at.sidebar.radio[0].set_value(level)
+        at.run()
+        has_radio = any(r.key == key for r in at.radio)
+        for tab in tabs:
+            if has_radio:
+                at.radio(key=key).set_value(tab)
+                at.run()
+            ms = time_reruns(at, reruns)
+            total.append(ms)
+            print(f"{level[2:]:12s} {tab[2:]:24s} {ms:7.1f} ms/rerun")
+    print(f"{'mean':37s} {sum(total) / len(total):7.1f} ms/rerun")
+
+
+if __name__ == "__main__":
+    main()
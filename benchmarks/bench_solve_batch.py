@@ -0,0 +1,40 @@
+"""Time solve_equation_batch on a million equations f(θ) = k.
+
+Usage: python benchmarks/bench_solve_batch.py [equations]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc.batch import solve_equation_batch
+from trigcalc.utils import PI
+
+CASES = [
+    ("sin", (0, 2 * PI), False),
+    ("cos", (-720, 720), True),
+    ("tan", (0, 2 * PI), False),
+    ("sec", (-720, 720), True),
+]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    for func, (lo, hi), degrees in CASES:
+        k = rng.uniform(-2, 2, n)
+        start = time.perf_counter()
+        solved = solve_equation_batch(func, k, lo, hi, degrees=degrees)
+        elapsed = time.perf_counter() - start
+        unit = "°" if degrees else " rad"
+        print(f"{func}(θ) = k on [{lo:g}{unit}, {hi:g}{unit}): {n:,} equations, "
+              f"{len(solved['values']):,} solutions in {elapsed * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Time table-driven sin/cos against math and NumPy, and check the error bound.
+
+Usage: python benchmarks/bench_tables.py [angles] [resolution]
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc import to_radians
+from trigcalc.tables import sine_table
+
+
+def timed(label, func, n):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed * 1e3:9.1f} ms  {n / elapsed / 1e6:8.1f} M angles/s")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    resolution = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+
+    start = time.perf_counter()
+    table = sine_table(resolution)
+    print(f"table: {table.steps + 1:,} entries, opened in {(time.perf_counter() - start) * 1e3:.2f} ms "
+          f"({table.path or 'in memory'})")
+
+    rng = np.random.default_rng(0)
+    grids = {
+        "integer degrees": rng.integers(-720, 720, n).astype(np.float64),
+        "tenth degrees": rng.integers(-7200, 7200, n) / 10,
+        "arbitrary degrees": rng.uniform(-720, 720, n),
+    }
+    for name, degrees in grids.items():
+        print(f"\n{name}:")
+        values = degrees.tolist()
+        timed("math.sin(to_radians(x)) per value", lambda: [math.sin(to_radians(x)) for x in values], n)
+        timed("np.sin + np.cos", lambda: (np.sin(np.radians(degrees)), np.cos(np.radians(degrees))), n)
+        sin, cos = timed("table sin_cos", lambda: table.sin_cos(degrees), n)
+        error = max(np.abs(sin - np.sin(np.radians(degrees))).max(),
+                    np.abs(cos - np.cos(np.radians(degrees))).max())
+        print(f"max error vs NumPy: {error:.2e} (bound {table.max_error:.2e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Time an RK4 launch-angle sweep with air resistance.
+
+Usage: python benchmarks/bench_trajectories.py [angles] [steps]
+"""
+
+import os
+import sys
+import time
+
+# Import trigcalc from this checkout when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trigcalc import projectile
+from trigcalc.trajectories import DRAG_MODELS, optimal_angle, simulate_trajectories
+
+
+def main():
+    angles = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    # Drag-free RK4 against the closed form
+    result = simulate_trajectories(50, [30, 45, 60], drag=0)
+    error = max(abs(result['range'][i] - projectile(50, a)['range']) for i, a in enumerate([30, 45, 60]))
+    print(f"max range error vs closed form (no drag): {error:.2e} m")
+
+    for model, k in zip(DRAG_MODELS, (0.0, 0.1, 0.01)):
+        start = time.perf_counter()
+        best = optimal_angle(50, drag=k, model=model, angles=angles, steps=steps)
+        elapsed = time.perf_counter() - start
+        print(f"{model:10s} k={k:<5} {angles} angles x {steps} steps: {elapsed:.3f} s, "
+              f"best {best['angle']:.2f}° -> {best['range']:.2f} m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Calculator pages for app.py.
+
+Each module renders one calculator through ``render(use_radians, show_steps)``.
+app.py imports a page's module the first time it is visited; after that it
+stays in ``sys.modules`` and reruns only call ``render``.
+``identities`` is not a page: it renders the sidebar's identity checker on
+every page.
+"""
+
+import importlib
+
+FOUNDATIONS = {
+    "📐 Angles & Arcs": "angles",
+    "📏 Right Triangles": "right_triangles",
+    "📊 Trig Evaluator": "evaluator",
+    "🌊 Sinusoidal Functions": "sinusoids",
+    "🔺 Oblique Triangles": "oblique",
+}
+
+ADVANCED = {
+    "📊 Trig Equations": "equations",
+    "🎯 Vectors": "vectors",
+    "🔄 Polar & Complex": "polar",
+    "📈 Parametric & Motion": "motion",
+}
+
+
+def load(module):
+    """Import a calculator page module on first use."""
+    return importlib.import_module(f"{__name__}.{module}")
@@ -0,0 +1,189 @@
+"""Angles & Arcs: angle conversions, arc length and sector area, linear and angular speed."""
+
+import streamlit as st
+
+from trigcalc import parse_number, format_number, format_radians
+
+from .common import engine
+
+
+def render(use_radians, show_steps):
+    """Render the Angles & Arcs calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Angle Conversions", "Arc Length & Sector", "Linear & Angular Speed"],
+        horizontal=True,
+        key="angles_section"
+    )
+
+    if section == "Angle Conversions":
+        st.markdown('<div class="section-header">📐 Angle Conversions</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            angle_input = st.text_input("Enter Angle", placeholder="e.g., 45, π/3, 45.5", key="angle_conv_input")
+        with col2:
+            input_format = st.selectbox("Input Format", ["Degrees", "Radians"], key="angle_conv_format")
+
+        if st.button("Convert", key="convert_angle"):
+            if angle_input:
+                try:
+                    result = engine.convert_angle(parse_number(angle_input), input_format)
+                    degrees = result['degrees']
+                    radians = result['radians']
+                    quadrant = result['quadrant']
+                    ref_angle = result['reference']
+                    sign, d, m, s = result['dms']
+
+                    # Display results
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Degrees", f"{format_number(degrees)}°")
+                    with col2:
+                        st.metric("Radians", format_radians(radians))
+                    with col3:
+                        st.metric("DMS", f'{sign}{d}° {m}\' {format_number(s, 2)}"')
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Quadrant", quadrant)
+                    with col2:
+                        st.metric("Reference Angle", f"{format_number(ref_angle)}°")
+                    with col3:
+                        st.metric("Coterminal (+360°)", f"{format_number(degrees + 360)}°")
+
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    if show_steps:
+                        steps = f"""Given: {angle_input} ({input_format.lower()})
+
+Step 1: Convert to decimal degrees
+  {angle_input} = {format_number(degrees)}°
+
+Step 2: Convert to radians
+  Radians = Degrees × (π/180)
+  {format_number(degrees)}° × (π/180) = {format_number(radians)} rad
+  = {format_radians(radians)}
+
+Step 3: Find the quadrant
+  Normalize: {format_number(degrees)}° mod 360° = {format_number(((degrees % 360) + 360) % 360)}°
+  This angle is in Quadrant {quadrant}
+
+Step 4: Find the reference angle
+  Reference angle = {format_number(ref_angle)}°
+
+Step 5: Convert to DMS
+  {format_number(degrees)}° = {sign}{d}° {m}' {format_number(s, 2)}\""""
+                        st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+                except ValueError as e:
+                    st.error(str(e))
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+
+    elif section == "Arc Length & Sector":
+        st.markdown('<div class="section-header">⌒ Arc Length & Sector Area</div>', unsafe_allow_html=True)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            radius = st.text_input("Radius (r)", placeholder="e.g., 5", key="arc_radius")
+        with col2:
+            arc_angle = st.text_input("Central Angle (θ)", placeholder="e.g., π/4 or 45", key="arc_angle")
+        with col3:
+            arc_unit = st.selectbox("Angle Unit", ["Radians", "Degrees"], key="arc_unit")
+
+        if st.button("Calculate", key="calc_arc"):
+            r = parse_number(radius)
+            theta = parse_number(arc_angle)
+
+            try:
+                result = engine.arc_sector(r, theta, arc_unit)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                theta_rad = result['theta_rad']
+                arc_length = result['arc_length']
+                sector_area = result['sector_area']
+                circumference = result['circumference']
+                circle_area = result['circle_area']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Arc Length (s)", f"{format_number(arc_length)} units")
+                    st.metric("Full Circumference", f"{format_number(circumference)} units")
+                with col2:
+                    st.metric("Sector Area (A)", f"{format_number(sector_area)} sq units")
+                    st.metric("Full Circle Area", f"{format_number(circle_area)} sq units")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                if show_steps:
+                    steps = f"""Given:
+  Radius r = {radius}
+  Central angle θ = {arc_angle} {arc_unit.lower()}
+  {'  → θ in radians = ' + str(arc_angle) + '° × (π/180) = ' + format_number(theta_rad) + ' rad' if arc_unit == 'Degrees' else ''}
+
+Step 1: Calculate Arc Length
+  Formula: s = rθ (θ must be in radians)
+  s = {r} × {format_number(theta_rad)}
+  s = {format_number(arc_length)} units
+
+Step 2: Calculate Sector Area
+  Formula: A = ½r²θ (θ must be in radians)
+  A = ½ × {r}² × {format_number(theta_rad)}
+  A = ½ × {format_number(r * r)} × {format_number(theta_rad)}
+  A = {format_number(sector_area)} square units
+
+Step 3: Comparison with full circle
+  Full circumference = 2πr = 2π × {r} = {format_number(circumference)}
+  Arc is {format_number(arc_length / circumference * 100)}% of circumference
+  
+  Full area = πr² = π × {r}² = {format_number(circle_area)}
+  Sector is {format_number(sector_area / circle_area * 100)}% of circle"""
+                    st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+    else:  # Linear & Angular Speed
+        st.markdown('<div class="section-header">⟳ Linear & Angular Speed</div>', unsafe_allow_html=True)
+        st.info("Enter any two values to solve for the third (v = rω)")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            speed_radius = st.text_input("Radius (r)", placeholder="e.g., 2", key="speed_r")
+            speed_r_unit = st.selectbox("Unit", ["meters", "cm", "feet"], key="speed_r_unit")
+
+        with col2:
+            speed_omega = st.text_input("Angular Speed (ω)", placeholder="e.g., 3", key="speed_omega")
+            speed_w_unit = st.selectbox("Unit", ["rad/s", "rpm", "deg/s"], key="speed_w_unit")
+
+        with col3:
+            speed_linear = st.text_input("Linear Speed (v)", placeholder="e.g., 6", key="speed_v")
+            speed_v_unit = st.selectbox("Unit", ["m/s", "km/h", "mph"], key="speed_v_unit")
+
+        if st.button("Calculate", key="calc_speed"):
+            r = parse_number(speed_radius) if speed_radius else float('nan')
+            w = parse_number(speed_omega) if speed_omega else float('nan')
+            v = parse_number(speed_linear) if speed_linear else float('nan')
+
+            try:
+                result = engine.linear_angular_speed(r, w, v, speed_r_unit, speed_w_unit, speed_v_unit)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                r, w, v = result['r'], result['w'], result['v']
+                solved = result['solved']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Radius", f"{format_number(r)} {speed_r_unit}")
+                with col2:
+                    st.metric("Angular Speed", f"{format_number(w)} {speed_w_unit}")
+                with col3:
+                    st.metric("Linear Speed", f"{format_number(v)} {speed_v_unit}")
+                st.success(f"Solved for: {solved}")
+                st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,52 @@
+"""State shared by every calculator page.
+
+This module is imported once per process, so the cached engine wrappers
+below are built once (on first use) rather than on every rerun.
+"""
+
+import importlib
+import os
+
+import streamlit as st
+
+import trigcalc
+
+# Results are cached per distinct parsed input, so "0.5" and "1/2" share an
+# entry and toggling settings with the same inputs skips the computation
+CACHE_TTL = int(os.environ.get("TRIGCALC_CACHE_TTL", 3600))  # seconds
+CACHE_MAX_ENTRIES = int(os.environ.get("TRIGCALC_CACHE_MAX_ENTRIES", 1000))
+
+CACHED_FUNCTIONS = [
+    "convert_angle", "arc_sector", "linear_angular_speed",
+    "solve_right_triangle", "solve_oblique",
+    "parse_sinusoid", "build_sinusoid", "sinusoid_model",
+    "vector_operation", "vector_properties",
+    "rect_to_polar", "polar_to_rect", "complex_operation", "de_moivre",
+    "parametric_point", "projectile", "shm",
+    # NumPy-based helpers live in submodules and are named "module.function"
+    "batch.projectile_sweep", "curves.curve_points", "oscillators.shm_chart_points",
+    "trajectories.trajectory_path", "trajectories.optimal_angle",
+]
+
+
+class _Engine:
+    """Cached wrappers of CACHED_FUNCTIONS, each built on first use.
+
+    Submodules are imported only when a page first calls one of their
+    functions, so loading this module does not import NumPy code.
+    """
+
+    _names = {name.rpartition(".")[2]: name for name in CACHED_FUNCTIONS}
+
+    def __getattr__(self, attr):
+        if attr not in self._names:
+            raise AttributeError(attr)
+        module = self._names[attr].rpartition(".")[0]
+        source = importlib.import_module(f"trigcalc.{module}") if module else trigcalc
+        func = st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES,
+                             show_spinner=False)(getattr(source, attr))
+        setattr(self, attr, func)
+        return func
+
+
+engine = _Engine()
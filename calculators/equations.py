@@ -0,0 +1,232 @@
+"""Trig Equations: basic and inverse functions and solving f(θ) = k."""
+
+import math
+import time
+
+import numpy as np
+import streamlit as st
+
+from trigcalc import parse_number, to_radians, to_degrees, format_number
+from trigcalc.batch import ERROR_MESSAGES, solve_equation_batch, trig_functions_batch
+from trigcalc.curves import MAX_SAMPLES
+from trigcalc.functions import TRIG_FUNCTIONS
+from trigcalc.solver import solve_equation
+from trigcalc.tables import DEFAULT_RESOLUTION, max_error
+import trigcalc
+
+
+def render_bulk(func_name, use_radians):
+    """Evaluate trig functions over an evenly stepped range of angles."""
+    unit = "rad" if use_radians else "°"
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        bulk_start = st.text_input(f"From ({unit})", value="0", key="bulk_start")
+    with col2:
+        bulk_stop = st.text_input(f"To ({unit})", value="2π" if use_radians else "360", key="bulk_stop")
+    with col3:
+        bulk_step = st.text_input(f"Step ({unit})", value="π/180" if use_radians else "0.1", key="bulk_step")
+    use_table = st.checkbox(f"Lookup table ({DEFAULT_RESOLUTION}° resolution)", key="bulk_table",
+                            help="Memory-mapped sin/cos tables with interpolation; "
+                                 f"max error {max_error(DEFAULT_RESOLUTION):.1e}.")
+    functions = st.multiselect("Functions", TRIG_FUNCTIONS, default=[func_name],
+                               key="bulk_functions")
+
+    if st.button("Evaluate Range", key="calc_bulk"):
+        start, stop, step = (parse_number(v) for v in (bulk_start, bulk_stop, bulk_step))
+        if any(math.isnan(v) for v in (start, stop, step)) or step <= 0 or stop < start:
+            st.error("Enter a range with from ≤ to and a positive step.")
+            return
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        if count > MAX_SAMPLES:
+            st.error(f"At most {MAX_SAMPLES:,} angles at once.")
+            return
+        if not functions:
+            st.error("Choose at least one function.")
+            return
+
+        began = time.perf_counter()
+        angles = start + np.arange(count) * step
+        table = trig_functions_batch(angles, degrees=not use_radians, functions=functions,
+                                     method='table' if use_table else 'numpy')
+        elapsed = time.perf_counter() - began
+
+        columns = {f"θ ({unit})": angles}
+        for j, name in enumerate(table['functions']):
+            columns[f"{name}(θ)"] = table['values'][:, j]
+        st.dataframe(columns, hide_index=True)
+        st.caption(f"{count:,} angles in {elapsed * 1e3:.1f} ms"
+                   + (" from the lookup table" if use_table else "") + "; empty cells are undefined.")
+
+
+def render_interval_solutions(func_name, k, lo, hi, use_radians):
+    """List every solution of f(θ) = k in [lo, hi)."""
+    lo, hi = parse_number(lo), parse_number(hi)
+    try:
+        solved = solve_equation_batch(func_name, [k], lo, hi, degrees=not use_radians)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    if solved['error'][0]:
+        st.error(ERROR_MESSAGES[int(solved['error'][0])])
+        return
+    render_solution_list(solved['values'], lo, hi, use_radians)
+
+
+def render_solution_list(values, lo, hi, use_radians):
+    """The solutions found in [lo, hi), or their count and range if there are many."""
+    unit = " rad" if use_radians else "°"
+    interval = f"[{format_number(lo)}{unit}, {format_number(hi)}{unit})"
+    if not len(values):
+        st.info(f"No solutions in {interval}.")
+    elif len(values) > 50:
+        st.markdown(f"**{len(values):,} solutions in {interval}**, from "
+                    f"{format_number(values[0])}{unit} to {format_number(values[-1])}{unit}")
+    else:
+        st.markdown(f"**Solutions in {interval}:** "
+                    + ", ".join(f"{format_number(v)}{unit}" for v in values))
+
+
+def render_general_solutions(equation, lo, hi, use_radians):
+    """Solve any equation in θ over [lo, hi), exactly where it reduces and numerically otherwise."""
+    lo, hi = parse_number(lo), parse_number(hi)
+    try:
+        solved = solve_equation(equation, lo, hi, degrees=not use_radians)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    unit = " rad" if use_radians else "°"
+    if solved['families']:
+        st.markdown('<div class="result-box">', unsafe_allow_html=True)
+        st.markdown("**Solutions:**")
+        for base, period in solved['families']:
+            st.markdown(f"θ = {format_number(base)}{unit} + {format_number(period)}{unit}·n")
+        st.markdown("where n is any integer")
+        st.markdown('</div>', unsafe_allow_html=True)
+    render_solution_list(solved['solutions'], lo, hi, use_radians)
+    st.caption(("Solved exactly: " if solved['method'] == 'exact' else "Solved numerically: ")
+               + solved['reduction'])
+
+
+def render(use_radians, show_steps):
+    """Render the Trig Equations calculator."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="section-header">Basic Trig Functions</div>', unsafe_allow_html=True)
+
+        basic_func = st.selectbox("Function", ["sin(θ)", "cos(θ)", "tan(θ)", "csc(θ)", "sec(θ)", "cot(θ)"], key="adv_basic_func")
+        basic_angle = st.text_input("Angle (θ)", placeholder="Enter angle", key="adv_basic_angle")
+
+        if st.button("Calculate", key="calc_basic_adv"):
+            if basic_angle:
+                try:
+                    angle_val = parse_number(basic_angle)
+
+                    if math.isnan(angle_val):
+                        st.error("Invalid angle.")
+                    else:
+                        angle_rad = angle_val if use_radians else to_radians(angle_val)
+                        func_name = basic_func.split('(')[0]
+
+                        try:
+                            result = trigcalc.evaluate_trig(func_name, angle_rad)
+                        except ValueError as e:
+                            st.error(str(e))
+                            result = None
+
+                        if result is not None:
+                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                            st.metric("Result", format_number(result, 10))
+                            st.markdown('</div>', unsafe_allow_html=True)
+
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+
+        with st.expander("Evaluate a range of angles"):
+            render_bulk(basic_func.split('(')[0], use_radians)
+
+    with col2:
+        st.markdown('<div class="section-header">Inverse Trig Functions</div>', unsafe_allow_html=True)
+
+        inv_func = st.selectbox("Function", ["arcsin(x)", "arccos(x)", "arctan(x)", "arccsc(x)", "arcsec(x)", "arccot(x)"], key="adv_inv_func")
+        inv_value = st.text_input("Value (x)", placeholder="Enter value", key="adv_inv_value")
+
+        if st.button("Calculate", key="calc_inv_adv"):
+            if inv_value:
+                try:
+                    x = parse_number(inv_value)
+
+                    if math.isnan(x):
+                        st.error("Invalid value.")
+                    else:
+                        func_name = inv_func.split('(')[0]
+                        try:
+                            result = trigcalc.evaluate_inverse(func_name, x)
+                        except ValueError as e:
+                            st.error(str(e))
+                            result = None
+
+                        if result is not None:
+                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                            if use_radians:
+                                st.metric("Result", f"{format_number(result)} rad")
+                            else:
+                                st.metric("Result", f"{format_number(to_degrees(result))}°")
+                            st.markdown('</div>', unsafe_allow_html=True)
+
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+
+    st.markdown("---")
+    st.markdown('<div class="section-header">Solve Trig Equation</div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        eq_type = st.selectbox(
+            "Equation Type",
+            ["sin(θ) = k", "cos(θ) = k", "tan(θ) = k", "General equation"],
+            key="eq_type"
+        )
+    general = eq_type == "General equation"
+    with col2:
+        if general:
+            eq_text = st.text_input("Equation in θ", placeholder="e.g., 2sin²θ − sinθ − 1 = 0",
+                                    key="eq_text")
+        else:
+            eq_k = st.text_input("Value of k", placeholder="e.g., 0.5", key="eq_k")
+    unit = "rad" if use_radians else "°"
+    col1, col2 = st.columns(2)
+    with col1:
+        eq_lo = st.text_input(f"Solutions from ({unit})", value="0", key="eq_lo")
+    with col2:
+        eq_hi = st.text_input(f"To, excluded ({unit})", value="2π" if use_radians else "360",
+                              key="eq_hi")
+
+    if st.button("Solve", key="solve_eq"):
+        if general:
+            if eq_text:
+                render_general_solutions(eq_text, eq_lo, eq_hi, use_radians)
+        elif eq_k:
+            try:
+                k = parse_number(eq_k)
+
+                if math.isnan(k):
+                    st.error("Invalid value.")
+                else:
+                    func_name = eq_type.split('(')[0]
+                    try:
+                        solution = trigcalc.solve_basic_equation(func_name, k)
+                    except ValueError as e:
+                        st.error(str(e))
+                    else:
+                        sign = "±" if solution['plus_minus'] else ""
+                        st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                        st.markdown(f"**Solutions:**")
+                        for base, period in solution['solutions']:
+                            st.markdown(f"θ = {sign}{format_number(base)}° + {period}°n")
+                        st.markdown("where n is any integer")
+                        st.markdown('</div>', unsafe_allow_html=True)
+                        render_interval_solutions(func_name, k, eq_lo, eq_hi, use_radians)
+
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
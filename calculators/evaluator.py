@@ -0,0 +1,209 @@
+"""Trig Evaluator: the six functions, inverse functions and compositions."""
+
+import math
+
+import streamlit as st
+
+from trigcalc import (
+    parse_number, to_radians, to_degrees, format_number, format_radians,
+    get_quadrant, get_reference_angle, get_exact_value,
+)
+import trigcalc
+
+from .plots import angle_window, render_inverse_graph, render_sinusoid_graph, render_unit_circle
+
+
+def render(use_radians, show_steps):
+    """Render the Trig Evaluator calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Basic Functions", "Inverse Functions", "Compositions"],
+        horizontal=True,
+        key="eval_section"
+    )
+
+    if section == "Basic Functions":
+        st.markdown('<div class="section-header">📊 Evaluate Trig Functions</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            trig_func = st.selectbox("Function", ["sin", "cos", "tan", "csc", "sec", "cot"], key="trig_func")
+        with col2:
+            angle_label = "radians" if use_radians else "degrees"
+            trig_angle = st.text_input(f"Angle ({angle_label})", placeholder="e.g., 45 or π/4", key="trig_angle")
+
+        if st.button("Evaluate", key="eval_trig"):
+            if trig_angle:
+                try:
+                    angle_val = parse_number(trig_angle)
+
+                    if math.isnan(angle_val):
+                        st.error("Invalid angle input.")
+                    else:
+                        # Convert to degrees for calculations
+                        if use_radians:
+                            degrees = to_degrees(angle_val)
+                        else:
+                            degrees = angle_val
+
+                        radians = to_radians(degrees)
+
+                        # Calculate value
+                        try:
+                            value = trigcalc.evaluate_trig(trig_func, radians)
+                        except ValueError as e:
+                            st.error(str(e))
+                            value = None
+
+                        if value is not None:
+                            exact = get_exact_value(degrees, trig_func)
+                            quadrant = get_quadrant(degrees)
+                            ref_angle = get_reference_angle(degrees)
+
+                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                if exact:
+                                    st.metric(f"{trig_func}({format_number(degrees)}°)", exact)
+                                st.metric("Decimal Value", format_number(value, 10))
+                            with col2:
+                                st.metric("Quadrant", quadrant)
+                                st.metric("Reference Angle", f"{format_number(ref_angle)}°")
+
+                            st.markdown('</div>', unsafe_allow_html=True)
+                            render_unit_circle(radians, f"θ = {trig_angle}")
+
+                            if show_steps:
+                                steps = f"""Evaluating {trig_func}({trig_angle})
+
+Step 1: Convert to degrees
+  θ = {format_number(degrees)}°
+
+Step 2: Find reference angle
+  Quadrant: {quadrant}
+  Reference angle: {format_number(ref_angle)}°
+
+Step 3: Evaluate
+  {trig_func}({format_number(degrees)}°) = {exact if exact else format_number(value, 10)}
+  ≈ {format_number(value, 10)}"""
+                                st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+
+        if st.toggle("Graph", key="trig_graph"):
+            lo, hi = angle_window("trig_window", use_radians)
+            angle_val = parse_number(trig_angle)
+            point = None
+            if not math.isnan(angle_val):
+                try:
+                    radians = angle_val if use_radians else to_radians(angle_val)
+                    point = (angle_val, trigcalc.evaluate_trig(trig_func, radians))
+                except ValueError:
+                    pass
+            render_sinusoid_graph(trig_func, lo, hi, B=1.0 if use_radians else math.pi / 180,
+                                  x_title=f"θ ({'rad' if use_radians else '°'})", point=point)
+
+    elif section == "Inverse Functions":
+        st.markdown('<div class="section-header">🔄 Inverse Trig Functions</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            inv_func = st.selectbox("Function", ["arcsin", "arccos", "arctan", "arccsc", "arcsec", "arccot"], key="inv_func")
+        with col2:
+            inv_value = st.text_input("Value (x)", placeholder="e.g., 0.5", key="inv_value")
+
+        if st.button("Evaluate", key="eval_inv"):
+            if inv_value:
+                try:
+                    x = parse_number(inv_value)
+
+                    if math.isnan(x):
+                        st.error("Invalid input.")
+                    else:
+                        error = None
+                        try:
+                            result = trigcalc.evaluate_inverse(inv_func, x)
+                        except ValueError as e:
+                            error = str(e)
+
+                        if error:
+                            st.error(error)
+                        else:
+                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.metric("Radians", format_radians(result))
+                            with col2:
+                                st.metric("Degrees", f"{format_number(to_degrees(result))}°")
+
+                            st.markdown('</div>', unsafe_allow_html=True)
+
+                            if show_steps:
+                                steps = f"""Evaluating {inv_func}({x})
+
+Step 1: Check domain
+  {inv_func}(x) requires valid input ✓
+
+Step 2: Calculate result
+  θ = {inv_func}({x})
+  θ = {format_number(result)} radians
+  θ = {format_radians(result)}
+
+Step 3: Convert to degrees
+  θ = {format_number(result)} × (180/π)
+  θ = {format_number(to_degrees(result))}°"""
+                                st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+
+        if st.toggle("Graph", key="inv_graph"):
+            lo, hi = st.slider("Window (x)", -16.0, 16.0, (-4.0, 4.0), 0.25, key="inv_window")
+            x = parse_number(inv_value)
+            point = None
+            if not math.isnan(x):
+                try:
+                    point = (x, trigcalc.evaluate_inverse(inv_func, x))
+                except ValueError:
+                    pass
+            render_inverse_graph(inv_func, lo, hi, use_radians, point)
+
+    else:  # Compositions
+        st.markdown('<div class="section-header">🔗 Function Compositions</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            comp_type = st.selectbox(
+                "Composition Type",
+                ["sin(arccos(x))", "cos(arcsin(x))", "tan(arcsin(x))", "tan(arccos(x))", "sin(arctan(x))", "cos(arctan(x))"],
+                key="comp_type"
+            )
+        with col2:
+            comp_value = st.text_input("Value (x)", placeholder="e.g., 0.6", key="comp_value")
+
+        if st.button("Evaluate", key="eval_comp"):
+            if comp_value:
+                try:
+                    x = parse_number(comp_value)
+
+                    if math.isnan(x):
+                        st.error("Invalid input.")
+                    else:
+                        error = None
+                        try:
+                            result = trigcalc.evaluate_composition(comp_type, x)
+                        except ValueError as e:
+                            error = str(e)
+
+                        if error:
+                            st.error(error)
+                        else:
+                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                            st.metric(comp_type.replace("x", str(x)), format_number(result))
+                            st.markdown('</div>', unsafe_allow_html=True)
+
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
@@ -0,0 +1,37 @@
+"""Identity checker shown in the sidebar on every page."""
+
+import streamlit as st
+
+from trigcalc import format_number
+
+
+def render(use_radians, show_steps):
+    """Render the identity checker: are two expressions equal for every angle?"""
+    left = st.text_input("Left side", placeholder="e.g., tan²θ + 1", key="identity_left")
+    right = st.text_input("Right side", placeholder="e.g., sec²θ", key="identity_right")
+
+    if st.button("Check Identity", key="check_identity") and left and right:
+        # Imported on first use: the checker pulls in NumPy and the solver,
+        # and this sidebar renders on every page
+        from trigcalc.identities import verify_identity
+
+        try:
+            result = verify_identity(left, right, degrees=not use_radians)
+        except ValueError as e:
+            st.error(str(e))
+            return
+
+        if result['identical']:
+            how = ("shown algebraically" if result['method'] == 'symbolic'
+                   else f"equal at all {result['points']} test points")
+            st.success(f"✓ Identity ({how})")
+        else:
+            counter = result['counterexample']
+            unit = "" if use_radians else "°"
+            at = ", ".join(f"{name} = {format_number(value)}{unit}"
+                           for name, value in counter['values'].items())
+            st.error(f"Not an identity: at {at} the left side is {format_number(counter['left'])}"
+                     f" and the right side is {format_number(counter['right'])}.")
+        if show_steps:
+            st.markdown("**In sin and cos:**")
+            st.code(f"{result['left']}\n= {result['right']}", language=None)
@@ -0,0 +1,409 @@
+"""Parametric & Motion: parametric curves, projectile motion and simple harmonic motion."""
+
+import numpy as np
+import streamlit as st
+
+from trigcalc import parse_number, format_number
+from trigcalc.batch import PROJECTILE_AXES
+from trigcalc.curves import MAX_SAMPLES
+from trigcalc.oscillators import MAX_SERIES_SAMPLES
+from trigcalc.trajectories import DRAG_MODELS
+import trigcalc
+
+from .common import engine
+
+# Parametric curves are drawn in sample order, not sorted by x
+CURVE_CHART = {
+    "mark": {"type": "line", "clip": True},
+    "encoding": {
+        "x": {"field": "x", "type": "quantitative", "scale": {"zero": False}},
+        "y": {"field": "y", "type": "quantitative", "scale": {"zero": False}},
+        "order": {"field": "t", "type": "quantitative"},
+    },
+    "height": 400,
+}
+
+TRAJECTORY_CHART = {
+    "mark": "line",
+    "encoding": {
+        "x": {"field": "x", "type": "quantitative", "title": "x (m)"},
+        "y": {"field": "y", "type": "quantitative", "title": "height (m)"},
+        "order": {"field": "i", "type": "quantitative"},
+    },
+    "height": 300,
+}
+
+# Sweep axis -> (label, default from, default to, default points)
+SWEEP_PARAMETERS = {
+    'v0': ("v₀ (m/s)", "10", "100", 19),
+    'angle': ("Angle (°)", "5", "85", 17),
+    'h0': ("h₀ (m)", "0", "0", 1),
+    'g': ("g (m/s²)", "9.81", "9.81", 1),
+}
+
+SWEEP_METRICS = {"Range (m)": 'range', "Maximum Height (m)": 'max_height', "Time of Flight (s)": 'total_time'}
+
+HEATMAP_CHART = {
+    "mark": "rect",
+    "encoding": {
+        "x": {"field": "x", "type": "ordinal", "axis": {"labelOverlap": True}},
+        "y": {"field": "y", "type": "ordinal", "axis": {"labelOverlap": True}},
+        "color": {"field": "value", "type": "quantitative", "scale": {"scheme": "viridis"}},
+        "tooltip": [{"field": "x"}, {"field": "y"}, {"field": "value", "format": ".4~f"}],
+    },
+    "height": 400,
+}
+
+
+def render_projectile_sweep():
+    """Heatmap of range, height or flight time over a grid of launch parameters."""
+    st.caption("Each parameter runs from → to over the given number of points. "
+               "The grid is computed once per set of ranges and cached.")
+    ranges = {}
+    for name, (label, start, stop, points) in SWEEP_PARAMETERS.items():
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            low = st.text_input(f"{label} from", value=start, key=f"sweep_{name}_from")
+        with col2:
+            high = st.text_input(f"{label} to", value=stop, key=f"sweep_{name}_to")
+        with col3:
+            count = st.number_input(f"{label} points", min_value=1, max_value=200,
+                                    value=points, key=f"sweep_{name}_points")
+        ranges[name] = (parse_number(low), parse_number(high), int(count))
+
+    try:
+        sweep = engine.projectile_sweep(**ranges)
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    labels = {name: SWEEP_PARAMETERS[name][0] for name in PROJECTILE_AXES}
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        metric = st.selectbox("Show", list(SWEEP_METRICS), key="sweep_metric")
+    with col2:
+        x_axis = st.selectbox("x axis", PROJECTILE_AXES, index=1,
+                              format_func=labels.get, key="sweep_x")
+    with col3:
+        y_choices = [name for name in PROJECTILE_AXES if name != x_axis]
+        y_axis = st.selectbox("y axis", y_choices, format_func=labels.get, key="sweep_y")
+
+    # The other two parameters are held at one of their sweep values
+    index = []
+    for name in PROJECTILE_AXES:
+        if name in (x_axis, y_axis):
+            index.append(slice(None))
+        elif len(sweep[name]) == 1:
+            index.append(0)
+        else:
+            axis_values = sweep[name]
+            index.append(st.select_slider(labels[name], options=range(len(axis_values)),
+                                          format_func=lambda i: format_number(axis_values[i]),
+                                          key=f"sweep_{name}_at"))
+
+    values = sweep[SWEEP_METRICS[metric]][tuple(index)]
+    if PROJECTILE_AXES.index(x_axis) > PROJECTILE_AXES.index(y_axis):
+        values = values.T
+    xs = [format_number(v, 4) for v in sweep[x_axis]]
+    ys = [format_number(v, 4) for v in sweep[y_axis]]
+    chart = dict(HEATMAP_CHART, encoding=dict(
+        HEATMAP_CHART["encoding"],
+        x=dict(HEATMAP_CHART["encoding"]["x"], title=labels[x_axis], sort=xs),
+        y=dict(HEATMAP_CHART["encoding"]["y"], title=labels[y_axis], sort=ys[::-1]),
+        color=dict(HEATMAP_CHART["encoding"]["color"], title=metric),
+    ))
+    st.vega_lite_chart({
+        'x': [x for _ in ys for x in xs],
+        'y': [y for y in ys for _ in xs],
+        'value': values.T.ravel(),
+    }, chart, width="stretch")
+    if np.isnan(values).any():
+        st.caption("Blank cells never get back up to height 0.")
+
+
+def render(use_radians, show_steps):
+    """Render the Parametric & Motion calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Parametric Equations", "Projectile Motion", "Simple Harmonic Motion"],
+        horizontal=True,
+        key="motion_section"
+    )
+
+    if section == "Parametric Equations":
+        st.markdown('<div class="section-header">Parametric Equations</div>', unsafe_allow_html=True)
+
+        curve_type = st.selectbox(
+            "Curve Type",
+            ["Circle", "Ellipse", "Cycloid", "Lissajous"],
+            key="curve_type"
+        )
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            param_t = st.text_input("Parameter t", placeholder="e.g., π/4", key="param_t")
+
+            if curve_type == "Circle":
+                param_r = st.text_input("Radius r", placeholder="e.g., 5", key="param_r")
+            elif curve_type == "Ellipse":
+                param_a = st.text_input("Semi-major axis a", placeholder="e.g., 5", key="param_ea")
+                param_b = st.text_input("Semi-minor axis b", placeholder="e.g., 3", key="param_eb")
+            elif curve_type == "Cycloid":
+                param_r = st.text_input("Rolling radius r", placeholder="e.g., 5", key="param_cr")
+            else:
+                param_a = st.text_input("Amplitude a", placeholder="e.g., 5", key="param_la")
+                param_b = st.text_input("Amplitude b", placeholder="e.g., 3", key="param_lb")
+                param_p = st.text_input("Frequency p", placeholder="e.g., 3", key="param_lp")
+                param_q = st.text_input("Frequency q", placeholder="e.g., 2", key="param_lq")
+                param_d = st.text_input("Phase δ (rad)", placeholder="e.g., π/2", key="param_ld")
+
+        with col2:
+            plot_start = st.text_input("Plot from t =", value="0", key="plot_t_start")
+            plot_stop = st.text_input("Plot to t =", value="2π", key="plot_t_stop")
+            plot_samples = st.number_input("Samples", min_value=2, max_value=MAX_SAMPLES,
+                                           value=10_000, step=10_000, key="plot_samples")
+
+        if curve_type in ("Ellipse", "Lissajous"):
+            params = {'a': parse_number(param_a) if param_a else 5,
+                      'b': parse_number(param_b) if param_b else 3}
+        else:
+            params = {'r': parse_number(param_r) if param_r else 5}
+        if curve_type == "Lissajous":
+            params.update(p=parse_number(param_p) if param_p else 3,
+                          q=parse_number(param_q) if param_q else 2,
+                          delta=parse_number(param_d) if param_d else trigcalc.PI / 2)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            calc_point = st.button("Calculate Point", key="calc_param")
+        with col2:
+            plot_curve = st.button("Plot Curve", key="plot_param")
+
+        if calc_point:
+            t = parse_number(param_t)
+
+            try:
+                x, y = engine.parametric_point(curve_type, t, **params)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.info(f"Equations: {trigcalc.PARAMETRIC_EQUATIONS[curve_type]}")
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("x(t)", format_number(x))
+                with col2:
+                    st.metric("y(t)", format_number(y))
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        if plot_curve:
+            try:
+                points = engine.curve_points(curve_type, parse_number(plot_start),
+                                             parse_number(plot_stop), int(plot_samples), **params)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.info(f"Equations: {trigcalc.PARAMETRIC_EQUATIONS[curve_type]}")
+                # Only the downsampled points are sent to the browser
+                st.vega_lite_chart({'t': points['t'], 'x': points['x'], 'y': points['y']},
+                                   CURVE_CHART, width="stretch")
+                st.caption(f"{points['samples']:,} samples computed, {len(points['t']):,} drawn")
+
+    elif section == "Projectile Motion":
+        st.markdown('<div class="section-header">Projectile Motion</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            proj_v0 = st.text_input("Initial Velocity (m/s)", placeholder="e.g., 50", key="proj_v0")
+            proj_angle = st.text_input("Launch Angle (degrees)", placeholder="e.g., 45", key="proj_angle")
+        with col2:
+            proj_h0 = st.text_input("Initial Height (m)", placeholder="e.g., 0", value="0", key="proj_h0")
+            proj_g = st.text_input("Gravity (m/s²)", placeholder="e.g., 9.81", value="9.81", key="proj_g")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            drag_model = st.selectbox("Air Resistance (trajectory)", DRAG_MODELS,
+                                      format_func=str.capitalize, key="proj_drag_model")
+        with col2:
+            proj_drag = st.text_input("Drag Coefficient k", placeholder="e.g., 0.01",
+                                      value="0.01", key="proj_drag",
+                                      help="Per unit mass: a = -k·v (linear) or -k·|v|·v (quadratic)")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            analyze = st.button("Analyze Projectile", key="calc_proj")
+        with col2:
+            simulate = st.button("Simulate Trajectory", key="sim_proj")
+
+        if analyze:
+            v0 = parse_number(proj_v0)
+            angle = parse_number(proj_angle)
+            h0 = parse_number(proj_h0)
+            g = parse_number(proj_g)
+
+            try:
+                result = engine.projectile(v0, angle, h0, g)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                v0x, v0y = result['v0x'], result['v0y']
+                t_max = result['t_max']
+                max_height = result['max_height']
+                total_time = result['total_time']
+                range_dist = result['range']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Maximum Height", f"{format_number(max_height)} m")
+                    st.metric("Horizontal Velocity", f"{format_number(v0x)} m/s")
+                with col2:
+                    st.metric("Range", f"{format_number(range_dist)} m")
+                    st.metric("Vertical Velocity", f"{format_number(v0y)} m/s")
+                with col3:
+                    st.metric("Time of Flight", f"{format_number(total_time)} s")
+                    st.metric("Time to Max Height", f"{format_number(t_max)} s")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                if show_steps:
+                    steps = f"""Projectile Motion Analysis
+
+Given:
+  Initial velocity v₀ = {v0} m/s
+  Launch angle θ = {angle}°
+  Initial height h₀ = {h0} m
+  Gravity g = {g} m/s²
+
+Step 1: Calculate velocity components
+  v₀ₓ = v₀ × cos(θ) = {v0} × cos({angle}°) = {format_number(v0x)} m/s
+  v₀ᵧ = v₀ × sin(θ) = {v0} × sin({angle}°) = {format_number(v0y)} m/s
+
+Step 2: Calculate time to maximum height
+  t_max = v₀ᵧ/g = {format_number(v0y)}/{g} = {format_number(t_max)} s
+
+Step 3: Calculate maximum height
+  H_max = h₀ + v₀ᵧ²/(2g) = {h0} + {format_number(v0y*v0y/(2*g))} = {format_number(max_height)} m
+
+Step 4: Calculate total time of flight
+  t = (v₀ᵧ + √(v₀ᵧ² + 2gh₀))/g = {format_number(total_time)} s
+
+Step 5: Calculate range
+  R = v₀ₓ × t = {format_number(v0x)} × {format_number(total_time)} = {format_number(range_dist)} m"""
+                    st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+        if simulate:
+            v0 = parse_number(proj_v0)
+            angle = parse_number(proj_angle)
+            h0 = parse_number(proj_h0)
+            g = parse_number(proj_g)
+            k = parse_number(proj_drag) if drag_model != "none" else 0.0
+
+            try:
+                path = engine.trajectory_path(v0, angle, h0, g, k, drag_model)
+                best = engine.optimal_angle(v0, h0, g, k, drag_model)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if not path['landed']:
+                    st.warning("The projectile does not come back down to y = 0.")
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Range", f"{format_number(path['range'])} m")
+                    st.metric("Maximum Height", f"{format_number(path['max_height'])} m")
+                with col2:
+                    st.metric("Time of Flight", f"{format_number(path['flight_time'])} s")
+                with col3:
+                    st.metric("Optimal Angle", f"{format_number(best['angle'], 2)}°")
+                    st.metric("Best Range", f"{format_number(best['range'])} m")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                st.vega_lite_chart({'x': path['x'], 'y': path['y'], 'i': range(len(path['x']))},
+                                   TRAJECTORY_CHART, width="stretch")
+                st.line_chart({'angle (°)': best['angles'], 'range (m)': best['ranges']},
+                              x='angle (°)', y='range (m)')
+
+        if st.toggle("Parameter sweep", key="proj_sweep"):
+            render_projectile_sweep()
+
+    else:  # Simple Harmonic Motion
+        st.markdown('<div class="section-header">Simple Harmonic Motion</div>', unsafe_allow_html=True)
+        st.info("Equation: x(t) = A·cos(ωt + φ)")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            shm_A = st.text_input("Amplitude A", placeholder="e.g., 5", key="shm_A")
+            shm_omega = st.text_input("Angular Frequency ω (rad/s)", placeholder="e.g., 2", key="shm_omega")
+        with col2:
+            shm_phi = st.text_input("Initial Phase φ (rad)", placeholder="e.g., 0", value="0", key="shm_phi")
+            shm_t = st.text_input("Time t (s)", placeholder="e.g., 1", key="shm_t")
+
+        st.markdown("**Time series** (optionally damped and driven: x'' + 2γx' + ω²x = F·cos(ω_d·t))")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            shm_damping = st.text_input("Damping γ (1/s)", value="0", key="shm_damping")
+            shm_t_start = st.text_input("From t =", value="0", key="shm_t_start")
+        with col2:
+            shm_drive = st.text_input("Driving force F (per unit mass)", value="0", key="shm_drive")
+            shm_t_stop = st.text_input("To t =", value="20", key="shm_t_stop")
+        with col3:
+            shm_drive_omega = st.text_input("Driving frequency ω_d (rad/s)", value="0", key="shm_drive_omega")
+            shm_samples = st.number_input("Samples", min_value=2, max_value=MAX_SERIES_SAMPLES,
+                                          value=100_000, step=100_000, key="shm_samples")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            calculate = st.button("Calculate", key="calc_shm")
+        with col2:
+            plot_series = st.button("Plot Time Series", key="plot_shm")
+
+        if plot_series:
+            try:
+                series = engine.shm_chart_points(
+                    parse_number(shm_t_start), parse_number(shm_t_stop), int(shm_samples),
+                    A=parse_number(shm_A), omega=parse_number(shm_omega), phi=parse_number(shm_phi),
+                    damping=parse_number(shm_damping), drive=parse_number(shm_drive),
+                    drive_omega=parse_number(shm_drive_omega))
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.line_chart({'t (s)': series['t'], 'x(t)': series['x'], 'v(t)': series['v'],
+                               'a(t)': series['a']}, x='t (s)', y=['x(t)', 'v(t)', 'a(t)'])
+                st.caption(f"{series['samples']:,} samples computed in chunks, {len(series['t']):,} drawn")
+
+        if calculate:
+            A = parse_number(shm_A)
+            omega = parse_number(shm_omega)
+            phi = parse_number(shm_phi)
+            t = parse_number(shm_t)
+
+            try:
+                result = engine.shm(A, omega, phi, t)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                position = result['position']
+                velocity = result['velocity']
+                acceleration = result['acceleration']
+                period = result['period']
+                frequency = result['frequency']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Position x(t)", format_number(position))
+                    st.metric("Period T", f"{format_number(period)} s")
+                with col2:
+                    st.metric("Velocity v(t)", format_number(velocity))
+                    st.metric("Frequency f", f"{format_number(frequency)} Hz")
+                with col3:
+                    st.metric("Acceleration a(t)", format_number(acceleration))
+                    st.metric("Max Velocity", format_number(result['max_velocity']))
+
+                st.markdown('</div>', unsafe_allow_html=True)
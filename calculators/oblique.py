@@ -0,0 +1,212 @@
+"""Oblique Triangles: law of sines/cosines solver and area calculator."""
+
+import math
+
+import streamlit as st
+
+from trigcalc import parse_number, to_radians, format_number
+import trigcalc
+
+from .common import engine
+
+
+def render(use_radians, show_steps):
+    """Render the Oblique Triangles calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Triangle Solver", "Area Calculator"],
+        horizontal=True,
+        key="oblique_section"
+    )
+
+    if section == "Triangle Solver":
+        st.markdown('<div class="section-header">📐 Oblique Triangle Solver</div>', unsafe_allow_html=True)
+
+        case = st.selectbox(
+            "Select Case",
+            ["AAS (Angle-Angle-Side)", "ASA (Angle-Side-Angle)", "SSA (Side-Side-Angle)", "SAS (Side-Angle-Side)", "SSS (Side-Side-Side)"],
+            key="oblique_case"
+        )
+
+        case_type = case.split()[0]
+
+        if case_type == "AAS":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                obl_A = st.text_input("Angle A (degrees)", key="obl_A_aas")
+            with col2:
+                obl_B = st.text_input("Angle B (degrees)", key="obl_B_aas")
+            with col3:
+                obl_a = st.text_input("Side a (opposite A)", key="obl_a_aas")
+
+        elif case_type == "ASA":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                obl_A = st.text_input("Angle A (degrees)", key="obl_A_asa")
+            with col2:
+                obl_c = st.text_input("Side c (between A and B)", key="obl_c_asa")
+            with col3:
+                obl_B = st.text_input("Angle B (degrees)", key="obl_B_asa")
+
+        elif case_type == "SSA":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                obl_a = st.text_input("Side a", key="obl_a_ssa")
+            with col2:
+                obl_b = st.text_input("Side b", key="obl_b_ssa")
+            with col3:
+                obl_A = st.text_input("Angle A (opposite a, degrees)", key="obl_A_ssa")
+
+        elif case_type == "SAS":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                obl_a = st.text_input("Side a", key="obl_a_sas")
+            with col2:
+                obl_C = st.text_input("Angle C (between a and b, degrees)", key="obl_C_sas")
+            with col3:
+                obl_b = st.text_input("Side b", key="obl_b_sas")
+
+        else:  # SSS
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                obl_a = st.text_input("Side a", key="obl_a_sss")
+            with col2:
+                obl_b = st.text_input("Side b", key="obl_b_sss")
+            with col3:
+                obl_c = st.text_input("Side c", key="obl_c_sss")
+
+        if st.button("Solve Triangle", key="solve_oblique"):
+            if case_type == "AAS":
+                known = {'A': obl_A, 'B': obl_B, 'a': obl_a}
+            elif case_type == "ASA":
+                known = {'A': obl_A, 'B': obl_B, 'c': obl_c}
+            elif case_type == "SSA":
+                known = {'a': obl_a, 'b': obl_b, 'A': obl_A}
+            elif case_type == "SAS":
+                known = {'a': obl_a, 'b': obl_b, 'C': obl_C}
+            else:  # SSS
+                known = {'a': obl_a, 'b': obl_b, 'c': obl_c}
+
+            try:
+                result = engine.solve_oblique(case_type, **{k: parse_number(v) for k, v in known.items()})
+            except ValueError as e:
+                st.error(str(e))
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+            else:
+                a, b, c = result['a'], result['b'], result['c']
+                A, B, C = result['A'], result['B'], result['C']
+                area = result['area']
+
+                if result['second']:
+                    second = result['second']
+                    st.warning(f"⚠️ Ambiguous case: Second solution exists with B = {format_number(second['B'])}°, C = {format_number(second['C'])}°, c = {format_number(second['c'])}, Area = {format_number(second['area'])}")
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Side a", format_number(a))
+                    st.metric("Angle A", f"{format_number(A)}°")
+                with col2:
+                    st.metric("Side b", format_number(b))
+                    st.metric("Angle B", f"{format_number(B)}°")
+                with col3:
+                    st.metric("Side c", format_number(c))
+                    st.metric("Angle C", f"{format_number(C)}°")
+
+                st.metric("Area", f"{format_number(area)} sq units")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    else:  # Area Calculator
+        st.markdown('<div class="section-header">📏 Area Calculator</div>', unsafe_allow_html=True)
+
+        area_method = st.selectbox(
+            "Method",
+            ["Two Sides and Included Angle (SAS)", "Heron's Formula (SSS)"],
+            key="area_method"
+        )
+
+        if "SAS" in area_method:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                area_a = st.text_input("Side a", key="area_a_sas")
+            with col2:
+                area_b = st.text_input("Side b", key="area_b_sas")
+            with col3:
+                area_C = st.text_input("Included Angle C (degrees)", key="area_C_sas")
+
+            if st.button("Calculate Area", key="calc_area_sas"):
+                a = parse_number(area_a)
+                b = parse_number(area_b)
+                C = parse_number(area_C)
+
+                try:
+                    area = trigcalc.area_sas(a, b, C)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("Area", f"{format_number(area)} sq units")
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    if show_steps:
+                        steps = f"""Area using SAS Formula
+
+Given:
+  Side a = {a}
+  Side b = {b}
+  Angle C = {C}°
+
+Formula: Area = ½ × a × b × sin(C)
+
+Calculation:
+  Area = ½ × {a} × {b} × sin({C}°)
+  Area = ½ × {a} × {b} × {format_number(math.sin(to_radians(C)))}
+  Area = {format_number(area)} square units"""
+                        st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+        else:  # Heron's Formula
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                area_a = st.text_input("Side a", key="area_a_sss")
+            with col2:
+                area_b = st.text_input("Side b", key="area_b_sss")
+            with col3:
+                area_c = st.text_input("Side c", key="area_c_sss")
+
+            if st.button("Calculate Area", key="calc_area_sss"):
+                a = parse_number(area_a)
+                b = parse_number(area_b)
+                c = parse_number(area_c)
+
+                try:
+                    area, s = trigcalc.area_sss(a, b, c)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("Area", f"{format_number(area)} sq units")
+                    st.metric("Semi-perimeter (s)", format_number(s))
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    if show_steps:
+                        steps = f"""Area using Heron's Formula
+
+Given:
+  Side a = {a}
+  Side b = {b}
+  Side c = {c}
+
+Step 1: Calculate semi-perimeter
+  s = (a + b + c) / 2
+  s = ({a} + {b} + {c}) / 2
+  s = {format_number(s)}
+
+Step 2: Apply Heron's formula
+  Area = √(s(s-a)(s-b)(s-c))
+  Area = √({format_number(s)} × {format_number(s-a)} × {format_number(s-b)} × {format_number(s-c)})
+  Area = √{format_number(s * (s-a) * (s-b) * (s-c))}
+  Area = {format_number(area)} square units"""
+                        st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
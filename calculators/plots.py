@@ -0,0 +1,96 @@
+"""Function graphs and the unit circle, shared by the Trig Evaluator and Sinusoids pages.
+
+Samples come from the process-wide buffers in ``trigcalc.graphs`` as
+float32 arrays, which Streamlit sends to the chart as Arrow, not JSON.
+Scroll to zoom and drag to pan within the chart; the window slider asks
+for a new window from the buffers.
+"""
+
+import math
+
+import streamlit as st
+
+from trigcalc import format_number
+from trigcalc.graphs import inverse_window, sinusoid_window, unit_circle
+
+GRAPH_CHART = {
+    "mark": {"type": "line", "invalid": "break-paths-show-domains", "clip": True},
+    "encoding": {
+        "x": {"field": "x", "type": "quantitative"},
+        "y": {"field": "y", "type": "quantitative"},
+    },
+    "params": [{"name": "view", "select": "interval", "bind": "scales"}],
+}
+
+
+def _chart(x, y, x_title, y_title, point=None):
+    spec = {
+        "layer": [{**GRAPH_CHART, "encoding": {
+            "x": {**GRAPH_CHART["encoding"]["x"], "title": x_title},
+            "y": {**GRAPH_CHART["encoding"]["y"], "title": y_title},
+        }}],
+    }
+    if point is not None and all(math.isfinite(v) for v in point):
+        spec["layer"].append({
+            "data": {"values": [{"x": point[0], "y": point[1]}]},
+            "mark": {"type": "point", "filled": True, "size": 80, "color": "#e4572e"},
+            "encoding": {"x": {"field": "x", "type": "quantitative"},
+                         "y": {"field": "y", "type": "quantitative"}},
+        })
+    st.vega_lite_chart({'x': x, 'y': y}, spec, width="stretch")
+
+
+def angle_window(key, use_radians):
+    """Slider for an angle window; returns (lo, hi) in the current angle unit."""
+    if use_radians:
+        lo, hi = st.slider("Window (× π)", -8.0, 8.0, (-2.0, 2.0), 0.25, key=f"{key}_rad")
+        return lo * math.pi, hi * math.pi
+    return st.slider("Window (°)", -1440, 1440, (-360, 360), 15, key=f"{key}_deg")
+
+
+def render_sinusoid_graph(func, lo, hi, A=1.0, B=1.0, C=0.0, D=0.0, x_title="x", point=None):
+    """Graph y = A·f(B(x - C)) + D over [lo, hi]."""
+    try:
+        graph = sinusoid_window(func, lo, hi, A, B, C, D)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    _chart(graph['x'], graph['y'], x_title, "y", point)
+
+
+def render_inverse_graph(func, lo, hi, use_radians, point=None):
+    """Graph an inverse function over [lo, hi], in radians or degrees."""
+    try:
+        graph = inverse_window(func, lo, hi)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    y = graph['y'] if use_radians else graph['y'] * (180 / math.pi)
+    if point is not None and not use_radians:
+        point = (point[0], math.degrees(point[1]))
+    _chart(graph['x'], y, "x", f"{func}(x) ({'rad' if use_radians else '°'})", point)
+
+
+def render_unit_circle(radians, label):
+    """The unit circle with the angle's terminal side, cos and sin marked."""
+    cos, sin = math.cos(radians), math.sin(radians)
+    x, y = unit_circle()
+    segments = [
+        {"x": 0, "y": 0, "x2": cos, "y2": sin, "part": "r = 1"},
+        {"x": 0, "y": 0, "x2": cos, "y2": 0, "part": f"cos = {format_number(cos, 4)}"},
+        {"x": cos, "y": 0, "x2": cos, "y2": sin, "part": f"sin = {format_number(sin, 4)}"},
+    ]
+    axis = {"type": "quantitative", "scale": {"domain": [-1.2, 1.2]}}
+    st.vega_lite_chart({'x': x, 'y': y, 'i': range(len(x))}, {
+        "width": 320, "height": 320,
+        "layer": [
+            {"mark": {"type": "line", "color": "#888"},
+             "encoding": {"x": {"field": "x", **axis}, "y": {"field": "y", **axis},
+                          "order": {"field": "i"}}},
+            {"data": {"values": segments}, "mark": {"type": "rule", "strokeWidth": 2},
+             "encoding": {"x": {"field": "x", "type": "quantitative"},
+                          "y": {"field": "y", "type": "quantitative"},
+                          "x2": {"field": "x2"}, "y2": {"field": "y2"},
+                          "color": {"field": "part", "type": "nominal", "title": label}}},
+        ],
+    })
@@ -0,0 +1,130 @@
+"""Polar & Complex: coordinate conversion, complex arithmetic and De Moivre's theorem."""
+
+import streamlit as st
+
+from trigcalc import (
+    parse_number, to_radians, to_degrees, format_number, format_complex,
+)
+
+from .common import engine
+
+
+def render(use_radians, show_steps):
+    """Render the Polar & Complex calculator."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="section-header">Rectangular ↔ Polar Conversion</div>', unsafe_allow_html=True)
+
+        conv_dir = st.radio("Conversion", ["Rectangular → Polar", "Polar → Rectangular"], key="polar_conv_dir")
+
+        if "Rectangular → Polar" in conv_dir:
+            polar_x = st.text_input("x", placeholder="e.g., 3", key="polar_x")
+            polar_y = st.text_input("y", placeholder="e.g., 4", key="polar_y")
+
+            if st.button("Convert", key="conv_to_polar"):
+                x = parse_number(polar_x)
+                y = parse_number(polar_y)
+
+                try:
+                    r, theta = engine.rect_to_polar(x, y)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("r", format_number(r))
+                    if use_radians:
+                        st.metric("θ", f"{format_number(theta)} rad")
+                    else:
+                        st.metric("θ", f"{format_number(to_degrees(theta))}°")
+                    st.markdown('</div>', unsafe_allow_html=True)
+        else:
+            polar_r = st.text_input("r", placeholder="e.g., 5", key="polar_r")
+            angle_label = "radians" if use_radians else "degrees"
+            polar_theta = st.text_input(f"θ ({angle_label})", placeholder="e.g., 45", key="polar_theta")
+
+            if st.button("Convert", key="conv_to_rect"):
+                r = parse_number(polar_r)
+                theta = parse_number(polar_theta)
+
+                try:
+                    x, y = engine.polar_to_rect(r, theta if use_radians else to_radians(theta))
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("x", format_number(x))
+                    st.metric("y", format_number(y))
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="section-header">Complex Number Operations</div>', unsafe_allow_html=True)
+
+        z1_col, z2_col = st.columns(2)
+        with z1_col:
+            st.markdown("**Z₁ = a + bi**")
+            z1_real = st.text_input("a (real)", placeholder="e.g., 3", key="z1_real")
+            z1_imag = st.text_input("b (imag)", placeholder="e.g., 4", key="z1_imag")
+        with z2_col:
+            st.markdown("**Z₂ = c + di**")
+            z2_real = st.text_input("c (real)", placeholder="e.g., 1", key="z2_real")
+            z2_imag = st.text_input("d (imag)", placeholder="e.g., 2", key="z2_imag")
+
+        complex_op = st.selectbox(
+            "Operation",
+            ["Add (Z₁ + Z₂)", "Subtract (Z₁ - Z₂)", "Multiply (Z₁ × Z₂)", "Divide (Z₁ ÷ Z₂)", "Modulus |Z₁|", "Conjugate Z̄₁", "To Polar Form"],
+            key="complex_op"
+        )
+
+        if st.button("Calculate", key="calc_complex"):
+            a = parse_number(z1_real)
+            b = parse_number(z1_imag)
+            c = parse_number(z2_real)
+            d = parse_number(z2_imag)
+            op = "polar" if "Polar" in complex_op else complex_op.split()[0].lower()
+
+            try:
+                result = engine.complex_operation(op, a, b, c, d)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                if op == "modulus":
+                    st.metric("|Z₁|", format_number(result))
+                elif op == "conjugate":
+                    st.metric("Z̄₁", format_complex(*result))
+                elif op == "polar":
+                    r, theta = result
+                    theta_str = f"{format_number(theta)} rad" if use_radians else f"{format_number(to_degrees(theta))}°"
+                    st.metric("r", format_number(r))
+                    st.metric("θ", theta_str)
+                    st.markdown(f"**Polar form:** {format_number(r)}(cos({theta_str}) + i·sin({theta_str}))")
+                else:
+                    st.metric("Result", format_complex(*result))
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown('<div class="section-header">De Moivre\'s Theorem</div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        angle_label = "radians" if use_radians else "degrees"
+        dm_theta = st.text_input(f"Angle θ ({angle_label})", placeholder="e.g., 30", key="dm_theta")
+    with col2:
+        dm_n = st.text_input("Power n", placeholder="e.g., 3", key="dm_n")
+
+    if st.button("Apply De Moivre's Theorem", key="calc_demoivre"):
+        theta = parse_number(dm_theta)
+        n = parse_number(dm_n)
+
+        try:
+            cos_result, sin_result = engine.de_moivre(theta if use_radians else to_radians(theta), n)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+            st.markdown(f"**(cos θ + i·sin θ)ⁿ = cos(nθ) + i·sin(nθ)**")
+            st.metric("Result", format_complex(cos_result, sin_result))
+            st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,253 @@
+"""Right Triangles: solver and applications (elevation, depression, bearings)."""
+
+import math
+
+import streamlit as st
+
+from trigcalc import (
+    parse_number, to_radians, to_degrees, format_number, get_exact_value,
+)
+import trigcalc
+
+from .common import engine
+
+
+def render(use_radians, show_steps):
+    """Render the Right Triangles calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Triangle Solver", "Applications"],
+        horizontal=True,
+        key="right_section"
+    )
+
+    if section == "Triangle Solver":
+        st.markdown('<div class="section-header">📐 Right Triangle Solver</div>', unsafe_allow_html=True)
+        st.info("Enter at least 2 values (including at least one side). Side c is the hypotenuse.")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Sides**")
+            rt_a = st.text_input("Side a (opposite to A)", placeholder="e.g., 3", key="rt_a")
+            rt_b = st.text_input("Side b (adjacent to A)", placeholder="e.g., 4", key="rt_b")
+            rt_c = st.text_input("Side c (hypotenuse)", placeholder="e.g., 5", key="rt_c")
+
+        with col2:
+            st.markdown("**Angles**")
+            angle_unit_label = "radians" if use_radians else "degrees"
+            rt_A = st.text_input(f"Angle A ({angle_unit_label})", placeholder="e.g., 30", key="rt_A")
+            rt_B = st.text_input(f"Angle B ({angle_unit_label})", placeholder="e.g., 60", key="rt_B")
+            st.text("Angle C = 90° (right angle)")
+
+        if st.button("Solve Triangle", key="solve_rt"):
+            a = parse_number(rt_a) if rt_a else float('nan')
+            b = parse_number(rt_b) if rt_b else float('nan')
+            c = parse_number(rt_c) if rt_c else float('nan')
+            A = parse_number(rt_A) if rt_A else float('nan')
+            B = parse_number(rt_B) if rt_B else float('nan')
+
+            # Convert angles to degrees if in radians mode
+            if use_radians:
+                A = to_degrees(A) if not math.isnan(A) else float('nan')
+                B = to_degrees(B) if not math.isnan(B) else float('nan')
+
+            given = {name for name, x in zip("abc", [a, b, c]) if not math.isnan(x)}
+
+            try:
+                result = engine.solve_right_triangle(a, b, c, A, B)
+            except ValueError as e:
+                st.error(str(e))
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+            else:
+                a, b, c = result['a'], result['b'], result['c']
+                A, B, area = result['A'], result['B'], result['area']
+                steps = ""
+
+                if len(given) >= 2:
+                    if {'a', 'b'} <= given:
+                        steps = f"Given: a = {a}, b = {b}\n\nStep 1: Find hypotenuse c using Pythagorean theorem\n  c² = a² + b² = {a}² + {b}² = {format_number(a*a + b*b)}\n  c = √{format_number(a*a + b*b)} = {format_number(c)}"
+                    elif given == {'a', 'c'}:
+                        steps = f"Given: a = {a}, c = {c}\n\nStep 1: Find side b\n  b² = c² - a² = {c}² - {a}² = {format_number(c*c - a*a)}\n  b = √{format_number(c*c - a*a)} = {format_number(b)}"
+                    else:
+                        steps = f"Given: b = {b}, c = {c}\n\nStep 1: Find side a\n  a² = c² - b² = {c}² - {b}² = {format_number(c*c - b*b)}\n  a = √{format_number(c*c - b*b)} = {format_number(a)}"
+
+                    steps += f"\n\nStep 2: Find angle A\n  sin(A) = a/c = {format_number(a)}/{format_number(c)} = {format_number(a/c)}\n  A = arcsin({format_number(a/c)}) = {format_number(A)}°"
+                    steps += f"\n\nStep 3: Find angle B\n  B = 90° - A = 90° - {format_number(A)}° = {format_number(B)}°"
+
+                elif len(given) == 1:
+                    if 'a' in given:
+                        steps = f"Given: a = {a}, A = {format_number(A)}°\n\nStep 1: Find B = 90° - A = {format_number(B)}°"
+                        steps += f"\n\nStep 2: Find c = a/sin(A) = {a}/sin({format_number(A)}°) = {format_number(c)}"
+                        steps += f"\n\nStep 3: Find b = a/tan(A) = {a}/tan({format_number(A)}°) = {format_number(b)}"
+                    elif 'b' in given:
+                        steps = f"Given: b = {b}, A = {format_number(A)}°\n\nStep 1: Find B = 90° - A = {format_number(B)}°"
+                        steps += f"\n\nStep 2: Find c = b/cos(A) = {b}/cos({format_number(A)}°) = {format_number(c)}"
+                        steps += f"\n\nStep 3: Find a = b×tan(A) = {b}×tan({format_number(A)}°) = {format_number(a)}"
+                    else:
+                        steps = f"Given: c = {c}, A = {format_number(A)}°\n\nStep 1: Find B = 90° - A = {format_number(B)}°"
+                        steps += f"\n\nStep 2: Find a = c×sin(A) = {c}×sin({format_number(A)}°) = {format_number(a)}"
+                        steps += f"\n\nStep 3: Find b = c×cos(A) = {c}×cos({format_number(A)}°) = {format_number(b)}"
+
+                steps += f"\n\nStep 4: Calculate Area\n  Area = ½ × a × b = ½ × {format_number(a)} × {format_number(b)} = {format_number(area)} sq units"
+
+                # Display results
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Side a", format_number(a))
+                    st.metric("Angle A", f"{format_number(A)}°")
+                with col2:
+                    st.metric("Side b", format_number(b))
+                    st.metric("Angle B", f"{format_number(B)}°")
+                with col3:
+                    st.metric("Side c (hyp)", format_number(c))
+                    st.metric("Area", f"{format_number(area)} sq units")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                # Trig ratios
+                st.markdown("**Trigonometric Ratios at Angle A:**")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    exact_sin = get_exact_value(A, 'sin')
+                    st.metric("sin A", f"{exact_sin if exact_sin else format_number(math.sin(to_radians(A)))}")
+                with col2:
+                    exact_cos = get_exact_value(A, 'cos')
+                    st.metric("cos A", f"{exact_cos if exact_cos else format_number(math.cos(to_radians(A)))}")
+                with col3:
+                    exact_tan = get_exact_value(A, 'tan')
+                    val = math.tan(to_radians(A)) if A != 90 else float('inf')
+                    st.metric("tan A", f"{exact_tan if exact_tan else format_number(val) if val != float('inf') else 'undefined'}")
+
+                if show_steps:
+                    st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+    else:  # Applications
+        st.markdown('<div class="section-header">🎯 Application Problems</div>', unsafe_allow_html=True)
+
+        app_type = st.radio(
+            "Problem Type",
+            ["Angle of Elevation", "Angle of Depression", "Bearing"],
+            horizontal=True,
+            key="app_type"
+        )
+
+        if app_type == "Angle of Elevation":
+            col1, col2 = st.columns(2)
+            with col1:
+                app_dist = st.text_input("Horizontal Distance", placeholder="e.g., 100", key="app_dist")
+            with col2:
+                app_angle = st.text_input("Angle of Elevation (degrees)", placeholder="e.g., 30", key="app_elev_angle")
+
+            if st.button("Calculate Height", key="calc_elevation"):
+                d = parse_number(app_dist)
+                ang = parse_number(app_angle)
+
+                try:
+                    height = trigcalc.elevation_height(d, ang)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("Height", f"{format_number(height)} units")
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    if show_steps:
+                        steps = f"""Angle of Elevation Problem
+
+Given:
+  Horizontal distance = {d} units
+  Angle of elevation = {ang}°
+
+Step 1: Set up the right triangle
+  • The horizontal distance is the adjacent side
+  • The height is the opposite side
+  • The angle is measured from horizontal upward
+
+Step 2: Use tangent ratio
+  tan(θ) = opposite/adjacent = height/distance
+  tan({ang}°) = height/{d}
+
+Step 3: Solve for height
+  height = distance × tan(θ)
+  height = {d} × tan({ang}°)
+  height = {d} × {format_number(math.tan(to_radians(ang)))}
+  height = {format_number(height)} units"""
+                        st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+        elif app_type == "Angle of Depression":
+            col1, col2 = st.columns(2)
+            with col1:
+                app_height = st.text_input("Observer Height", placeholder="e.g., 50", key="app_height")
+            with col2:
+                app_angle = st.text_input("Angle of Depression (degrees)", placeholder="e.g., 25", key="app_dep_angle")
+
+            if st.button("Calculate Distance", key="calc_depression"):
+                h = parse_number(app_height)
+                ang = parse_number(app_angle)
+
+                try:
+                    distance = trigcalc.depression_distance(h, ang)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                    st.metric("Horizontal Distance", f"{format_number(distance)} units")
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    if show_steps:
+                        steps = f"""Angle of Depression Problem
+
+Given:
+  Observer height = {h} units
+  Angle of depression = {ang}°
+
+Step 1: Set up the right triangle
+  • The height is the opposite side
+  • The horizontal distance is the adjacent side
+  • Angle of depression = angle of elevation (alternate interior angles)
+
+Step 2: Use tangent ratio
+  tan(θ) = opposite/adjacent = height/distance
+  tan({ang}°) = {h}/distance
+
+Step 3: Solve for distance
+  distance = height/tan(θ)
+  distance = {h}/tan({ang}°)
+  distance = {h}/{format_number(math.tan(to_radians(ang)))}
+  distance = {format_number(distance)} units"""
+                        st.markdown(f'<div class="steps-box">{steps}</div>', unsafe_allow_html=True)
+
+        else:  # Bearing
+            col1, col2 = st.columns(2)
+            with col1:
+                app_dist = st.text_input("Distance Traveled", placeholder="e.g., 10", key="bearing_dist")
+            with col2:
+                app_bearing = st.text_input("Bearing", placeholder="e.g., N30°E or 30", key="bearing_angle")
+
+            if st.button("Calculate Components", key="calc_bearing"):
+                d = parse_number(app_dist)
+                bearing_str = app_bearing.strip() if app_bearing else ""
+
+                if math.isnan(d) or not bearing_str:
+                    st.error("Please enter distance and bearing.")
+                else:
+                    bearing = trigcalc.parse_bearing(bearing_str)
+
+                    try:
+                        ns_comp, ew_comp = trigcalc.bearing_components(d, bearing)
+                    except ValueError as e:
+                        st.error(str(e))
+                    else:
+                        st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            ns_dir = "N" if ns_comp >= 0 else "S"
+                            st.metric("North/South", f"{format_number(abs(ns_comp))} {ns_dir}")
+                        with col2:
+                            ew_dir = "E" if ew_comp >= 0 else "W"
+                            st.metric("East/West", f"{format_number(abs(ew_comp))} {ew_dir}")
+                        st.markdown('</div>', unsafe_allow_html=True)
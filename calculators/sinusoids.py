@@ -0,0 +1,306 @@
+"""Sinusoidal Functions: equation parser, equation builder and real-world models."""
+
+import math
+
+import numpy as np
+import streamlit as st
+
+from trigcalc import parse_number, format_number, format_radians
+from trigcalc.fitting import csv_columns, fit_sinusoid_csv
+from trigcalc.graphs import compile_sinusoid
+from trigcalc.spectrum import BINARY_DTYPES, DEFAULT_SEGMENT, dominant_sinusoids, signal_chunks
+
+from .common import engine
+from .plots import render_sinusoid_graph
+
+ROW_NUMBER = "(row number)"
+SEGMENT_LENGTHS = [1 << k for k in range(8, 21)]
+
+SPECTRUM_CHART = {
+    "mark": "line",
+    "encoding": {
+        "x": {"field": "frequency", "type": "quantitative", "title": "frequency (cycles per time unit)"},
+        "y": {"field": "power", "type": "quantitative", "scale": {"type": "log"}},
+    },
+}
+
+
+def render_parsed_graph(equation, parsed):
+    """Graph of a parsed equation over a window of periods, with a table of values."""
+    C, period = parsed['C'], parsed['period']
+    lo, hi = st.slider("Window (periods from C)", -10.0, 10.0, (-1.0, 2.0), 0.25, key="parse_window")
+    render_sinusoid_graph(parsed['func'], C + lo * period, C + hi * period,
+                          parsed['A'], parsed['B'], C, parsed['D'])
+
+    # One period in eighths, from the compiled (cached) equation
+    x = C + np.arange(9) * (period / 8)
+    y = compile_sinusoid(equation)(x)
+    st.dataframe({'x': [format_number(v) for v in x],
+                  'y': [format_number(v) if math.isfinite(v) else "undefined" for v in y]},
+                 hide_index=True)
+
+
+def render_model_fit():
+    """Fit y = A cos(B(x - C)) + D to a column of an uploaded CSV file."""
+    st.caption("The file is read in chunks. Leave the period empty to estimate it "
+               "from the data's spectrum (needs evenly spaced samples).")
+    upload = st.file_uploader("CSV file", type=["csv"], key="fit_file")
+    if upload is None:
+        return
+    try:
+        columns = csv_columns(upload)
+    except Exception as e:
+        st.error(f"Could not read the CSV header: {e}")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        value_column = st.selectbox("Value column", columns, index=len(columns) - 1, key="fit_value")
+    with col2:
+        time_column = st.selectbox("Time column", [ROW_NUMBER] + columns, key="fit_time")
+    with col3:
+        fit_period = st.text_input("Period (optional)", placeholder="e.g., 24", key="fit_period")
+
+    if st.button("Fit Model", key="fit_model"):
+        period = parse_number(fit_period) if fit_period else None
+        try:
+            with st.spinner("Fitting..."):
+                fit = fit_sinusoid_csv(upload, value_column,
+                                       None if time_column == ROW_NUMBER else time_column, period)
+        except ValueError as e:
+            st.error(str(e))
+        except Exception as e:
+            st.error(f"Could not read the CSV file: {e}")
+        else:
+            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-value">{fit["equation"]}</div>', unsafe_allow_html=True)
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Amplitude (A)", format_number(fit['A']))
+                st.metric("Period", format_number(fit['period']))
+            with col2:
+                st.metric("Phase Shift (C)", format_number(fit['C']))
+                st.metric("Midline (D)", f"y = {format_number(fit['D'])}")
+            with col3:
+                st.metric("R²", format_number(fit['r_squared']))
+                st.metric("RMS residual", format_number(fit['rms']))
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            if fit['estimated'] and not fit['evenly_spaced']:
+                st.warning("The samples are not evenly spaced, so the estimated period may be off. "
+                           "Enter the period if you know it.")
+            model = fit['A'] * np.cos(fit['B'] * (fit['t'] - fit['C'])) + fit['D']
+            st.line_chart({'x': fit['t'], 'data': fit['y'], 'fit': model}, x='x', y=['data', 'fit'])
+            st.caption(f"{fit['samples']:,} samples fitted, {len(fit['t']):,} drawn"
+                       + (" (period estimated by FFT)" if fit['estimated'] else ""))
+
+
+def render_spectrum():
+    """Dominant periods of an uploaded signal, as sinusoids."""
+    st.caption("Upload a long signal: a CSV column, a .npy array or raw binary samples. "
+               "It is analyzed segment by segment (Welch's method), so memory use stays flat.")
+    upload = st.file_uploader("Signal file", type=["csv", "npy", "bin", "raw", "dat", "f32", "f64"],
+                              key="spec_file")
+    if upload is None:
+        return
+    ext = upload.name.rsplit('.', 1)[-1].lower()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        column, dtype = None, "float64"
+        if ext == 'csv':
+            try:
+                columns = csv_columns(upload)
+            except Exception as e:
+                st.error(f"Could not read the CSV header: {e}")
+                return
+            column = st.selectbox("Signal column", columns, index=len(columns) - 1, key="spec_column")
+        elif ext != 'npy':
+            dtype = st.selectbox("Sample type", BINARY_DTYPES, key="spec_dtype")
+        spec_spacing = st.text_input("Time between samples", value="1", key="spec_spacing")
+    with col2:
+        segment = st.selectbox("Segment length", SEGMENT_LENGTHS,
+                               index=SEGMENT_LENGTHS.index(DEFAULT_SEGMENT), key="spec_segment",
+                               help="Longer segments resolve closer frequencies but average fewer spectra.")
+        peaks = st.number_input("Components", min_value=1, max_value=10, value=3, key="spec_peaks")
+
+    if st.button("Analyze", key="spec_analyze"):
+        spacing = parse_number(spec_spacing)
+        try:
+            with st.spinner("Analyzing..."):
+                result = dominant_sinusoids(lambda: signal_chunks(upload, dtype, column),
+                                            int(peaks), segment, spacing)
+        except ValueError as e:
+            st.error(str(e))
+        except Exception as e:
+            st.error(f"Could not read the signal: {e}")
+        else:
+            for i, part in enumerate(result['components'], 1):
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                st.markdown(f'<div class="result-value">{part["equation"]}</div>', unsafe_allow_html=True)
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric(f"Amplitude (A) #{i}", format_number(part['A']))
+                with col2:
+                    st.metric("Period", format_number(part['period']))
+                with col3:
+                    st.metric("Phase Shift (C)", format_number(part['C']))
+                with col4:
+                    st.metric("Share of power", f"{part['share']:.1%}")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            shown = result['power'] > 0  # the log scale has no place for 0
+            st.vega_lite_chart({'frequency': result['frequency'][shown], 'power': result['power'][shown]},
+                               SPECTRUM_CHART, width="stretch")
+            st.caption(f"{result['samples']:,} samples, {result['segments']:,} segments of "
+                       f"{result['segment']:,}. D = {format_number(result['components'][0]['D'])} is the mean.")
+
+
+def render(use_radians, show_steps):
+    """Render the Sinusoidal Functions calculator."""
+    section = st.radio(
+        "Select Section",
+        ["Parse Equation", "Build Equation", "Real-World Model", "Spectral Analysis"],
+        horizontal=True,
+        key="sin_section"
+    )
+
+    if section == "Parse Equation":
+        st.markdown('<div class="section-header">📝 Parse Sinusoidal Equation</div>', unsafe_allow_html=True)
+        st.info("Standard form: y = A·f(B(x - C)) + D, with f any of sin, cos, tan, csc, sec, cot")
+
+        equation = st.text_input("Enter Equation", placeholder="e.g., y = 2sin(3x - π/2) + 1", key="parse_eq")
+
+        if st.button("Parse", key="parse_sinusoidal"):
+            if equation:
+                try:
+                    parsed = engine.parse_sinusoid(equation)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    func_type = parsed['func']
+                    B, C, D = parsed['B'], parsed['C'], parsed['D']
+                    period = parsed['period']
+                    amplitude = parsed['amplitude']
+                    bounded = func_type in ('sin', 'cos')
+
+                    st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.metric("Function Type", func_type)
+                        st.metric("Amplitude |A|" if bounded else "Vertical Stretch |A|", format_number(amplitude))
+                        st.metric("B value", format_number(B))
+                        st.metric("Period", format_radians(period))
+                    with col2:
+                        st.metric("Phase Shift (C)", format_number(C))
+                        st.metric("Vertical Shift (D)", format_number(D))
+                        st.metric("Maximum", format_number(parsed['maximum']) if bounded else "∞")
+                        st.metric("Minimum", format_number(parsed['minimum']) if bounded else "-∞")
+
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+        if equation and st.toggle("Graph", key="parse_graph"):
+            try:
+                parsed = engine.parse_sinusoid(equation)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                render_parsed_graph(equation, parsed)
+
+    elif section == "Build Equation":
+        st.markdown('<div class="section-header">🔧 Build Equation from Parameters</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            build_func = st.selectbox("Function", ["sin", "cos"], key="build_func")
+            build_A = st.text_input("Amplitude (A)", placeholder="e.g., 2", key="build_A")
+            build_period = st.text_input("Period", placeholder="e.g., 2π or 360", key="build_period")
+        with col2:
+            build_C = st.text_input("Phase Shift (C)", placeholder="e.g., 0", key="build_C")
+            build_D = st.text_input("Vertical Shift (D)", placeholder="e.g., 0", key="build_D")
+
+        if st.button("Build Equation", key="build_eq"):
+            A = parse_number(build_A) if build_A else 1
+            period = parse_number(build_period)
+            C = parse_number(build_C) if build_C else 0
+            D = parse_number(build_D) if build_D else 0
+
+            try:
+                built = engine.build_sinusoid(build_func, A, period, C, D)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                equation = built['equation']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                st.markdown(f'<div class="result-value">{equation}</div>', unsafe_allow_html=True)
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Amplitude", format_number(abs(A)))
+                    st.metric("Period", format_number(period))
+                with col2:
+                    st.metric("Phase Shift", format_number(C))
+                    st.metric("Vertical Shift", format_number(D))
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        if st.toggle("Graph", key="build_graph"):
+            A = parse_number(build_A) if build_A else 1
+            period = parse_number(build_period)
+            C = parse_number(build_C) if build_C else 0
+            D = parse_number(build_D) if build_D else 0
+            if math.isnan(period) or period == 0:
+                st.info("Enter a period to graph the equation.")
+            else:
+                lo, hi = st.slider("Window (periods from C)", -10.0, 10.0, (-1.0, 2.0), 0.25, key="build_window")
+                render_sinusoid_graph(build_func, C + lo * abs(period), C + hi * abs(period),
+                                      A, 2 * math.pi / period, C, D)
+
+    elif section == "Real-World Model":
+        st.markdown('<div class="section-header">🌊 Real-World Sinusoidal Model</div>', unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            model_max = st.text_input("Maximum Value", placeholder="e.g., 100", key="model_max")
+            model_min = st.text_input("Minimum Value", placeholder="e.g., 20", key="model_min")
+        with col2:
+            model_period = st.text_input("Period", placeholder="e.g., 12", key="model_period")
+            model_max_time = st.text_input("Time of Maximum", placeholder="e.g., 3", key="model_max_time")
+
+        if st.button("Build Model", key="build_model"):
+            max_val = parse_number(model_max)
+            min_val = parse_number(model_min)
+            period = parse_number(model_period)
+            max_time = parse_number(model_max_time)
+
+            try:
+                model = engine.sinusoid_model(max_val, min_val, period, max_time)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                A, D = model['A'], model['D']
+                equation = model['equation']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                st.markdown(f'<div class="result-value">{equation}</div>', unsafe_allow_html=True)
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Amplitude", format_number(A))
+                    st.metric("Period", format_number(period))
+                with col2:
+                    st.metric("Phase Shift", format_number(max_time))
+                    st.metric("Midline", f"y = {format_number(D)}")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        if st.toggle("Fit to data", key="model_fit"):
+            render_model_fit()
+
+    else:  # Spectral Analysis
+        st.markdown('<div class="section-header">📡 Spectral Analysis</div>', unsafe_allow_html=True)
+        render_spectrum()
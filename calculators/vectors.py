@@ -0,0 +1,94 @@
+"""Vectors: operations on two vectors and single-vector properties."""
+
+import streamlit as st
+
+from trigcalc import parse_number, to_degrees, format_number
+
+from .common import engine
+
+
+def render(use_radians, show_steps):
+    """Render the Vectors calculator."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="section-header">Vector Operations</div>', unsafe_allow_html=True)
+
+        vec_col1, vec_col2 = st.columns(2)
+        with vec_col1:
+            st.markdown("**Vector U**")
+            ux = st.text_input("Uₓ", placeholder="e.g., 3", key="ux")
+            uy = st.text_input("Uᵧ", placeholder="e.g., 4", key="uy")
+        with vec_col2:
+            st.markdown("**Vector V**")
+            vx = st.text_input("Vₓ", placeholder="e.g., 1", key="vx")
+            vy = st.text_input("Vᵧ", placeholder="e.g., 2", key="vy")
+
+        vec_op = st.selectbox(
+            "Operation",
+            ["Add (U + V)", "Subtract (U - V)", "Dot Product (U · V)", "Cross Product (U × V)", "Angle Between"],
+            key="vec_op"
+        )
+
+        if st.button("Calculate", key="calc_vec"):
+            u_x = parse_number(ux)
+            u_y = parse_number(uy)
+            v_x = parse_number(vx)
+            v_y = parse_number(vy)
+            op = vec_op.split()[0].lower()
+
+            try:
+                result = engine.vector_operation(op, u_x, u_y, v_x, v_y)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+
+                if op in ("add", "subtract"):
+                    st.metric("Result", f"({format_number(result['x'])}, {format_number(result['y'])})")
+                    st.metric("Magnitude", format_number(result['magnitude']))
+
+                elif op == "dot":
+                    st.metric("U · V", format_number(result['dot']))
+                    st.info("Dot product is 0 if vectors are perpendicular")
+
+                elif op == "cross":
+                    st.metric("U × V (z-component)", format_number(result['cross']))
+                    st.info("This represents the signed area of the parallelogram")
+
+                else:  # Angle
+                    angle = result['angle']
+                    if use_radians:
+                        st.metric("Angle", f"{format_number(angle)} rad")
+                    else:
+                        st.metric("Angle", f"{format_number(to_degrees(angle))}°")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="section-header">Single Vector Properties</div>', unsafe_allow_html=True)
+
+        sv_x = st.text_input("x-component", placeholder="e.g., 3", key="sv_x")
+        sv_y = st.text_input("y-component", placeholder="e.g., 4", key="sv_y")
+
+        if st.button("Analyze", key="analyze_vec"):
+            x = parse_number(sv_x)
+            y = parse_number(sv_y)
+
+            try:
+                props = engine.vector_properties(x, y)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                magnitude = props['magnitude']
+                direction = props['direction']
+                unit_x, unit_y = props['unit']
+
+                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                st.metric("Magnitude", format_number(magnitude))
+                if use_radians:
+                    st.metric("Direction", f"{format_number(direction)} rad")
+                else:
+                    st.metric("Direction", f"{format_number(to_degrees(direction))}°")
+                st.metric("Unit Vector", f"({format_number(unit_x)}, {format_number(unit_y)})")
+                st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from trigcalc.api import MAX_BODY_BYTES, handle
+
+
+def post(path, payload):
+    return handle('POST', path, json.dumps(payload).encode())
+
+
+@pytest.mark.parametrize("path, params", [
+    ('/angle/convert', {'value': '1+' * 1000 + '1'}),
+    ('/angle/convert', {'value': '2' + 'π' * 3000}),
+    ('/sinusoid/parse', {'equation': 'y = ' + '+'.join(['sin(x)'] * 2000)}),
+])
+def test_deep_expressions_are_rejected(path, params):
+    status, response = post(path, params)
+    assert status == 422
+    assert 'error' in response
+
+
+def test_deeply_nested_json_is_a_bad_request():
+    body = b'[' * 200_000
+    assert len(body) < MAX_BODY_BYTES
+    status, response = handle('POST', '/angle/convert', body)
+    assert status == 400
+    assert 'error' in response
+
+
+def test_zero_omega_is_rejected():
+    status, response = post('/shm', {'A': 1, 'omega': 0, 't': 1})
+    assert (status, response) == (422, {'error': "Angular frequency ω must be positive."})
@@ -0,0 +1,27 @@
+import pyarrow.csv
+import pyarrow.parquet
+import pytest
+
+from trigcalc.cli import main
+
+
+def test_unsolved_rows_keep_their_inputs(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("id,a,b,c,case\n1,1,1,5,SSS\n2,3,4,5,SSS\n3,3,4,,SAS\n")
+    assert main(["oblique", str(src), str(dst)]) == 0
+    rows = pyarrow.csv.read_csv(dst).to_pylist()
+    assert [(r['a'], r['b'], r['c'], r['error']) for r in rows] == [
+        (1, 1, 5, 6), (3, 4, 5, 0), (3, 4, None, 1)]
+    assert rows[1]['area'] == pytest.approx(6)
+    assert rows[0]['area'] is None
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_header_only_input_writes_an_empty_file(tmp_path, suffix):
+    src, dst = tmp_path / "in.csv", tmp_path / f"out{suffix}"
+    src.write_text("id,a,b,c,case\n")
+    assert main(["oblique", str(src), str(dst)]) == 0
+    read = pyarrow.parquet.read_table if suffix == ".parquet" else pyarrow.csv.read_csv
+    table = read(dst)
+    assert table.num_rows == 0
+    assert table.column_names[-8:] == ["a", "b", "c", "A", "B", "C", "area", "error"]
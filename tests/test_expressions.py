@@ -0,0 +1,31 @@
+import math
+
+import pytest
+
+from trigcalc import parse_number
+from trigcalc.expressions import compile_expression, parse_expression
+from trigcalc.identities import verify_identity
+
+
+@pytest.mark.parametrize("text", [
+    "-" * 2000 + "1",
+    "(" * 300 + "1" + ")" * 300,
+    "1+" * 1000 + "1",
+    "2" + "π" * 3000,
+    "sin " * 500 + "1",
+])
+def test_deep_input_is_not_a_number(text):
+    assert math.isnan(parse_number(text))
+
+
+def test_deep_input_raises_value_error():
+    with pytest.raises(ValueError, match="nested too deeply"):
+        parse_expression("x*" * 1000 + "x")
+    with pytest.raises(ValueError, match="nested too deeply"):
+        verify_identity("+".join(["sin(x)"] * 2000), "1")
+
+
+def test_long_chains_within_the_limit():
+    assert parse_number("1+" * 90 + "1") == 91
+    assert compile_expression("+".join(["x"] * 90), ("x",))(2) == 180
+    assert compile_expression("√3/2")() == pytest.approx(math.sqrt(3) / 2)
@@ -0,0 +1,18 @@
+import math
+
+import pytest
+
+from trigcalc.solver import solve_equation
+
+
+def test_removable_pole_is_not_a_solution():
+    # (sin x - 1)/cos x tends to 0 at 90°, where tan and sec are undefined
+    assert solve_equation('tan x = sec x', 0, 360, degrees=True)['solutions'] == ()
+    assert solve_equation('tan x = sec x', -7, 7)['solutions'] == ()
+
+
+def test_numeric_roots_are_kept():
+    assert solve_equation('x = cos x', 0, 3)['solutions'] == pytest.approx((0.7390851332151607,))
+    assert solve_equation('tan x + sec x = 2', 0, 360, degrees=True)['solutions'] == pytest.approx(
+        (math.degrees(math.atan2(3, 4)),))
+    assert solve_equation('cos x/(1 + sin x) = 0', 0, 360, degrees=True)['solutions'] == pytest.approx((90.0,))
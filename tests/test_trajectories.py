@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from trigcalc import projectile
+from trigcalc.trajectories import optimal_angle, simulate_trajectories
+
+SWEEP = np.linspace(0, 90, 91)[1:-1]
+
+
+@pytest.mark.parametrize("v0, h0, model, drag", [
+    (10, 20, "linear", 1.0),
+    (20, 30, "quadratic", 0.2),
+    (10, 100, "quadratic", 0.1),
+])
+def test_high_launch_with_strong_drag_lands(v0, h0, model, drag):
+    # The fall at terminal velocity outlasts a drag-free flight
+    result = simulate_trajectories(v0, SWEEP, h0, drag=drag, model=model)
+    assert not np.isnan(result['range']).any()
+    assert not np.isnan(result['flight_time']).any()
+    assert 0 < optimal_angle(v0, h0, drag=drag, model=model, angles=90)['angle'] < 90
+
+
+def test_drag_free_range_matches_closed_form():
+    result = simulate_trajectories(30, 45.0, 0, model="none")
+    assert result['range'][0] == pytest.approx(projectile(30, 45, 0, 9.81)['range'], rel=1e-6)
+
+
+def test_launch_below_ground_never_lands():
+    with pytest.raises(ValueError):
+        simulate_trajectories(10, SWEEP, -5, drag=0.1)
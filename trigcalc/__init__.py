@@ -0,0 +1,25 @@
+"""Headless compute engine for the Trigonometry Calculator.
+
+Everything here is plain Python on top of ``math`` so it can be used from
+scripts and services without importing Streamlit. ``app.py`` is a thin UI
+on top of these functions.
+"""
+
+from .utils import (
+    PI, parse_number, to_radians, to_degrees, format_number, format_radians,
+    format_complex, get_quadrant, get_reference_angle, get_exact_value,
+)
+from .exact import EXACT_VALUES, exact_value, exact_multiple
+from .expressions import parse_expression, compile_expression, evaluate_expression
+from .angles import convert_angle, arc_sector, linear_angular_speed
+from .triangles import (
+    solve_right_triangle, solve_oblique, area_sas, area_sss, heron_area,
+    elevation_height, depression_distance, parse_bearing, bearing_components,
+)
+from .functions import (
+    evaluate_trig, evaluate_inverse, evaluate_composition, solve_basic_equation,
+)
+from .sinusoids import parse_sinusoid, build_sinusoid, sinusoid_model
+from .vectors import vector_operation, vector_properties
+from .polar import rect_to_polar, polar_to_rect, complex_operation, de_moivre
+from .motion import PARAMETRIC_EQUATIONS, parametric_point, projectile, shm
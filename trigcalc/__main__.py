@@ -0,0 +1,7 @@
+"""``python -m trigcalc``: batch-solve files of triangles (see ``trigcalc.cli``)."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,89 @@
+"""Angle conversions, arc length / sector area and linear & angular speed."""
+
+import math
+
+from .utils import PI, to_radians, to_degrees, get_quadrant, get_reference_angle
+
+# Unit conversion factors to SI base units
+RADIUS_UNITS = {'meters': 1, 'cm': 0.01, 'feet': 0.3048}
+ANGULAR_SPEED_UNITS = {'rad/s': 1, 'rpm': 2 * PI / 60, 'deg/s': PI / 180}
+LINEAR_SPEED_UNITS = {'m/s': 1, 'km/h': 1/3.6, 'mph': 0.44704}
+
+
+def to_dms(degrees):
+    """Split an angle in degrees into (sign, degrees, minutes, seconds)."""
+    abs_deg = abs(degrees)
+    d = int(abs_deg)
+    m_float = (abs_deg - d) * 60
+    m = int(m_float)
+    s = (m_float - m) * 60
+    sign = "-" if degrees < 0 else ""
+    return sign, d, m, s
+
+
+def convert_angle(value, unit="Degrees"):
+    """Convert an angle given in degrees or radians and describe it."""
+    if math.isnan(value):
+        raise ValueError("Invalid input. Please enter a valid number.")
+
+    if unit == "Radians":
+        degrees = to_degrees(value)
+        radians = value
+    else:
+        degrees = value
+        radians = to_radians(value)
+
+    return {
+        'degrees': degrees,
+        'radians': radians,
+        'normalized': ((degrees % 360) + 360) % 360,
+        'quadrant': get_quadrant(degrees),
+        'reference': get_reference_angle(degrees),
+        'dms': to_dms(degrees),
+        'coterminal': degrees + 360,
+    }
+
+
+def arc_sector(r, theta, unit="Radians"):
+    """Arc length and sector area for radius r and central angle theta."""
+    if math.isnan(r) or math.isnan(theta) or r <= 0:
+        raise ValueError("Please enter valid positive values.")
+
+    # Formulas require the angle in radians
+    theta_rad = theta if unit == "Radians" else to_radians(theta)
+
+    return {
+        'theta_rad': theta_rad,
+        'arc_length': r * theta_rad,
+        'sector_area': 0.5 * r * r * theta_rad,
+        'circumference': 2 * PI * r,
+        'circle_area': PI * r * r,
+    }
+
+
+def linear_angular_speed(r, w, v, r_unit="meters", w_unit="rad/s", v_unit="m/s"):
+    """Solve v = rω for whichever of r, ω, v is NaN."""
+    count = sum([not math.isnan(x) for x in [r, w, v]])
+    if count < 2:
+        raise ValueError("Please enter at least two values.")
+
+    r_conv = RADIUS_UNITS[r_unit]
+    w_conv = ANGULAR_SPEED_UNITS[w_unit]
+    v_conv = LINEAR_SPEED_UNITS[v_unit]
+
+    # Convert to base units
+    r_base = r * r_conv
+    w_base = w * w_conv
+    v_base = v * v_conv
+
+    if math.isnan(r):
+        r = v_base / w_base / r_conv
+        solved = "radius"
+    elif math.isnan(w):
+        w = v_base / r_base / w_conv
+        solved = "angular speed"
+    else:
+        v = r_base * w_base / v_conv
+        solved = "linear speed"
+
+    return {'r': r, 'w': w, 'v': v, 'solved': solved}
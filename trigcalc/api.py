@@ -0,0 +1,240 @@
+"""JSON HTTP API over the calculator functions, as a plain ASGI app.
+
+Run it with any ASGI server, e.g. ``uvicorn trigcalc.api:app`` or
+``python -m trigcalc.api --port 8000`` (which uses uvicorn).
+
+Every endpoint takes a POST with a JSON object of parameters, named as in
+the ``trigcalc`` function it calls, and answers ``{"result": ...}`` or,
+with status 422, ``{"error": "..."}``. Posting a JSON array of up to
+``MAX_BATCH`` objects instead solves them all in one request and answers
+an array with one ``{"result": ...}`` or ``{"error": ...}`` per item, in
+order. Numeric parameters accept numbers or expression strings ("π/4");
+missing ones are NaN, as for empty inputs in the app. Non-finite numbers
+in results come back as null. ``GET /`` lists the endpoints.
+
+The calculator functions take microseconds, so requests are handled
+directly on the event loop rather than in a thread pool.
+"""
+
+import json
+import math
+import os
+
+from .utils import PI, parse_number
+from .angles import (
+    RADIUS_UNITS, ANGULAR_SPEED_UNITS, LINEAR_SPEED_UNITS,
+    convert_angle, arc_sector, linear_angular_speed,
+)
+from .triangles import OBLIQUE_CASES, solve_right_triangle, solve_oblique
+from .functions import (
+    TRIG_FUNCTIONS, INVERSE_FUNCTIONS, COMPOSITIONS,
+    evaluate_trig, evaluate_inverse, evaluate_composition, solve_basic_equation,
+)
+from .sinusoids import parse_sinusoid, build_sinusoid, sinusoid_model
+from .vectors import VECTOR_OPERATIONS, vector_operation, vector_properties
+from .polar import COMPLEX_OPERATIONS, rect_to_polar, polar_to_rect, complex_operation, de_moivre
+from .motion import PARAMETRIC_CURVES, parametric_point, projectile, shm
+
+MAX_BATCH = int(os.environ.get("TRIGCALC_API_MAX_BATCH", 1000))
+MAX_BODY_BYTES = 1 << 20
+
+NAN = float('nan')
+ANGLE_UNITS = ["Degrees", "Radians"]
+
+
+def _complex(op, a, b, c=0, d=0):
+    result = complex_operation(op, a, b, c, d)
+    if op == "modulus":
+        return {'modulus': result}
+    if op == "polar":
+        return {'r': result[0], 'theta': result[1]}
+    return {'real': result[0], 'imag': result[1]}
+
+
+def _pair(func, *names):
+    """Wrap a function returning a tuple so it returns a dict of names."""
+    return lambda **kwargs: dict(zip(names, func(**kwargs)))
+
+
+# path -> (function, {parameter: default or list of allowed strings})
+# A numeric default of NAN means the parameter is required; a list means
+# a string parameter whose default is the first entry.
+ENDPOINTS = {
+    '/angle/convert': (convert_angle, {'value': NAN, 'unit': ANGLE_UNITS}),
+    '/angle/arc-sector': (arc_sector, {'r': NAN, 'theta': NAN, 'unit': ANGLE_UNITS[::-1]}),
+    '/angle/speed': (linear_angular_speed, {
+        'r': NAN, 'w': NAN, 'v': NAN, 'r_unit': list(RADIUS_UNITS),
+        'w_unit': list(ANGULAR_SPEED_UNITS), 'v_unit': list(LINEAR_SPEED_UNITS),
+    }),
+    '/triangle/right': (solve_right_triangle, {'a': NAN, 'b': NAN, 'c': NAN, 'A': NAN, 'B': NAN}),
+    '/triangle/oblique': (solve_oblique, {
+        'case': OBLIQUE_CASES, 'a': NAN, 'b': NAN, 'c': NAN, 'A': NAN, 'B': NAN, 'C': NAN,
+    }),
+    '/trig/evaluate': (evaluate_trig, {'func': TRIG_FUNCTIONS, 'radians': NAN}),
+    '/trig/inverse': (evaluate_inverse, {'func': INVERSE_FUNCTIONS, 'x': NAN}),
+    '/trig/composition': (evaluate_composition, {'comp_type': COMPOSITIONS, 'x': NAN}),
+    '/trig/equation': (solve_basic_equation, {'func': ['sin', 'cos', 'tan'], 'k': NAN}),
+    '/sinusoid/parse': (parse_sinusoid, {'equation': None}),
+    '/sinusoid/build': (build_sinusoid, {'func': ['sin', 'cos'], 'A': 1.0, 'period': NAN, 'C': 0.0, 'D': 0.0}),
+    '/sinusoid/model': (sinusoid_model, {'max_val': NAN, 'min_val': NAN, 'period': NAN, 'max_time': NAN}),
+    '/vector/operation': (vector_operation, {'op': VECTOR_OPERATIONS, 'ux': NAN, 'uy': NAN, 'vx': NAN, 'vy': NAN}),
+    '/vector/properties': (vector_properties, {'x': NAN, 'y': NAN}),
+    '/polar/to-rect': (_pair(polar_to_rect, 'x', 'y'), {'r': NAN, 'theta': NAN}),
+    '/polar/from-rect': (_pair(rect_to_polar, 'r', 'theta'), {'x': NAN, 'y': NAN}),
+    '/complex/operation': (_complex, {'op': COMPLEX_OPERATIONS, 'a': NAN, 'b': NAN, 'c': 0.0, 'd': 0.0}),
+    '/complex/de-moivre': (_pair(de_moivre, 'real', 'imag'), {'theta': NAN, 'n': NAN}),
+    '/parametric': (_pair(parametric_point, 'x', 'y'), {
+        'curve': PARAMETRIC_CURVES, 't': NAN, 'r': 5.0, 'a': 5.0, 'b': 3.0,
+        'p': 3.0, 'q': 2.0, 'delta': PI / 2,
+    }),
+    '/projectile': (projectile, {'v0': NAN, 'angle': NAN, 'h0': 0.0, 'g': 9.81}),
+    '/shm': (shm, {'A': NAN, 'omega': NAN, 'phi': 0.0, 't': NAN}),
+}
+
+
+def _argument(name, value, default):
+    """Convert one JSON parameter value according to its default."""
+    if isinstance(default, list):
+        if value is None:
+            return default[0]
+        if value not in default:
+            raise ValueError(f"'{name}' must be one of: {', '.join(default)}")
+        return value
+    if default is None:
+        if not isinstance(value, str):
+            raise ValueError(f"'{name}' must be a string")
+        return value
+    if value is None:
+        return default
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        return parse_number(value)
+    raise ValueError(f"'{name}' must be a number")
+
+
+def _jsonable(value):
+    """Results as JSON values: tuples become lists, NaN and ±inf become None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def call(path, params):
+    """Run one request against an endpoint: {'result': ...} or {'error': ...}."""
+    func, spec = ENDPOINTS[path]
+    if not isinstance(params, dict):
+        return {'error': "Each request must be a JSON object"}
+    unknown = params.keys() - spec.keys()
+    if unknown:
+        return {'error': f"Unknown parameter(s): {', '.join(sorted(unknown))}"}
+    try:
+        kwargs = {name: _argument(name, params.get(name), default)
+                  for name, default in spec.items()}
+        return {'result': _jsonable(func(**kwargs))}
+    except (ValueError, ZeroDivisionError, OverflowError) as e:
+        return {'error': str(e) or type(e).__name__}
+    except RecursionError:
+        return {'error': "Expression is nested too deeply."}
+
+
+def _index():
+    return {
+        path: {name: default if not isinstance(default, float) or not math.isnan(default) else None
+               for name, default in spec.items()}
+        for path, (_, spec) in ENDPOINTS.items()
+    }
+
+
+def handle(method, path, body):
+    """Route one HTTP request; returns (status, JSON-serializable body)."""
+    if path in ('/', ''):
+        if method != 'GET':
+            return 405, {'error': "Use GET"}
+        return 200, {'endpoints': _index(), 'max_batch': MAX_BATCH}
+    if path not in ENDPOINTS:
+        return 404, {'error': f"No endpoint {path}"}
+    if method != 'POST':
+        return 405, {'error': "Use POST"}
+
+    try:
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return 400, {'error': "Body must be JSON"}
+    except RecursionError:
+        return 400, {'error': "JSON is nested too deeply"}
+
+    if isinstance(payload, list):
+        if len(payload) > MAX_BATCH:
+            return 413, {'error': f"At most {MAX_BATCH} requests per batch"}
+        return 200, [call(path, params) for params in payload]
+    response = call(path, payload)
+    return (422 if 'error' in response else 200), response
+
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def app(scope, receive, send):
+    """The ASGI application."""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        return
+
+    body = await _read_body(receive)
+    if body is None:
+        status, response = 413, {'error': f"Body larger than {MAX_BODY_BYTES} bytes"}
+    else:
+        status, response = handle(scope['method'], scope['path'].rstrip('/') or '/', body)
+
+    data = json.dumps(response, ensure_ascii=False, allow_nan=False).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json; charset=utf-8'),
+            (b'content-length', str(len(data)).encode()),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': data})
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m trigcalc.api',
+                                     description="Serve the calculator JSON API with uvicorn.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("Serving needs uvicorn: pip install uvicorn") from None
+    uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,597 @@
+"""Vectorized NumPy versions of the solvers for batch workloads.
+
+Inputs are column arrays (anything ``np.asarray`` accepts). Missing values
+are NaN, as in the scalar solvers. Invalid rows never raise: their outputs
+are NaN and the ``error`` column holds one of the ``ERR_*`` codes below,
+which correspond one-to-one with the scalar solver's error messages.
+"""
+
+import numpy as np
+
+from .functions import TRIG_FUNCTIONS
+from .tables import table_sin_cos
+from .triangles import OBLIQUE_CASES
+from .utils import PI
+
+ERR_OK = 0
+ERR_MISSING = 1
+ERR_ANGLE_SUM = 2
+ERR_NO_SOLUTION = 3
+ERR_ANGLES_EXCEED = 4
+ERR_DEGENERATE = 5
+ERR_INEQUALITY = 6
+ERR_UNKNOWN_CASE = 7
+ERR_NO_SIDE = 8
+ERR_TOO_FEW = 9
+ERR_A_NOT_LEG = 10
+ERR_B_NOT_LEG = 11
+ERR_NO_COMPONENTS = 12
+ERR_OUT_OF_RANGE = 13
+
+ERROR_MESSAGES = {
+    ERR_OK: "",
+    ERR_MISSING: "Please enter all values.",
+    ERR_ANGLE_SUM: "Angles A + B must be less than 180°",
+    ERR_NO_SOLUTION: "No solution exists (sin B > 1)",
+    ERR_ANGLES_EXCEED: "No valid triangle (angles sum exceeds 180°)",
+    ERR_DEGENERATE: "Invalid triangle configuration",
+    ERR_INEQUALITY: "Invalid triangle: sum of any two sides must be greater than the third",
+    ERR_UNKNOWN_CASE: "Unknown case",
+    ERR_NO_SIDE: "At least one side is required.",
+    ERR_TOO_FEW: "Please provide at least two values.",
+    ERR_A_NOT_LEG: "Side a must be less than hypotenuse c",
+    ERR_B_NOT_LEG: "Side b must be less than hypotenuse c",
+    ERR_NO_COMPONENTS: "Please enter both components.",
+    ERR_OUT_OF_RANGE: "No solution: k is outside the range of the function",
+}
+
+RIGHT_COLUMNS = ['a', 'b', 'c', 'A', 'B', 'area']
+OBLIQUE_COLUMNS = ['a', 'b', 'c', 'A', 'B', 'C', 'area']
+VECTOR_COLUMNS = ['x', 'y', 'magnitude', 'direction', 'unit_x', 'unit_y']
+PROJECTILE_COLUMNS = ['v0x', 'v0y', 't_max', 'max_height', 'total_time', 'range']
+
+# How trig_functions_batch gets sin and cos: NumPy or the lookup tables
+TRIG_METHODS = ['numpy', 'table']
+
+# The most solutions solve_equation_batch will return in one call
+MAX_SOLUTIONS = 50_000_000
+
+# Sweep axes in grid order, and the largest grid projectile_sweep will build
+PROJECTILE_AXES = ('v0', 'angle', 'h0', 'g')
+MAX_SWEEP_CELLS = 1_000_000
+
+# Rows of solve_oblique_batch solved per pass, so that temporaries stay in cache
+OBLIQUE_BLOCK_ROWS = 1 << 16
+
+TRIANGLE_DTYPE = np.dtype([(name, np.float64) for name in OBLIQUE_COLUMNS])
+
+# One fixed-width record per SSA input: up to two solved triangles, with
+# unused slots left as NaN
+SSA_DTYPE = np.dtype([
+    ('count', np.int8),
+    ('error', np.int8),
+    ('solutions', TRIANGLE_DTYPE, (2,)),
+])
+
+
+def _to_radians(degrees):
+    # Same operation order as utils.to_radians so results match bit for bit
+    return degrees * PI / 180
+
+
+def _to_degrees(radians):
+    return radians * 180 / PI
+
+
+def _sin(degrees):
+    """np.sin(_to_radians(degrees)) in a single temporary."""
+    radians = degrees * PI
+    radians /= 180
+    return np.sin(radians, out=radians)
+
+
+def _column(values, n):
+    """Float64 column of length n; None means the value is not given."""
+    if values is None:
+        return np.full(n, np.nan)
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), (n,))
+
+
+def case_codes(cases):
+    """Map case names ('AAS', 'SSS', ...) to their index in OBLIQUE_CASES.
+
+    Unknown names map to -1.
+    """
+    cases = np.asarray(cases)
+    if cases.dtype.kind in 'iu':
+        return cases.astype(np.int64)
+    codes = np.full(cases.shape, -1, dtype=np.int64)
+    for code, name in enumerate(OBLIQUE_CASES):
+        codes[cases == name] = code
+    return codes
+
+
+def _error_codes(missing, checks):
+    """int8 error codes: ERR_MISSING where ``missing``, else the first failing check."""
+    failed, code = checks[-1]
+    err = failed.view(np.int8) * np.int8(code)
+    for failed, code in reversed(checks[:-1]):
+        err = np.where(failed, np.int8(code), err)
+    if missing.any():
+        err[missing] = ERR_MISSING
+    return err
+
+
+def _solve_aas(A, B, a):
+    err = _error_codes(np.isnan(A) | np.isnan(B) | np.isnan(a),
+                       [(A + B >= 180, ERR_ANGLE_SUM)])
+    C = 180 - A - B
+    ratio = a / _sin(A)
+    b = _sin(B)
+    b *= ratio
+    c = _sin(C)
+    c *= ratio
+    return a, b, c, A, B, C, err
+
+
+def _solve_asa(A, B, c):
+    err = _error_codes(np.isnan(A) | np.isnan(B) | np.isnan(c),
+                       [(A + B >= 180, ERR_ANGLE_SUM)])
+    C = 180 - A - B
+    ratio = c / _sin(C)
+    a = _sin(A)
+    a *= ratio
+    b = _sin(B)
+    b *= ratio
+    return a, b, c, A, B, C, err
+
+
+def _solve_ssa(a, b, A):
+    sin_A = _sin(A)
+    sin_B = b * sin_A / a
+    B = _to_degrees(np.arcsin(np.minimum(sin_B, 1)))
+    C = 180 - A - B
+    c = _sin(C)
+    c *= a
+    c /= sin_A
+    err = _error_codes(np.isnan(a) | np.isnan(b) | np.isnan(A),
+                       [(sin_B > 1, ERR_NO_SOLUTION), (C <= 0, ERR_ANGLES_EXCEED)])
+    return a, b, c, A, B, C, err
+
+
+def _solve_sas(a, b, C):
+    c = np.sqrt(a*a + b*b - 2*a*b*np.cos(_to_radians(C)))
+    cos_A = np.clip((b*b + c*c - a*a) / (2*b*c), -1, 1)
+    A = _to_degrees(np.arccos(cos_A))
+    B = 180 - A - C
+    err = _error_codes(np.isnan(a) | np.isnan(b) | np.isnan(C),
+                       [(c < 1e-10, ERR_DEGENERATE)])
+    return a, b, c, A, B, C, err
+
+
+def _solve_sss(a, b, c):
+    cos_A = np.clip((b*b + c*c - a*a) / (2*b*c), -1, 1)
+    cos_B = np.clip((a*a + c*c - b*b) / (2*a*c), -1, 1)
+    A = _to_degrees(np.arccos(cos_A))
+    B = _to_degrees(np.arccos(cos_B))
+    C = 180 - A - B
+    err = _error_codes(np.isnan(a) | np.isnan(b) | np.isnan(c),
+                       [((a + b <= c) | (a + c <= b) | (b + c <= a), ERR_INEQUALITY)])
+    return a, b, c, A, B, C, err
+
+
+_CASE_SOLVERS = {
+    "AAS": (_solve_aas, ('A', 'B', 'a')),
+    "ASA": (_solve_asa, ('A', 'B', 'c')),
+    "SSA": (_solve_ssa, ('a', 'b', 'A')),
+    "SAS": (_solve_sas, ('a', 'b', 'C')),
+    "SSS": (_solve_sss, ('a', 'b', 'c')),
+}
+
+
+def solve_right_batch(a=None, b=None, c=None, A=None, B=None):
+    """Solve many right triangles (C = 90°) at once.
+
+    Each row may give a different pair of values, as with
+    ``solve_right_triangle``. Returns a dict of float64 arrays for a, b, c,
+    A, B and area plus an int8 ``error`` array; rows with a non-zero error
+    code are NaN in every other column.
+    """
+    known = {'a': a, 'b': b, 'c': c, 'A': A, 'B': B}
+    n = max([np.size(v) for v in known.values() if v is not None] + [0])
+    known = {k: _column(v, n) for k, v in known.items()}
+    has = {k: ~np.isnan(v) for k, v in known.items()}
+    sides = has['a'].view(np.int8) + has['b'].view(np.int8) + has['c'].view(np.int8)
+    angles = has['A'].view(np.int8) + has['B'].view(np.int8)
+
+    out = {name: np.array(known[name]) for name in RIGHT_COLUMNS[:5]}
+    error = np.where(sides == 0, np.int8(ERR_NO_SIDE),
+                     np.where(sides + angles < 2, np.int8(ERR_TOO_FEW), np.int8(ERR_OK)))
+
+    with np.errstate(all='ignore'):
+        # Two or more sides: the third side, then the angles from a / c
+        two = sides >= 2
+        ab = np.flatnonzero(two & has['a'] & has['b'])
+        ac = np.flatnonzero(two & has['a'] & ~has['b'])
+        bc = np.flatnonzero(two & ~has['a'])
+        a_, b_ = known['a'][ab], known['b'][ab]
+        out['c'][ab] = np.sqrt(a_*a_ + b_*b_)
+        a_, c_ = known['a'][ac], known['c'][ac]
+        out['b'][ac] = np.sqrt(c_*c_ - a_*a_)
+        error[ac[a_ >= c_]] = ERR_A_NOT_LEG
+        b_, c_ = known['b'][bc], known['c'][bc]
+        out['a'][bc] = np.sqrt(c_*c_ - b_*b_)
+        error[bc[b_ >= c_]] = ERR_B_NOT_LEG
+        rows = np.flatnonzero(two)
+        A_ = _to_degrees(np.arcsin(np.clip(out['a'][rows] / out['c'][rows], -1, 1)))
+        out['A'][rows] = A_
+        out['B'][rows] = 90 - A_
+
+        # One side and an angle: the other angle, then the two missing sides
+        one = (sides == 1) & (angles >= 1)
+        rows = np.flatnonzero(one)
+        A_ = np.where(has['A'][rows], known['A'][rows], 90 - known['B'][rows])
+        out['A'][rows] = A_
+        out['B'][rows] = 90 - A_
+        for side in 'abc':
+            sub = np.flatnonzero(has[side][rows])
+            idx = rows[sub]
+            A_rad = _to_radians(A_[sub])
+            value = known[side][idx]
+            if side == 'a':
+                out['c'][idx] = value / np.sin(A_rad)
+                out['b'][idx] = value / np.tan(A_rad)
+            elif side == 'b':
+                out['c'][idx] = value / np.cos(A_rad)
+                out['a'][idx] = value * np.tan(A_rad)
+            else:
+                out['a'][idx] = value * np.sin(A_rad)
+                out['b'][idx] = value * np.cos(A_rad)
+
+        out['area'] = 0.5 * out['a'] * out['b']
+
+    bad = np.flatnonzero(error)
+    for col in RIGHT_COLUMNS:
+        out[col][bad] = np.nan
+    out['error'] = error
+    return out
+
+
+def projectile_batch(v0, angle, h0=0, g=9.81):
+    """Vectorized ``projectile``; the arguments broadcast against each other.
+
+    Returns a dict of PROJECTILE_COLUMNS arrays. A launch from below the
+    ground (h0 < 0) that never climbs back to y = 0 has a negative
+    discriminant: its total_time and range are NaN rather than an error.
+    """
+    angle_rad = _to_radians(np.asarray(angle, dtype=np.float64))
+    v0x = v0 * np.cos(angle_rad)
+    v0y = v0 * np.sin(angle_rad)
+
+    discriminant = v0y * v0y + 2 * g * h0
+    with np.errstate(invalid='ignore'):
+        root = np.sqrt(discriminant)  # NaN where discriminant < 0
+    total_time = (v0y + root) / g
+
+    return {
+        'v0x': v0x,
+        'v0y': v0y,
+        't_max': v0y / g,
+        'max_height': h0 + (v0y * v0y) / (2 * g),
+        'total_time': total_time,
+        'range': v0x * total_time,
+    }
+
+
+def projectile_sweep(v0, angle, h0=(0, 0, 1), g=(9.81, 9.81, 1)):
+    """``projectile`` over the full grid of four parameter ranges.
+
+    Each argument is a (start, stop, points) range as for ``np.linspace``.
+    Returns the sweep values per axis under their names and the
+    PROJECTILE_COLUMNS results as arrays of shape (v0, angle, h0, g), in
+    the order of PROJECTILE_AXES, computed by broadcasting one open grid.
+    """
+    ranges = dict(zip(PROJECTILE_AXES, (v0, angle, h0, g)))
+    values = {}
+    for name, (start, stop, points) in ranges.items():
+        if not (np.isfinite(start) and np.isfinite(stop)) or points < 1:
+            raise ValueError(f"Please enter a valid range for {name}.")
+        values[name] = np.linspace(start, stop, int(points))
+    if np.prod([len(v) for v in values.values()]) > MAX_SWEEP_CELLS:
+        raise ValueError(f"The sweep grid is limited to {MAX_SWEEP_CELLS:,} points.")
+    if (values['g'] <= 0).any():
+        raise ValueError("Gravity must be positive.")
+
+    shape = tuple(len(v) for v in values.values())
+    result = projectile_batch(*np.ix_(*values.values()))
+    result = {name: np.broadcast_to(column, shape) for name, column in result.items()}
+    result.update(values)
+    return result
+
+
+def heron_area_batch(a, b, c):
+    """Vectorized Heron's formula."""
+    s = (a + b + c) / 2
+    area = s * (s-a)
+    area *= s-b
+    area *= s-c
+    return np.sqrt(area, out=area)
+
+
+def solve_oblique_batch(case, a=None, b=None, c=None, A=None, B=None, C=None):
+    """Solve many oblique triangles at once.
+
+    ``case`` is either one case name for every row or a per-row array of
+    case names or codes (see ``case_codes``). Returns a dict of float64
+    arrays for a, b, c, A, B, C and area plus an int8 ``error`` array. Rows
+    with a non-zero error code are NaN in every other column.
+
+    Valid rows use the same formulas and operation order as
+    ``solve_oblique``. NumPy's arcsin/arccos may differ from ``math`` in the
+    last bit, so the SSA/SAS/SSS angles (and anything derived from them) can
+    differ by a few ulps; an SSA row sitting exactly on the C = 0 boundary
+    may therefore be classified differently.
+    """
+    known = {'a': a, 'b': b, 'c': c, 'A': A, 'B': B, 'C': C}
+    n = max([np.size(v) for v in known.values() if v is not None] + [np.size(case)])
+    known = {k: _column(v, n) for k, v in known.items()}
+
+    # Every case passes its three inputs through unchanged, so start from
+    # copies of the inputs and only write the three values each case solves.
+    out = {name: np.array(known[name]) for name in OBLIQUE_COLUMNS[:6]}
+    out['area'] = np.empty(n)
+    error = np.full(n, ERR_UNKNOWN_CASE, dtype=np.int8)
+
+    codes = None if isinstance(case, str) else np.broadcast_to(case_codes(case), (n,))
+
+    # Branch per case, never per row: each case solves its rows of a block
+    # in one pass. Blocks keep the temporaries in cache, and integer row
+    # indices rather than boolean masks keep the gathers cheap.
+    with np.errstate(all='ignore'):
+        for start in range(0, n, OBLIQUE_BLOCK_ROWS):
+            stop = min(start + OBLIQUE_BLOCK_ROWS, n)
+            if codes is None:
+                groups = [(case, slice(start, stop))] if case in _CASE_SOLVERS else []
+            else:
+                block = codes[start:stop]
+                groups = [(name, np.flatnonzero(block == code) + start)
+                          for code, name in enumerate(OBLIQUE_CASES)]
+            for name, rows in groups:
+                solver, args = _CASE_SOLVERS[name]
+                solved = solver(*(known[k][rows] for k in args))
+                for col, values in zip(OBLIQUE_COLUMNS, solved[:6]):
+                    if col not in args:
+                        out[col][rows] = values
+                out['area'][rows] = heron_area_batch(*solved[:3])
+                error[rows] = solved[6]
+
+            bad = np.flatnonzero(error[start:stop]) + start
+            for col in OBLIQUE_COLUMNS:
+                out[col][bad] = np.nan
+
+    out['error'] = error
+    return out
+
+
+def solve_ssa_batch(a, b, A):
+    """Solve many SSA inputs, including the second triangle of the ambiguous case.
+
+    Returns a structured array of ``SSA_DTYPE``: ``count`` is the number of
+    triangles (0, 1 or 2), ``error`` is the reason for a count of 0, and
+    ``solutions[:, 0]`` / ``solutions[:, 1]`` hold the solved triangles.
+    The first solution is the one ``solve_oblique('SSA', ...)`` returns
+    (acute B); the second uses B2 = 180° - B.
+    """
+    n = max(np.size(a), np.size(b), np.size(A))
+    a, b, A = (_column(v, n) for v in (a, b, A))
+
+    with np.errstate(all='ignore'):
+        a, b, c, A, B, C, err = _solve_ssa(a, b, A)
+        B2 = 180 - B
+        C2 = 180 - A - B2
+        c2 = a * np.sin(_to_radians(C2)) / np.sin(_to_radians(A))
+        first = (a, b, c, A, B, C, heron_area_batch(a, b, c))
+        second = (a, b, c2, A, B2, C2, heron_area_batch(a, b, c2))
+
+    one = err == ERR_OK
+    two = one & (C2 > 0) & (B2 != B)
+
+    out = np.empty(n, dtype=SSA_DTYPE)
+    out['count'] = one.view(np.int8) + two.view(np.int8)
+    out['error'] = err
+    for slot, values, ok in ((0, first, one), (1, second, two)):
+        triangles = out['solutions'][:, slot]
+        for col, column in zip(OBLIQUE_COLUMNS, values):
+            triangles[col] = np.where(ok, column, np.nan)
+    return out
+
+
+def vector_properties_batch(x, y):
+    """Vectorized ``vector_properties``: magnitude, direction (radians) and unit vector.
+
+    Returns a dict of float64 arrays for x, y, magnitude, direction, unit_x
+    and unit_y plus an int8 ``error`` array.
+    """
+    n = max([np.size(v) for v in (x, y) if v is not None] + [0])
+    x, y = _column(x, n), _column(y, n)
+    missing = np.isnan(x) | np.isnan(y)
+
+    with np.errstate(all='ignore'):
+        mag = np.sqrt(x*x + y*y)
+        zero = ~(mag > 1e-10)
+        unit_x = np.where(zero, 0.0, x / mag)
+        unit_y = np.where(zero, 0.0, y / mag)
+        out = {'x': np.array(x), 'y': np.array(y), 'magnitude': mag,
+               'direction': np.arctan2(y, x), 'unit_x': unit_x, 'unit_y': unit_y}
+
+    error = missing.view(np.int8) * np.int8(ERR_NO_COMPONENTS)
+    bad = np.flatnonzero(missing)
+    for col in VECTOR_COLUMNS:
+        out[col][bad] = np.nan
+    out['error'] = error
+    return out
+
+
+def trig_functions_batch(angles, degrees=False, functions=TRIG_FUNCTIONS, method='numpy'):
+    """Vectorized ``evaluate_trig``: a dense table of trig functions over many angles.
+
+    sin and cos are evaluated once for all angles and every other function
+    is divided out of them (tan = sin/cos, csc = 1/sin, ...) straight into
+    its column with ``np.divide(..., where=defined)``. With
+    ``method='table'`` sin and cos come from ``trigcalc.tables``.
+
+    Returns a dict with the (angles, functions) float64 ``values``, a
+    boolean ``undefined`` mask of the same shape and the ``functions`` in
+    column order. Entries are undefined (and NaN) where, as in
+    ``evaluate_trig``, the sine or cosine divided by is within 1e-10 of
+    zero, and for NaN angles.
+    """
+    functions = list(functions)
+    unknown = [name for name in functions if name not in TRIG_FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Unknown function: {unknown[0]}")
+    if method not in TRIG_METHODS:
+        raise ValueError(f"Unknown method: {method}")
+    angles = np.asarray(angles, dtype=np.float64).ravel()
+
+    if method == 'table':
+        sin, cos = table_sin_cos(angles if degrees else _to_degrees(angles))
+    else:
+        radians = _to_radians(angles) if degrees else angles
+        sin, cos = np.sin(radians), np.cos(radians)
+
+    with np.errstate(invalid='ignore'):
+        sin_defined = ~(np.abs(sin) < 1e-10)
+        cos_defined = ~(np.abs(cos) < 1e-10)
+    # Fortran order keeps each function's column contiguous for out=
+    values = np.full((len(angles), len(functions)), np.nan, order='F')
+    for j, name in enumerate(functions):
+        column = values[:, j]
+        if name == 'sin':
+            column[:] = sin
+        elif name == 'cos':
+            column[:] = cos
+        elif name == 'tan':
+            np.divide(sin, cos, out=column, where=cos_defined)
+        elif name == 'csc':
+            np.divide(1.0, sin, out=column, where=sin_defined)
+        elif name == 'sec':
+            np.divide(1.0, cos, out=column, where=cos_defined)
+        else:
+            np.divide(cos, sin, out=column, where=sin_defined)
+    return {'values': values, 'undefined': np.isnan(values), 'functions': functions}
+
+
+def solution_families(func, k):
+    """Principal solutions (radians) of f(θ) = k and their period.
+
+    Returns (first, second, period, out_of_range): every solution is
+    first + period·n or second + period·n. ``second`` is NaN where f has
+    one solution per period (tan, cot, and sin or cos at their extremes).
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if func in ('csc', 'sec'):
+            # csc θ = k is sin θ = 1/k; k = 0 gives ±inf, which is out of range below
+            func, k = {'csc': 'sin', 'sec': 'cos'}[func], 1 / k
+        if func == 'sin':
+            first = np.arcsin(k)
+            second = np.where(np.abs(k) == 1, np.nan, PI - first)
+        elif func == 'cos':
+            first = np.arccos(k)
+            second = np.where(np.abs(k) == 1, np.nan, -first)
+        elif func == 'tan':
+            return np.arctan(k), np.full_like(k, np.nan), PI, np.zeros(len(k), dtype=bool)
+        elif func == 'cot':
+            return PI / 2 - np.arctan(k), np.full_like(k, np.nan), PI, np.zeros(len(k), dtype=bool)
+        else:
+            raise ValueError(f"Unknown function: {func}")
+    return first, second, 2 * PI, np.abs(k) > 1
+
+
+def family_solutions(first, second, period, lo, hi, closed=False):
+    """Members of the families first + period·n and second + period·n in [lo, hi).
+
+    ``first`` and ``second`` are arrays, one pair of families per row
+    (``second`` NaN for none); ``period`` is shared. Returns the ragged
+    ``values``, ``offsets`` and ``counts`` described in
+    ``solve_equation_batch``, each row in ascending order.
+    """
+    # The first solution of each family at or after lo, and how many fit before hi
+    firsts, counts = [], []
+    with np.errstate(invalid='ignore'):
+        for base in (first, second):
+            start = base + np.ceil((lo - base) / period) * period
+            last = np.floor((hi - start) / period) if closed else np.ceil((hi - start) / period) - 1
+            firsts.append(start)
+            counts.append(np.where(np.isnan(start), 0, np.maximum(last + 1, 0)).astype(np.int64))
+    count = counts[0] + counts[1]
+    # Both families have the same period, so their solutions alternate from the smaller start
+    swap = counts[1] > counts[0]
+    swap |= (counts[1] == counts[0]) & (firsts[1] < firsts[0])
+    low = np.where(swap, firsts[1], firsts[0])
+    high = np.where(swap, firsts[0], firsts[1])
+    families = np.where(counts[1] > 0, 2, 1)
+
+    total = int(count.sum())
+    if total > MAX_SOLUTIONS:
+        raise ValueError(f"At most {MAX_SOLUTIONS:,} solutions at once; narrow the interval.")
+    offsets = np.zeros(len(count) + 1, dtype=np.int64)
+    np.cumsum(count, out=offsets[1:])
+    row = np.repeat(np.arange(len(count)), count)
+    j = np.arange(total) - offsets[:-1][row]
+    step, family = np.divmod(j, families[row])
+    values = np.where(family == 0, low[row], high[row]) + step * period
+    return {'values': values, 'offsets': offsets, 'counts': count}
+
+
+def solve_equation_batch(func, k, lo, hi, degrees=False, closed=False):
+    """Every solution of f(θ) = k in [lo, hi) for an array of k values.
+
+    ``func`` is one of the six trig functions; ``lo`` and ``hi`` are in
+    degrees or radians like the solutions. With ``closed`` the interval is
+    [lo, hi]. Solutions are not searched for: each family base + period·n
+    from the principal values is counted into the interval arithmetically
+    and written out in ascending order.
+
+    Returns a ragged array: the solutions of equation i are
+    ``values[offsets[i]:offsets[i + 1]]``, with ``counts`` and an int8
+    ``error`` per equation (ERR_MISSING for NaN k, ERR_OUT_OF_RANGE when f
+    never reaches k). A k with no solution in the interval is not an error.
+    """
+    if func not in TRIG_FUNCTIONS:
+        raise ValueError(f"Unknown function: {func}")
+    if not (np.isfinite(lo) and np.isfinite(hi)) or hi < lo or (hi == lo and not closed):
+        raise ValueError("Enter an interval with start < end.")
+    k = np.atleast_1d(np.asarray(k, dtype=np.float64)).ravel()
+    first, second, period, out_of_range = solution_families(func, k)
+    if degrees:
+        first, second, period = _to_degrees(first), _to_degrees(second), 360 if period == 2 * PI else 180
+
+    solved = family_solutions(first, second, period, lo, hi, closed)
+    solved['error'] = np.where(np.isnan(k), np.int8(ERR_MISSING),
+                               np.where(out_of_range, np.int8(ERR_OUT_OF_RANGE), np.int8(ERR_OK)))
+    return solved
+
+
+# Batch kind -> (input columns, output columns). The inputs are always the
+# leading output columns.
+BATCH_KINDS = {
+    'right': (RIGHT_COLUMNS[:5], RIGHT_COLUMNS),
+    'oblique': (OBLIQUE_COLUMNS[:6], OBLIQUE_COLUMNS),
+    'vector': (VECTOR_COLUMNS[:2], VECTOR_COLUMNS),
+}
+
+
+def solve_batch(kind, columns, case=None):
+    """Run the batch solver for ``kind`` ('right', 'oblique' or 'vector').
+
+    ``columns`` maps input names to arrays (absent names are not given);
+    ``case`` is the oblique case (see ``solve_oblique_batch``).
+    """
+    inputs, _ = BATCH_KINDS[kind]
+    args = {name: columns.get(name) for name in inputs}
+    if kind == 'right':
+        return solve_right_batch(**args)
+    if kind == 'oblique':
+        return solve_oblique_batch(case, **args)
+    return vector_properties_batch(**args)
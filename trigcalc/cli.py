@@ -0,0 +1,209 @@
+"""Command-line batch solver for files of triangles and vectors.
+
+Usage:
+    python -m trigcalc right INPUT OUTPUT [--chunk-size ROWS] [--workers N]
+    python -m trigcalc oblique INPUT OUTPUT [--case SSS] [...]
+    python -m trigcalc vector INPUT OUTPUT [...]
+
+INPUT and OUTPUT are .csv or .parquet files (the formats may differ).
+Input columns are named like the app's fields: a, b, c, A, B (and C for
+oblique triangles) or x, y for vectors; absent columns and empty cells
+count as not given. Oblique rows take their case from ``--case`` or else
+from a ``case`` column. Other columns (ids and the like) are copied
+through unchanged.
+
+The file is streamed in chunks of ``--chunk-size`` rows through the
+``trigcalc.batch`` solvers, so memory use does not grow with the file.
+``--workers N`` solves each chunk on N processes (``trigcalc.parallel``).
+Each output row holds the solved values (the given values, or empty,
+where unsolved) and an ``error`` code (see ``trigcalc.batch.ERROR_MESSAGES``; 0 means solved).
+Requires pyarrow, which is installed with Streamlit.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .batch import ERR_OK, ERROR_MESSAGES, BATCH_KINDS, solve_batch
+from .parallel import ParallelSolver
+from .triangles import OBLIQUE_CASES
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+CSV_BLOCK_SIZE = 4 << 20  # bytes of CSV text parsed per read
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.parquet
+    except ImportError:
+        raise SystemExit("Batch files need pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+
+def _file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    raise SystemExit(f"Unsupported file type '{ext}' (use .csv or .parquet)")
+
+
+def read_chunks(path, columns, chunk_size):
+    """Yield record batches of at most chunk_size rows from a CSV or Parquet file.
+
+    ``columns`` are read as float64 whatever their inferred type, so a
+    column that happens to be empty in one block stays numeric. A file
+    with no rows yields one empty batch, so that its schema is known.
+    """
+    pa = _import_pyarrow()
+    if _file_format(path) == 'parquet':
+        source = pa.parquet.ParquetFile(path)
+        schema = source.schema_arrow
+        batches = source.iter_batches(batch_size=chunk_size)
+    else:
+        types = {name: pa.float64() for name in columns}
+        types['case'] = pa.string()
+        source = pa.csv.open_csv(
+            path,
+            read_options=pa.csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pa.csv.ConvertOptions(column_types=types),
+        )
+        schema = source.schema
+        batches = (batch.slice(offset, chunk_size) for batch in source
+                   for offset in range(0, batch.num_rows, chunk_size))
+
+    empty = True
+    for batch in batches:
+        empty = False
+        yield batch
+    if empty:
+        yield pa.RecordBatch.from_pylist([], schema=schema)
+
+
+class _Writer:
+    """Appends record batches to a CSV or Parquet file opened on first write."""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = _file_format(path)
+        self.writer = None
+
+    def write(self, batch):
+        pa = _import_pyarrow()
+        if self.writer is None:
+            if self.format == 'parquet':
+                self.writer = pa.parquet.ParquetWriter(self.path, batch.schema)
+            else:
+                self.writer = pa.csv.CSVWriter(self.path, batch.schema)
+        self.writer.write_batch(batch)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _column(batch, name):
+    """Float64 NumPy view of a batch column (nulls as NaN), or None if absent."""
+    index = batch.schema.get_field_index(name)
+    if index < 0:
+        return None
+    return batch.column(index).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+
+
+def solve_chunk(kind, batch, case=None, solver=None):
+    """Solve one record batch; returns (output batch, error codes).
+
+    Solved columns replace the input columns of the same name, keeping the
+    given value in rows that were not solved; every other input column is
+    kept in front of them. ``solver`` is an optional ``ParallelSolver`` to
+    spread the rows over.
+    """
+    pa = _import_pyarrow()
+    inputs, outputs = BATCH_KINDS[kind]
+    if kind == 'oblique' and case is None:
+        index = batch.schema.get_field_index('case')
+        case = (batch.column(index).to_numpy(zero_copy_only=False)
+                if index >= 0 else np.full(batch.num_rows, ''))
+    columns = {name: _column(batch, name) for name in inputs}
+    if all(values is None for values in columns.values()):
+        columns[inputs[0]] = np.full(batch.num_rows, np.nan)
+    solve = solve_batch if solver is None else solver.solve
+    result = solve(kind, columns, case=case)
+
+    replaced = set(outputs) | {'error'}
+    names = [name for name in batch.schema.names if name not in replaced]
+    arrays = [batch.column(name) for name in names]
+    for name in outputs + ['error']:
+        values = result[name]
+        if columns.get(name) is not None:
+            values = np.where(np.isnan(values), columns[name], values)
+        names.append(name)
+        arrays.append(pa.array(values, from_pandas=True))
+    return pa.RecordBatch.from_arrays(arrays, names=names), result['error']
+
+
+def solve_file(kind, src, dst, case=None, chunk_size=DEFAULT_CHUNK_SIZE, workers=1):
+    """Stream src through the batch solver into dst.
+
+    With ``workers`` > 1 each chunk is solved across that many processes
+    (see ``trigcalc.parallel``). Returns (rows, error_counts) where
+    error_counts maps error codes to the number of rows with that code.
+    """
+    inputs, _ = BATCH_KINDS[kind]
+    writer = _Writer(dst)
+    solver = ParallelSolver(workers) if workers > 1 else None
+    rows = 0
+    counts = np.zeros(len(ERROR_MESSAGES), dtype=np.int64)
+    try:
+        for batch in read_chunks(src, inputs, chunk_size):
+            solved, error = solve_chunk(kind, batch, case, solver)
+            writer.write(solved)
+            counts += np.bincount(error, minlength=len(counts))
+            rows += batch.num_rows
+    finally:
+        writer.close()
+        if solver is not None:
+            solver.close()
+    return rows, {code: int(n) for code, n in enumerate(counts) if n}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m trigcalc',
+        description="Solve a CSV or Parquet file of triangles in chunks.",
+    )
+    parser.add_argument('kind', choices=list(BATCH_KINDS), help="solver to use")
+    parser.add_argument('input', help="input .csv or .parquet file")
+    parser.add_argument('output', help="output .csv or .parquet file")
+    parser.add_argument('--case', choices=OBLIQUE_CASES,
+                        help="oblique case for every row (default: the 'case' column)")
+    parser.add_argument('--chunk-size', type=int,
+                        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE} per worker)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes to solve each chunk with (default 1)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+    if args.chunk_size is None:
+        args.chunk_size = DEFAULT_CHUNK_SIZE * args.workers
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    start = time.perf_counter()
+    rows, counts = solve_file(args.kind, args.input, args.output, args.case,
+                              args.chunk_size, args.workers)
+    elapsed = time.perf_counter() - start
+
+    solved = counts.get(ERR_OK, 0)
+    print(f"{rows} rows in {elapsed:.2f} s ({rows / max(elapsed, 1e-9):,.0f} rows/s), "
+          f"{solved} solved", file=sys.stderr)
+    for code, n in sorted(counts.items()):
+        if code != ERR_OK:
+            print(f"  {n:>10} x error {code}: {ERROR_MESSAGES[code]}", file=sys.stderr)
+    return 0
@@ -0,0 +1,101 @@
+"""Exact values of the six trig functions at multiples of 15° and 18°.
+
+The table is keyed by the angle as a rational multiple of π in [0, 2), so
+``EXACT_VALUES[Fraction(1, 5)]['cos']`` is the exact form of cos(π/5). It
+is built once at import from the first-quadrant values below using the
+quadrant sign rules.
+"""
+
+import math
+from fractions import Fraction
+
+EXACT_FUNCTIONS = ('sin', 'cos', 'tan', 'csc', 'sec', 'cot')
+
+# Every tabulated angle is a multiple of 3° (the lcm grid of 15° and 18°)
+GRID_DEGREES = 3
+MATCH_TOLERANCE = 1e-9  # degrees
+
+# Reference angle (degrees) -> exact sin, cos, tan, csc, sec, cot
+_FIRST_QUADRANT = {
+    0: ('0', '1', '0', 'undefined', '1', 'undefined'),
+    15: ('√(2-√3)/2', '√(2+√3)/2', '2-√3', '√6+√2', '√6-√2', '2+√3'),
+    18: ('(√5-1)/4', '√(10+2√5)/4', '√(25-10√5)/5', '√5+1', '√(50-10√5)/5', '√(5+2√5)'),
+    30: ('1/2', '√3/2', '√3/3', '2', '2√3/3', '√3'),
+    36: ('√(10-2√5)/4', '(1+√5)/4', '√(5-2√5)', '√(50+10√5)/5', '√5-1', '√(25+10√5)/5'),
+    45: ('√2/2', '√2/2', '1', '√2', '√2', '1'),
+    54: ('(1+√5)/4', '√(10-2√5)/4', '√(25+10√5)/5', '√5-1', '√(50+10√5)/5', '√(5-2√5)'),
+    60: ('√3/2', '1/2', '√3', '2√3/3', '2', '√3/3'),
+    72: ('√(10+2√5)/4', '(√5-1)/4', '√(5+2√5)', '√(50-10√5)/5', '√5+1', '√(25-10√5)/5'),
+    75: ('√(2+√3)/2', '√(2-√3)/2', '2+√3', '√6-√2', '√6+√2', '2-√3'),
+    90: ('1', '0', 'undefined', '1', 'undefined', '0'),
+}
+
+
+def _negate(value):
+    """Exact form of -value, parenthesizing sums."""
+    if value in ('0', 'undefined'):
+        return value
+    depth = 0
+    for ch in value:
+        depth += ch == '('
+        depth -= ch == ')'
+        if depth == 0 and ch in '+-':
+            return f'-({value})'
+    return f'-{value}'
+
+
+def _signs(degrees):
+    """Signs of sin and cos in the quadrant of an angle in [0, 360)."""
+    sin_sign = -1 if degrees > 180 else 1
+    cos_sign = -1 if 90 < degrees < 270 else 1
+    return sin_sign, cos_sign
+
+
+def _build_table():
+    table = {}
+    for degrees in range(0, 360, GRID_DEGREES):
+        if degrees % 15 and degrees % 18:
+            continue
+        reference = min(degrees % 180, 180 - degrees % 180)
+        sin_sign, cos_sign = _signs(degrees)
+        signs = (sin_sign, cos_sign, sin_sign * cos_sign) * 2
+        values = {
+            func: value if sign > 0 else _negate(value)
+            for func, value, sign in zip(EXACT_FUNCTIONS, _FIRST_QUADRANT[reference], signs)
+        }
+        table[Fraction(degrees, 180)] = values
+    return table
+
+
+EXACT_VALUES = _build_table()
+
+# Grid index (degrees / 3 mod 120) -> table entry, for O(1) float lookup
+_BY_GRID = {int(multiple * 180) // GRID_DEGREES: values
+            for multiple, values in EXACT_VALUES.items()}
+
+
+def _grid_index(degrees):
+    """Index of the tabulated angle equal to degrees (within tolerance), or None."""
+    if not math.isfinite(degrees):
+        return None
+    steps = round(degrees / GRID_DEGREES)
+    if abs(degrees - steps * GRID_DEGREES) > MATCH_TOLERANCE:
+        return None
+    index = steps % (360 // GRID_DEGREES)
+    return index if index in _BY_GRID else None
+
+
+def exact_multiple(degrees):
+    """The angle as a Fraction of π in [0, 2) if it is in the exact table.
+
+    Only angles within MATCH_TOLERANCE degrees of a tabulated angle match,
+    so 30.4° is not mistaken for 30°.
+    """
+    index = _grid_index(degrees)
+    return None if index is None else Fraction(index * GRID_DEGREES, 180)
+
+
+def exact_value(degrees, func):
+    """Exact form of func at an angle in degrees, or None if not tabulated."""
+    index = _grid_index(degrees)
+    return None if index is None else _BY_GRID[index].get(func)
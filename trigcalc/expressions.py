@@ -0,0 +1,312 @@
+"""Safe arithmetic expression engine for numeric inputs (no ``eval``).
+
+Supports + - * / ^ (or **), parentheses, implicit multiplication ("2π",
+"3sqrt(2)", "2(x+1)"), √, the constants π/pi and e, and function calls
+("sin(x)", "sin x", "sin^2(x)" or "sin²(x)"). Text is parsed once into a small tuple AST
+and compiled into a chain of closures; both steps are LRU cached, so
+repeated evaluation of the same input does not re-parse.
+
+Implicit multiplication binds like ``*``, so "1/2π" is (1/2)·π.
+"""
+
+import functools
+import math
+import operator
+import re
+
+EXPRESSION_CACHE_SIZE = 1024
+# Deepest nesting of signs, parentheses, powers, calls and chained operators
+# the parser accepts, which keeps every AST well inside Python's recursion limit
+MAX_NESTING = 100
+
+CONSTANTS = {'π': math.pi, 'pi': math.pi, 'PI': math.pi, 'e': math.e}
+
+
+def _arccot(x):
+    if x == 0:
+        return math.pi / 2
+    result = math.atan(1 / x)
+    return result + math.pi if x < 0 else result
+
+
+FUNCTIONS = {
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'csc': lambda x: 1 / math.sin(x),
+    'sec': lambda x: 1 / math.cos(x),
+    'cot': lambda x: 1 / math.tan(x),
+    'arcsin': math.asin, 'arccos': math.acos, 'arctan': math.atan,
+    'arccsc': lambda x: math.asin(1 / x),
+    'arcsec': lambda x: math.acos(1 / x),
+    'arccot': _arccot,
+    'sinh': math.sinh, 'cosh': math.cosh, 'tanh': math.tanh,
+    'sqrt': math.sqrt, 'abs': abs, 'exp': math.exp,
+    'ln': math.log, 'log': math.log10,
+}
+for _name in ('sin', 'cos', 'tan', 'csc', 'sec', 'cot'):
+    FUNCTIONS['a' + _name] = FUNCTIONS['arc' + _name]
+
+BINARY_OPERATORS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul,
+    '/': operator.truediv, '^': math.pow,
+}
+
+_TOKEN_RE = re.compile(r'''\s*(?:
+    (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*|[α-ωΑ-Ω])
+  | (?P<op>\*\*|[-+*/^()√·×÷−])
+)''', re.VERBOSE)
+
+_OP_ALIASES = {'**': '^', '·': '*', '×': '*', '÷': '/', '−': '-'}
+_SUPERSCRIPTS = {'²': '^2', '³': '^3'}
+
+
+def tokenize(text):
+    """Split an expression into ('number' | 'name' | 'op', text) tokens."""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    for superscript, power in _SUPERSCRIPTS.items():
+        text = text.replace(superscript, power)
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ValueError(f"Unexpected character '{text[pos:].lstrip()[0]}'")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'op':
+            value = _OP_ALIASES.get(value, value)
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def _nested(method):
+    """Count a parser method's recursion depth and refuse to go past MAX_NESTING."""
+    @functools.wraps(method)
+    def parse_nested(self):
+        self.deeper()
+        node = method(self)
+        self.depth -= 1
+        return node
+    return parse_nested
+
+
+class _Parser:
+    """Recursive-descent parser producing tuple nodes.
+
+    Nodes are ('num', value), ('var', name), ('neg', x),
+    ('call', name, x) and (op, left, right) for op in + - * / ^.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = 0
+
+    def deeper(self):
+        # Each level of nesting is one more level of the AST
+        self.depth += 1
+        if self.depth > MAX_NESTING:
+            raise ValueError("Expression is nested too deeply.")
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            expected = f"'{value}'" if value else "a value"
+            raise ValueError(f"Expected {expected} at end of input" if token[0] is None
+                             else f"Expected {expected}, found '{token[1]}'")
+        self.pos += 1
+        return token
+
+    def starts_operand(self, allow_functions=True):
+        kind, value = self.peek()
+        if kind == 'number' or value in ('(', '√'):
+            return True
+        if kind == 'name':
+            return allow_functions or value.lower() not in FUNCTIONS
+        return False
+
+    def parse(self):
+        node = self.expression()
+        if self.peek()[0] is not None:
+            raise ValueError(f"Unexpected '{self.peek()[1]}'")
+        return node
+
+    def expression(self):
+        depth = self.depth
+        node = self.term()
+        while self.peek()[1] in ('+', '-'):
+            op = self.take()[1]
+            # "a + b + c" is left-deep, so a chain nests like parentheses
+            self.deeper()
+            node = (op, node, self.term())
+        self.depth = depth
+        return node
+
+    def term(self):
+        depth = self.depth
+        node = self.unary()
+        while True:
+            if self.peek()[1] in ('*', '/'):
+                op = self.take()[1]
+                self.deeper()
+                node = (op, node, self.unary())
+            elif self.starts_operand():
+                self.deeper()
+                node = ('*', node, self.power())
+            else:
+                self.depth = depth
+                return node
+
+    @_nested
+    def unary(self):
+        if self.peek()[1] == '-':
+            self.take()
+            return ('neg', self.unary())
+        if self.peek()[1] == '+':
+            self.take()
+            return self.unary()
+        return self.power()
+
+    @_nested
+    def power(self):
+        node = self.atom()
+        if self.peek()[1] == '^':
+            self.take()
+            node = ('^', node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('num', float(value))
+        if value == '(':
+            node = self.expression()
+            self.take(')')
+            return node
+        if value == '√':
+            return ('call', 'sqrt', self.unary())
+        if kind == 'name':
+            if value.lower() in FUNCTIONS:
+                return self.call(value.lower())
+            if value in CONSTANTS:
+                return ('num', CONSTANTS[value])
+            return ('var', value)
+        raise ValueError(f"Unexpected '{value}'")
+
+    def call(self, name):
+        # sin^2(x) means sin(x)^2
+        exponent = None
+        if self.peek()[1] == '^':
+            self.take()
+            exponent = self.atom()
+
+        if self.peek()[1] == '(':
+            self.take()
+            argument = self.expression()
+            self.take(')')
+        else:
+            # "sin 2x cos x" is sin(2x)·cos(x): a bare argument runs up to
+            # the next operator or function name
+            depth = self.depth
+            argument = self.power()
+            while self.starts_operand(allow_functions=False) and self.peek()[1] != '(':
+                self.deeper()
+                argument = ('*', argument, self.power())
+            self.depth = depth
+
+        node = ('call', name, argument)
+        return ('^', node, exponent) if exponent is not None else node
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def parse_expression(text):
+    """Parse expression text into a tuple AST (see ``_Parser``)."""
+    tokens = tokenize(text)
+    if not tokens:
+        raise ValueError("Empty expression")
+    return _Parser(tokens).parse()
+
+
+def free_variables(node):
+    """Names of the variables an AST refers to, in order of appearance."""
+    if node[0] == 'var':
+        return (node[1],)
+    if node[0] == 'num':
+        return ()
+    names = ()
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            names += tuple(n for n in free_variables(child) if n not in names)
+    return names
+
+
+def _compile(node, variables):
+    """Turn an AST into a closure taking the tuple of variable values.
+
+    Also returns whether the subtree is constant (has no variables).
+    """
+    kind = node[0]
+    if kind == 'num':
+        value = node[1]
+        return (lambda args: value), True
+    if kind == 'var':
+        if node[1] not in variables:
+            raise ValueError(f"Unknown name '{node[1]}'")
+        index = variables.index(node[1])
+        return (lambda args: args[index]), False
+
+    if kind == 'neg':
+        operand, constant = _compile(node[1], variables)
+        func = lambda args: -operand(args)
+    elif kind == 'call':
+        fn = FUNCTIONS[node[1]]
+        operand, constant = _compile(node[2], variables)
+        func = lambda args: fn(operand(args))
+    else:
+        op = BINARY_OPERATORS[kind]
+        left, left_constant = _compile(node[1], variables)
+        right, right_constant = _compile(node[2], variables)
+        constant = left_constant and right_constant
+        func = lambda args: op(left(args), right(args))
+
+    # Fold constant subtrees so "√3/2" compiles to a single value
+    if constant:
+        try:
+            value = func(())
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return func, True
+        return (lambda args: value), True
+    return func, False
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(text, variables=()):
+    """Compile expression text into a function of the given variables.
+
+    ``variables`` is a tuple of names; the returned function takes their
+    values positionally. Math errors (division by zero, domain errors,
+    overflow) are raised as ValueError.
+    """
+    func, _ = _compile(parse_expression(text), tuple(variables))
+
+    def evaluate(*args):
+        try:
+            return func(args)
+        except ZeroDivisionError:
+            raise ValueError("Division by zero") from None
+        except OverflowError:
+            raise ValueError("Result too large") from None
+
+    return evaluate
+
+
+def evaluate_expression(text, **variables):
+    """Evaluate expression text once, e.g. ``evaluate_expression('2x+1', x=3)``."""
+    names = tuple(sorted(variables))
+    return compile_expression(text, names)(*(variables[n] for n in names))
@@ -0,0 +1,285 @@
+"""Least-squares sinusoid fits to sampled data (requires NumPy).
+
+The model is the app's y = A cos(B(t - C)) + D. Once the frequency B is
+fixed it is linear in three unknowns, y = a·cos(Bτ) + b·sin(Bτ) + D with
+τ = t - t₀, so the fit needs only the 3×3 normal equations. Their sums are
+accumulated chunk by chunk (``SinusoidFit``), which is why a file can be
+fitted in a single pass with memory that does not depend on its length.
+
+If B is not given it is estimated from the strongest peak of an FFT of the
+data. The FFT input is the signal averaged down to at most
+``MAX_FFT_POINTS`` blocks while streaming (``_Decimator``), so a file of any
+length takes two passes: one for the spectrum, one for the fit. The FFT
+assumes evenly spaced samples.
+
+CSV files are read with pyarrow, which is installed with Streamlit.
+"""
+
+import math
+
+import numpy as np
+
+from .curves import CHART_BUCKETS, downsample
+from .utils import PI, format_number
+
+CHUNK_SIZE = 1 << 20
+MAX_FFT_POINTS = 1 << 20
+
+
+class SinusoidFit:
+    """Normal equations of y = a·cos(Bτ) + b·sin(Bτ) + D, added to chunk by chunk.
+
+    ``t0`` is subtracted from every time before the cosine is taken, so
+    that large timestamps do not cost precision.
+    """
+
+    def __init__(self, B, t0=0.0):
+        if not (math.isfinite(B) and B > 0):
+            raise ValueError("The frequency B must be positive.")
+        self.B, self.t0 = B, t0
+        self.xtx = np.zeros((3, 3))
+        self.xty = np.zeros(3)
+        self.yty = 0.0
+        self.n = 0
+
+    def add(self, t, y):
+        """Add samples (t, y) to the sums."""
+        phase = self.B * (np.asarray(t, dtype=np.float64) - self.t0)
+        X = np.empty((len(phase), 3))
+        np.cos(phase, out=X[:, 0])
+        np.sin(phase, out=X[:, 1])
+        X[:, 2] = 1.0
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += float(y @ y)
+        self.n += len(y)
+
+    def solve(self):
+        """Best A, B, C, D so far, with the rms residual and R²."""
+        if self.n < 3:
+            raise ValueError("A sinusoid fit needs at least 3 samples.")
+        try:
+            a, b, D = np.linalg.solve(self.xtx, self.xty)
+        except np.linalg.LinAlgError:
+            raise ValueError("The samples do not determine a sinusoid at this frequency.") from None
+
+        # Residual sum of squares straight from the sums: y·y - β·Xᵀy
+        coef = np.array([a, b, D])
+        residual = max(self.yty - coef @ self.xty, 0.0)
+        mean = self.xty[2] / self.n
+        total = self.yty - self.n * mean * mean
+
+        # a·cos + b·sin = A·cos(Bτ - φ); C is the first maximum at or after t₀
+        A = math.hypot(a, b)
+        period = 2 * PI / self.B
+        C = self.t0 + (math.atan2(b, a) / self.B) % period
+        return {
+            'A': float(A), 'B': self.B, 'C': float(C), 'D': float(D), 'period': period,
+            'rms': math.sqrt(residual / self.n),
+            'r_squared': float(1 - residual / total) if total > 0 else float('nan'),
+            'samples': self.n,
+        }
+
+
+class _Decimator:
+    """Streams a signal down to at most ``limit`` block means for the FFT.
+
+    Blocks start one sample long; whenever the means outgrow ``limit``,
+    neighbouring pairs are merged and the block length doubles.
+    """
+
+    def __init__(self, limit=MAX_FFT_POINTS):
+        self.limit = limit
+        self.step = 1
+        self.parts, self.size = [], 0
+        self.carry = np.empty(0)
+
+    def add(self, y):
+        y = np.concatenate([self.carry, y]) if len(self.carry) else y
+        full = len(y) // self.step * self.step
+        self.carry = y[full:]
+        self.parts.append(y[:full].reshape(-1, self.step).mean(axis=1))
+        self.size += full // self.step
+        while self.size > self.limit:
+            means = np.concatenate(self.parts)
+            pairs = len(means) // 2
+            # An unpaired last mean goes back to the carry as an equivalent run of samples
+            if len(means) % 2:
+                self.carry = np.concatenate([np.full(self.step, means[-1]), self.carry])
+            self.parts = [means[:2 * pairs].reshape(-1, 2).mean(axis=1)]
+            self.size = pairs
+            self.step *= 2
+
+    def values(self):
+        return np.concatenate(self.parts) if self.parts else np.empty(0)
+
+
+def dominant_frequency(y, spacing=1.0):
+    """Angular frequency of the strongest oscillation in evenly spaced samples.
+
+    The peak of a Hann-windowed FFT is refined between bins by fitting a
+    parabola to the log magnitudes around it.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n < 4:
+        raise ValueError("Estimating the frequency needs at least 4 samples.")
+    spectrum = np.abs(np.fft.rfft((y - y.mean()) * np.hanning(n)))
+    spectrum[0] = 0.0
+    k = int(spectrum.argmax())
+    if spectrum[k] == 0:
+        raise ValueError("The data is constant; there is no period to find.")
+    shift = 0.0
+    if 0 < k < len(spectrum) - 1 and spectrum[k - 1] > 0 and spectrum[k + 1] > 0:
+        left, mid, right = np.log(spectrum[k - 1:k + 2])
+        shift = 0.5 * (left - right) / (left - 2 * mid + right)
+    return float(2 * PI * (k + shift) / (n * spacing))
+
+
+def _array_chunks(t, y, chunk_size):
+    t = np.arange(len(y), dtype=np.float64) if t is None else np.asarray(t, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if t.shape != y.shape:
+        raise ValueError("Times and values must have the same length.")
+    keep = ~(np.isnan(t) | np.isnan(y))
+    t, y = t[keep], y[keep]
+    for start in range(0, len(y), chunk_size):
+        yield t[start:start + chunk_size], y[start:start + chunk_size]
+
+
+def csv_columns(source):
+    """Column names in the header of a CSV file (a path or a binary file object)."""
+    import pyarrow.csv
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return pyarrow.csv.open_csv(source).schema.names
+
+
+def csv_chunks(source, value_column, time_column=None, chunk_size=CHUNK_SIZE, skip_missing=True):
+    """Yield (t, y) float64 arrays from a CSV file, skipping empty cells.
+
+    Without a time column, t is the row number. Timestamp columns become
+    seconds. ``source`` is a path or a binary file object (rewound first).
+    Empty values are kept as NaN rather than skipped if not ``skip_missing``.
+    """
+    import pyarrow as pa
+    import pyarrow.csv
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    columns = [value_column] if time_column is None else [time_column, value_column]
+    # An empty cell of a one-column file is an empty line
+    reader = pa.csv.open_csv(
+        source, parse_options=pa.csv.ParseOptions(ignore_empty_lines=skip_missing),
+        convert_options=pa.csv.ConvertOptions(
+            include_columns=columns, column_types={value_column: pa.float64()}))
+    row = 0
+    for batch in reader:
+        y = batch.column(value_column).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        if time_column is None:
+            t = np.arange(row, row + len(y), dtype=np.float64)
+        else:
+            times = batch.column(time_column)
+            if pa.types.is_timestamp(times.type) or pa.types.is_date(times.type):
+                times = times.cast(pa.timestamp('ns')).cast(pa.int64())
+                t = times.to_numpy(zero_copy_only=False).astype(np.float64) / 1e9
+            else:
+                t = times.to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        row += len(y)
+        missing = np.isnan(t)
+        if skip_missing:
+            missing |= np.isnan(y)
+        t, y = t[~missing], y[~missing]
+        for start in range(0, len(y), chunk_size):
+            yield t[start:start + chunk_size], y[start:start + chunk_size]
+
+
+def _scan(chunks):
+    """First pass: sample count, time range and spacing, and the decimated signal."""
+    decimator = _Decimator()
+    n, t_first, t_last = 0, None, None
+    gap_min, gap_max = math.inf, -math.inf
+    for t, y in chunks:
+        if not len(t):
+            continue
+        gaps = np.diff(t) if t_last is None else np.diff(t, prepend=t_last)
+        if len(gaps):
+            gap_min, gap_max = min(gap_min, gaps.min()), max(gap_max, gaps.max())
+        if t_first is None:
+            t_first = float(t[0])
+        t_last = float(t[-1])
+        n += len(t)
+        decimator.add(y)
+    if n < 3:
+        raise ValueError("A sinusoid fit needs at least 3 samples.")
+    if gap_min <= 0:
+        raise ValueError("Times must be strictly increasing.")
+    return {
+        'samples': n, 't_first': t_first, 't_last': t_last,
+        'spacing': (t_last - t_first) / (n - 1),
+        'evenly_spaced': bool(gap_max - gap_min <= 1e-6 * gap_max),
+        'decimated': decimator.values(), 'step': decimator.step,
+    }
+
+
+def fit_chunks(chunks, period=None, buckets=CHART_BUCKETS):
+    """Fit y = A cos(B(t - C)) + D to the data from ``chunks()``.
+
+    ``chunks`` is a function returning a fresh iterator of (t, y) array
+    pairs, since the data is read twice (once if only ``period`` is given
+    and no chart points are wanted, ``buckets=0``). Without ``period`` the
+    frequency comes from ``dominant_frequency``. Returns the parameters as
+    ``SinusoidFit.solve`` does, plus ``equation``, ``evenly_spaced``, the
+    ``estimated`` flag and ``t``/``y`` chart points of the data.
+    """
+    if period is not None and not (math.isfinite(period) and period > 0):
+        raise ValueError("The period must be positive.")
+    if period is None or buckets:
+        scan = _scan(chunks())
+        t0, n = scan['t_first'], scan['samples']
+    else:
+        scan, t0, n = None, None, None
+
+    if period is None:
+        B = dominant_frequency(scan['decimated'], scan['spacing'] * scan['step'])
+    else:
+        B = 2 * PI / period
+
+    fit = None
+    points_t, points_y = [], []
+    for t, y in chunks():
+        if not len(t):
+            continue
+        if fit is None:
+            fit = SinusoidFit(B, t0 if t0 is not None else float(t[0]))
+        fit.add(t, y)
+        if buckets:
+            index = downsample(t, y, max(1, buckets * len(t) // n))
+            points_t.append(t[index])
+            points_y.append(y[index])
+    if fit is None:
+        raise ValueError("A sinusoid fit needs at least 3 samples.")
+
+    result = fit.solve()
+    A, C, D = result['A'], result['C'], result['D']
+    result['equation'] = (f"y = {format_number(A)}cos({format_number(B, 4)}(x - {format_number(C)}))"
+                          f" + {format_number(D)}")
+    result['estimated'] = period is None
+    result['evenly_spaced'] = scan['evenly_spaced'] if scan else None
+    if buckets:
+        result['t'] = np.concatenate(points_t)
+        result['y'] = np.concatenate(points_y)
+    return result
+
+
+def fit_sinusoid(t, y, period=None, chunk_size=CHUNK_SIZE, buckets=0):
+    """Fit y = A cos(B(t - C)) + D to arrays (t may be None for 0, 1, 2, ...)."""
+    return fit_chunks(lambda: _array_chunks(t, y, chunk_size), period, buckets)
+
+
+def fit_sinusoid_csv(source, value_column, time_column=None, period=None,
+                     chunk_size=CHUNK_SIZE, buckets=CHART_BUCKETS):
+    """Fit a sinusoid to one column of a CSV file, streamed in chunks (see ``csv_chunks``)."""
+    return fit_chunks(lambda: csv_chunks(source, value_column, time_column, chunk_size),
+                      period, buckets)
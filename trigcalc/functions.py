@@ -0,0 +1,108 @@
+"""Trig function evaluation, inverse functions, compositions and basic equations."""
+
+import math
+
+from .utils import PI, to_degrees
+
+TRIG_FUNCTIONS = ["sin", "cos", "tan", "csc", "sec", "cot"]
+INVERSE_FUNCTIONS = ["arcsin", "arccos", "arctan", "arccsc", "arcsec", "arccot"]
+COMPOSITIONS = ["sin(arccos(x))", "cos(arcsin(x))", "tan(arcsin(x))",
+                "tan(arccos(x))", "sin(arctan(x))", "cos(arctan(x))"]
+
+FUNCTION_NAMES = {
+    'sin': 'Sine', 'cos': 'Cosine', 'tan': 'Tangent',
+    'csc': 'Cosecant', 'sec': 'Secant', 'cot': 'Cotangent',
+}
+
+
+def evaluate_trig(func, radians):
+    """Evaluate one of the six trig functions at an angle in radians."""
+    if func == 'sin':
+        return math.sin(radians)
+    if func == 'cos':
+        return math.cos(radians)
+
+    # The remaining functions are undefined where sin or cos vanishes
+    zero_at = math.cos(radians) if func in ('tan', 'sec') else math.sin(radians)
+    if abs(zero_at) < 1e-10:
+        raise ValueError(f"{FUNCTION_NAMES[func]} is undefined at this angle.")
+
+    if func == 'tan':
+        return math.tan(radians)
+    if func == 'csc':
+        return 1 / math.sin(radians)
+    if func == 'sec':
+        return 1 / math.cos(radians)
+    if func == 'cot':
+        return 1 / math.tan(radians)
+    raise ValueError(f"Unknown function: {func}")
+
+
+def evaluate_inverse(func, x):
+    """Principal value, in radians, of an inverse trig function."""
+    if func in ('arcsin', 'arccos') and (x < -1 or x > 1):
+        raise ValueError("Value must be in [-1, 1]")
+    if func in ('arccsc', 'arcsec') and -1 < x < 1:
+        raise ValueError("Value must satisfy |x| ≥ 1")
+
+    if func == 'arcsin':
+        return math.asin(x)
+    if func == 'arccos':
+        return math.acos(x)
+    if func == 'arctan':
+        return math.atan(x)
+    if func == 'arccsc':
+        return math.asin(1 / x)
+    if func == 'arcsec':
+        return math.acos(1 / x)
+    if func == 'arccot':
+        if x == 0:
+            return PI / 2
+        result = math.atan(1 / x)
+        return result + PI if x < 0 else result
+    raise ValueError(f"Unknown function: {func}")
+
+
+def evaluate_composition(comp_type, x):
+    """Evaluate a trig-of-inverse-trig composition algebraically."""
+    if comp_type == "sin(arccos(x))":
+        if x < -1 or x > 1:
+            raise ValueError("arccos needs x ∈ [-1, 1]")
+        return math.sqrt(1 - x*x)
+    if comp_type == "cos(arcsin(x))":
+        if x < -1 or x > 1:
+            raise ValueError("arcsin needs x ∈ [-1, 1]")
+        return math.sqrt(1 - x*x)
+    if comp_type == "tan(arcsin(x))":
+        if x <= -1 or x >= 1:
+            raise ValueError("Need x ∈ (-1, 1)")
+        return x / math.sqrt(1 - x*x)
+    if comp_type == "tan(arccos(x))":
+        if x <= -1 or x > 1 or x == 0:
+            raise ValueError("Invalid domain")
+        return math.sqrt(1 - x*x) / x
+    if comp_type == "sin(arctan(x))":
+        return x / math.sqrt(1 + x*x)
+    if comp_type == "cos(arctan(x))":
+        return 1 / math.sqrt(1 + x*x)
+    raise ValueError(f"Unknown composition: {comp_type}")
+
+
+def solve_basic_equation(func, k):
+    """General solution of sin(θ) = k, cos(θ) = k or tan(θ) = k in degrees.
+
+    ``solutions`` holds (base, period) pairs meaning θ = base + period·n. For
+    cosine ``plus_minus`` is set, meaning θ = ±base + 360°n.
+    """
+    if func == 'sin':
+        if k < -1 or k > 1:
+            raise ValueError("No solution: sin(θ) ∈ [-1, 1]")
+        base = to_degrees(math.asin(k))
+        return {'solutions': [(base, 360), (180 - base, 360)], 'plus_minus': False}
+    if func == 'cos':
+        if k < -1 or k > 1:
+            raise ValueError("No solution: cos(θ) ∈ [-1, 1]")
+        return {'solutions': [(to_degrees(math.acos(k)), 360)], 'plus_minus': True}
+    if func == 'tan':
+        return {'solutions': [(to_degrees(math.atan(k)), 180)], 'plus_minus': False}
+    raise ValueError(f"Unknown function: {func}")
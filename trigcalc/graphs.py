@@ -0,0 +1,182 @@
+"""Graphs of the trig functions, their inverses and sinusoids (requires NumPy).
+
+Plots are read from float32 sample buffers that are computed once per
+process and kept in an LRU cache:
+
+* one period of each of the six functions. Every sinusoid
+  y = A·f(B(x - C)) + D, and every window of it, maps x to a position
+  within the period and interpolates between the two nearest samples, so
+  moving or zooming a graph costs one gather instead of evaluating f.
+* each inverse function over [-INVERSE_RANGE, INVERSE_RANGE]; a window
+  inside it is a strided slice of the buffer.
+
+A window finer than its buffer (zoomed in past the buffer's resolution)
+or outside it is evaluated directly instead. tan, cot, sec and csc are
+NaN beyond ±GRAPH_LIMIT so that lines break at the asymptotes.
+
+``compile_sinusoid`` turns an equation into a NumPy function that
+evaluates it exactly, for tables and further computation.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+from .functions import INVERSE_FUNCTIONS
+from .sinusoids import sinusoid_parameters
+from .utils import PI
+
+BUFFER_SAMPLES = 1 << 16  # per period; linear interpolation error < 2e-9
+INVERSE_SAMPLES = 1 << 18
+INVERSE_RANGE = 16.0
+WINDOW_POINTS = 2000
+GRAPH_LIMIT = 10.0
+
+PERIODS = {'sin': 2 * PI, 'cos': 2 * PI, 'tan': PI, 'csc': 2 * PI, 'sec': 2 * PI, 'cot': PI}
+
+
+def trig_array(func, u, limit=None):
+    """One of the six functions at every angle in u (radians).
+
+    Like ``evaluate_trig``, tan, cot, sec and csc are NaN where the sine or
+    cosine they divide by is within 1e-10 of zero; with a ``limit``, values
+    beyond ±limit are NaN too.
+    """
+    u = np.asarray(u, dtype=np.float64)
+    if func == 'sin':
+        return np.sin(u)
+    if func == 'cos':
+        return np.cos(u)
+    if func not in PERIODS:
+        raise ValueError(f"Unknown function: {func}")
+
+    sin, cos = np.sin(u), np.cos(u)
+    zero_at = cos if func in ('tan', 'sec') else sin
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = {'tan': sin / cos, 'csc': 1 / sin, 'sec': 1 / cos, 'cot': cos / sin}[func]
+    undefined = np.abs(zero_at) < 1e-10
+    if limit is not None:
+        undefined |= np.abs(y) > limit
+    y[undefined] = np.nan
+    return y
+
+
+def inverse_array(func, x):
+    """Principal values (radians) of an inverse function, NaN outside its domain."""
+    x = np.asarray(x, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if func == 'arcsin':
+            return np.arcsin(x)
+        if func == 'arccos':
+            return np.arccos(x)
+        if func == 'arctan':
+            return np.arctan(x)
+        if func == 'arccot':
+            return PI / 2 - np.arctan(x)
+        if func == 'arccsc':
+            return np.arcsin(1 / x)
+        if func == 'arcsec':
+            return np.arccos(1 / x)
+    raise ValueError(f"Unknown function: {func}")
+
+
+def _read_only(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays if len(arrays) > 1 else arrays[0]
+
+
+@functools.lru_cache(maxsize=len(PERIODS))
+def period_buffer(func):
+    """float32 samples of f over one period, both ends included.
+
+    The asymptotes of tan, cot, sec and csc fall exactly on samples (which
+    are NaN), so interpolating never bridges one.
+    """
+    step = PERIODS[func] / BUFFER_SAMPLES
+    y = trig_array(func, np.arange(BUFFER_SAMPLES + 1) * step, GRAPH_LIMIT)
+    return _read_only(y.astype(np.float32))
+
+
+@functools.lru_cache(maxsize=len(INVERSE_FUNCTIONS))
+def inverse_buffer(func):
+    """(x, y) samples of an inverse function over ±INVERSE_RANGE; y is float32."""
+    x = np.linspace(-INVERSE_RANGE, INVERSE_RANGE, INVERSE_SAMPLES + 1)
+    return _read_only(x, inverse_array(func, x).astype(np.float32))
+
+
+def _window(lo, hi, points):
+    if not (math.isfinite(lo) and math.isfinite(hi)) or hi <= lo:
+        raise ValueError("Enter a window with start < end.")
+    if points < 2:
+        raise ValueError("A graph needs at least 2 points.")
+    return np.linspace(lo, hi, int(points))
+
+
+def sinusoid_window(func, lo, hi, A=1.0, B=1.0, C=0.0, D=0.0, points=WINDOW_POINTS):
+    """y = A·f(B(x - C)) + D at ``points`` values of x over [lo, hi].
+
+    Returns float32 ``x`` and ``y`` arrays and the ``source`` of the
+    values: ``'buffer'`` or ``'evaluated'`` (see module docstring).
+    """
+    if func not in PERIODS:
+        raise ValueError(f"Unknown function: {func}")
+    if not all(math.isfinite(v) for v in (A, B, C, D)) or B == 0:
+        raise ValueError("A, B, C and D must be numbers, with B not zero.")
+    x = _window(lo, hi, points)
+    u = B * (x - C)
+    period = PERIODS[func]
+    step = period / BUFFER_SAMPLES
+
+    if abs(B) * (hi - lo) / (len(x) - 1) >= step:
+        buffer = period_buffer(func)
+        position = np.mod(u, period) / step
+        index = np.minimum(position.astype(np.intp), BUFFER_SAMPLES - 1)
+        frac = (position - index).astype(np.float32)
+        f = buffer[index] + frac * (buffer[index + 1] - buffer[index])
+        source = 'buffer'
+    else:
+        f = trig_array(func, u, GRAPH_LIMIT)
+        source = 'evaluated'
+    return {'x': x.astype(np.float32), 'y': (A * f + D).astype(np.float32), 'source': source}
+
+
+def inverse_window(func, lo, hi, points=WINDOW_POINTS):
+    """An inverse function at about ``points`` values over [lo, hi] (see ``sinusoid_window``)."""
+    if func not in INVERSE_FUNCTIONS:
+        raise ValueError(f"Unknown function: {func}")
+    step = 2 * INVERSE_RANGE / INVERSE_SAMPLES
+    if -INVERSE_RANGE <= lo < hi <= INVERSE_RANGE and (hi - lo) / (points - 1) >= step:
+        x, y = inverse_buffer(func)
+        start, stop = np.searchsorted(x, [lo, hi])
+        stride = max(1, (stop - start) // (points - 1))
+        window = slice(start, min(stop + 1, len(x)), stride)
+        return {'x': x[window].astype(np.float32), 'y': y[window], 'source': 'buffer'}
+    x = _window(lo, hi, points)
+    return {'x': x.astype(np.float32), 'y': inverse_array(func, x).astype(np.float32),
+            'source': 'evaluated'}
+
+
+@functools.lru_cache(maxsize=1)
+def unit_circle(points=361):
+    """(x, y) float32 samples of the unit circle, closed."""
+    t = np.linspace(0, 2 * PI, points)
+    return _read_only(np.cos(t).astype(np.float32), np.sin(t).astype(np.float32))
+
+
+@functools.lru_cache(maxsize=256)
+def sinusoid_function(func, A=1.0, B=1.0, C=0.0, D=0.0):
+    """NumPy function x -> A·f(B(x - C)) + D in float64 (NaN where f is undefined)."""
+    if func not in PERIODS:
+        raise ValueError(f"Unknown function: {func}")
+
+    def evaluate(x):
+        return A * trig_array(func, B * (np.asarray(x, dtype=np.float64) - C)) + D
+
+    return evaluate
+
+
+def compile_sinusoid(equation):
+    """Parse an equation y = A·f(B(x - C)) + D into a cached NumPy function of x."""
+    return sinusoid_function(*sinusoid_parameters(equation))
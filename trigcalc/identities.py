@@ -0,0 +1,296 @@
+"""Checking whether two trig expressions are identical (requires NumPy).
+
+Both sides are first rewritten in sin and cos (``canonical``): tan becomes
+sin/cos, csc becomes 1/sin, and so on, with constant subtrees folded.
+The difference of the two sides is then expanded into one fraction of
+polynomials in the sin, cos and other terms it contains, and cos² is
+replaced by 1 - sin² until no cos power above 1 is left. If the numerator
+cancels to nothing the sides are identical, and that is the ``'symbolic'``
+verdict.
+
+Identities this cannot show (double angles, sums of angles, square roots)
+are checked at ``RANDOM_POINTS`` random points instead, all evaluated at
+once with NumPy. Points where either side is undefined are skipped, and
+any point where the sides differ is returned as a counterexample. The
+points come from a fixed seed, so a verdict never changes between runs.
+
+``canonical`` is an LRU cache keyed on the AST and the angle mode. It is
+applied to every subtree, so a subexpression shared by many identities is
+rewritten once, and whole verdicts are cached as well.
+"""
+
+import functools
+
+import numpy as np
+
+from .expressions import free_variables, parse_expression
+from .solver import INVERSE, NUMPY_FUNCTIONS, NUMPY_OPERATORS, TRIG
+from .utils import PI, format_number
+
+IDENTITY_CACHE_SIZE = 4096
+RANDOM_POINTS = 64
+RANDOM_SEED = 20240601
+MIN_POINTS = 16
+TOLERANCE = 1e-9
+MAX_TERMS = 2000
+MAX_POWER = 8
+
+# Rewrites of the other four functions into sin and cos
+_IN_SIN_COS = {
+    'tan': lambda u: ('/', ('call', 'sin', u), ('call', 'cos', u)),
+    'cot': lambda u: ('/', ('call', 'cos', u), ('call', 'sin', u)),
+    'sec': lambda u: ('/', ('num', 1.0), ('call', 'cos', u)),
+    'csc': lambda u: ('/', ('num', 1.0), ('call', 'sin', u)),
+}
+
+# Binding strength of each node kind, for printing with the fewest parentheses
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, 'neg': 3, '^': 4}
+
+
+class _Unsupported(Exception):
+    """The difference cannot be expanded into polynomials; check numerically."""
+
+
+def _evaluate(node, values, degrees):
+    """Evaluate an AST with NumPy, the variables taken from the ``values`` dict."""
+    kind = node[0]
+    if kind == 'num':
+        return node[1]
+    if kind == 'var':
+        return values[node[1]]
+    if kind == 'neg':
+        return -_evaluate(node[1], values, degrees)
+    if kind == 'call':
+        x = _evaluate(node[2], values, degrees)
+        if degrees and node[1] in TRIG:
+            x = x * (PI / 180)
+        y = NUMPY_FUNCTIONS[node[1]](x)
+        return y * (180 / PI) if degrees and node[1] in INVERSE else y
+    return NUMPY_OPERATORS[kind](_evaluate(node[1], values, degrees),
+                                 _evaluate(node[2], values, degrees))
+
+
+@functools.lru_cache(maxsize=IDENTITY_CACHE_SIZE)
+def canonical(node, degrees=False):
+    """The AST rewritten in sin and cos, with constant subtrees folded."""
+    kind = node[0]
+    if kind in ('num', 'var'):
+        return node
+    children = tuple(canonical(child, degrees) if isinstance(child, tuple) else child
+                     for child in node[1:])
+    if kind == 'call' and children[0] in _IN_SIN_COS:
+        return canonical(_IN_SIN_COS[children[0]](children[1]), degrees)
+    node = (kind,) + children
+
+    operands = [child for child in children if isinstance(child, tuple)]
+    if all(child[0] == 'num' for child in operands):
+        with np.errstate(all='ignore'):
+            value = float(_evaluate(node, {}, degrees))
+        if np.isfinite(value):
+            return ('num', value + 0.0)
+    return node
+
+
+def _monomial(*powers):
+    return frozenset((atom, power) for atom, power in powers if power)
+
+
+_ONE = {_monomial(): 1.0}
+
+
+def _add(p, q, sign=1.0):
+    result = dict(p)
+    for m, c in q.items():
+        result[m] = result.get(m, 0.0) + sign * c
+    return {m: c for m, c in result.items() if c}
+
+
+def _multiply(p, q):
+    result = {}
+    for m1, c1 in p.items():
+        for m2, c2 in q.items():
+            powers = dict(m1)
+            for atom, power in m2:
+                powers[atom] = powers.get(atom, 0) + power
+            m = _monomial(*powers.items())
+            result[m] = result.get(m, 0.0) + c1 * c2
+    if len(result) > MAX_TERMS:
+        raise _Unsupported
+    return {m: c for m, c in result.items() if c}
+
+
+def _power(p, n):
+    result = _ONE
+    for _ in range(n):
+        result = _multiply(result, p)
+    return result
+
+
+def _fraction(node):
+    """(numerator, denominator) polynomials of a canonical AST.
+
+    Polynomials map a frozenset of (atom, power) pairs to a coefficient;
+    atoms are variables, sin and cos calls and any other subtree that is
+    not arithmetic.
+    """
+    kind = node[0]
+    if kind == 'num':
+        return ({_monomial(): node[1]} if node[1] else {}), _ONE
+    if kind == 'neg':
+        num, den = _fraction(node[1])
+        return {m: -c for m, c in num.items()}, den
+    if kind in ('+', '-', '*', '/'):
+        n1, d1 = _fraction(node[1])
+        n2, d2 = _fraction(node[2])
+        if kind == '*':
+            return _multiply(n1, n2), _multiply(d1, d2)
+        if kind == '/':
+            if not n2:
+                raise _Unsupported
+            return _multiply(n1, d2), _multiply(d1, n2)
+        sign = 1.0 if kind == '+' else -1.0
+        return _add(_multiply(n1, d2), _multiply(n2, d1), sign), _multiply(d1, d2)
+    if kind == '^' and node[2][0] == 'num':
+        exponent = node[2][1]
+        if exponent == int(exponent) and abs(exponent) <= MAX_POWER:
+            num, den = _fraction(node[1])
+            if exponent < 0:
+                if not num:
+                    raise _Unsupported
+                num, den = den, num
+            return _power(num, abs(int(exponent))), _power(den, abs(int(exponent)))
+    return {_monomial((node, 1)): 1.0}, _ONE
+
+
+def _pythagorean(poly):
+    """The polynomial with every cos(u)² replaced by 1 - sin(u)²."""
+    result = {}
+    pending = list(poly.items())
+    while pending:
+        m, c = pending.pop()
+        square = next((atom for atom, power in m
+                       if atom[0] == 'call' and atom[1] == 'cos' and power >= 2), None)
+        if square is None:
+            result[m] = result.get(m, 0.0) + c
+            continue
+        powers = dict(m)
+        powers[square] -= 2
+        sin = ('call', 'sin', square[2])
+        pending.append((_monomial(*powers.items()), c))
+        powers[sin] = powers.get(sin, 0) + 2
+        pending.append((_monomial(*powers.items()), -c))
+        if len(pending) + len(result) > MAX_TERMS:
+            raise _Unsupported
+    scale = max((abs(c) for c in poly.values()), default=0.0)
+    return {m: c for m, c in result.items() if abs(c) > TOLERANCE * scale}
+
+
+def _cancels(left, right):
+    """Whether left - right expands to zero (see module docstring)."""
+    try:
+        n1, d1 = _fraction(left)
+        n2, d2 = _fraction(right)
+        return not _pythagorean(_add(_multiply(n1, d2), _multiply(n2, d1), -1.0))
+    except _Unsupported:
+        return False
+
+
+def to_text(node):
+    """An AST as expression text the parser reads back."""
+    kind = node[0]
+    if kind == 'num':
+        return format_number(node[1])
+    if kind == 'var':
+        return node[1]
+    if kind == 'call':
+        return f"{node[1]}({to_text(node[2])})"
+    if kind == 'neg':
+        return "-" + _operand(node[1], _PRECEDENCE['neg'])
+    precedence = _PRECEDENCE[kind]
+    if kind == '^':
+        return f"{_operand(node[1], precedence + 1)}^{_operand(node[2], precedence)}"
+    # a - (b + c), a·(b/c) and a/(b·c) keep their parentheses
+    right = _operand(node[2], precedence + (kind != '+'))
+    symbol = {'*': '·'}.get(kind, kind)
+    spaced = f" {symbol} " if kind in ('+', '-') else symbol
+    return _operand(node[1], precedence) + spaced + right
+
+
+def _operand(node, minimum):
+    text = to_text(node)
+    if _PRECEDENCE.get(node[0], 5) < minimum or (node[0] == 'num' and node[1] < 0 and minimum > 1):
+        return f"({text})"
+    return text
+
+
+def _points(names, degrees):
+    rng = np.random.default_rng(RANDOM_SEED)
+    spread = 360.0 if degrees else 2 * PI
+    return {name: rng.uniform(-spread, spread, RANDOM_POINTS) for name in names}
+
+
+@functools.lru_cache(maxsize=IDENTITY_CACHE_SIZE)
+def _verify(left, right, degrees):
+    left, right = canonical(left, degrees), canonical(right, degrees)
+    result = {'left': to_text(left), 'right': to_text(right), 'counterexample': None}
+    if left == right or _cancels(left, right):
+        return {**result, 'identical': True, 'method': 'symbolic', 'points': 0}
+
+    names = tuple(sorted(set(free_variables(left)) | set(free_variables(right))))
+    values = _points(names, degrees)
+    with np.errstate(all='ignore'):
+        a = np.broadcast_to(_evaluate(left, values, degrees), (RANDOM_POINTS,))
+        b = np.broadcast_to(_evaluate(right, values, degrees), (RANDOM_POINTS,))
+    defined = np.isfinite(a) & np.isfinite(b)
+    if defined.sum() < MIN_POINTS:
+        raise ValueError("The expressions are undefined at almost every test point.")
+    differs = defined & (np.abs(a - b) > TOLERANCE * np.maximum(1, np.maximum(np.abs(a), np.abs(b))))
+    if differs.any():
+        i = int(np.argmax(differs))
+        result['counterexample'] = {
+            'values': {name: float(values[name][i]) for name in names},
+            'left': float(a[i]), 'right': float(b[i]),
+        }
+    return {**result, 'identical': not differs.any(), 'method': 'numeric',
+            'points': int(defined.sum())}
+
+
+def _side(text):
+    try:
+        return parse_expression(text)
+    except ValueError as e:
+        raise ValueError(f"{text.strip()}: {e}") from None
+
+
+def verify_identity(left, right=None, degrees=False):
+    """Whether two expressions are equal wherever both are defined.
+
+    Pass the two sides, or one string "left = right". Trig functions take
+    their arguments in degrees if ``degrees``. Returns ``identical``, the
+    ``method`` that decided it ('symbolic' or 'numeric'), both sides
+    rewritten in sin and cos as ``left`` and ``right`` text, the number of
+    random ``points`` compared and, if they differ, a ``counterexample``
+    with the variable ``values`` and both sides' values there.
+    """
+    if right is None:
+        sides = left.split('=')
+        if len(sides) != 2:
+            raise ValueError("Enter an identity with one '=', or the two sides separately.")
+        left, right = sides
+    return dict(_verify(_side(left), _side(right), bool(degrees)))
+
+
+def verify_identities(identities, degrees=False):
+    """``verify_identity`` for each "left = right" string or (left, right) pair.
+
+    Problems that cannot be checked get an ``error`` message instead of
+    raising, so that one bad entry does not stop a whole problem set.
+    """
+    results = []
+    for identity in identities:
+        sides = (identity,) if isinstance(identity, str) else tuple(identity)
+        try:
+            results.append(verify_identity(*sides, degrees=degrees))
+        except ValueError as e:
+            results.append({'identical': None, 'error': str(e)})
+    return results
@@ -0,0 +1,77 @@
+"""Parametric curves, projectile motion and simple harmonic motion."""
+
+import math
+
+from .utils import PI, to_radians
+
+PARAMETRIC_CURVES = ["Circle", "Ellipse", "Cycloid", "Lissajous"]
+
+PARAMETRIC_EQUATIONS = {
+    "Circle": "x(t) = r·cos(t), y(t) = r·sin(t)",
+    "Ellipse": "x(t) = a·cos(t), y(t) = b·sin(t)",
+    "Cycloid": "x(t) = r(t - sin(t)), y(t) = r(1 - cos(t))",
+    "Lissajous": "x(t) = a·sin(pt + δ), y(t) = b·sin(qt)",
+}
+
+
+def parametric_point(curve, t, r=5, a=5, b=3, p=3, q=2, delta=PI/2):
+    """Point (x, y) on a parametric curve at parameter t.
+
+    r is the radius of the circle and cycloid, a and b the semi-axes of the
+    ellipse and Lissajous figure, and p, q, δ the Lissajous frequencies and
+    phase.
+    """
+    if math.isnan(t):
+        raise ValueError("Please enter parameter t.")
+
+    if curve == "Circle":
+        return r * math.cos(t), r * math.sin(t)
+    if curve == "Ellipse":
+        return a * math.cos(t), b * math.sin(t)
+    if curve == "Cycloid":
+        return r * (t - math.sin(t)), r * (1 - math.cos(t))
+    if curve == "Lissajous":
+        return a * math.sin(p * t + delta), b * math.sin(q * t)
+    raise ValueError(f"Curve not supported: {curve}")
+
+
+def projectile(v0, angle, h0=0, g=9.81):
+    """Closed-form projectile analysis for a launch angle in degrees."""
+    if any(math.isnan(x) for x in [v0, angle]):
+        raise ValueError("Please enter velocity and angle.")
+
+    angle_rad = to_radians(angle)
+    v0x = v0 * math.cos(angle_rad)
+    v0y = v0 * math.sin(angle_rad)
+
+    discriminant = v0y * v0y + 2 * g * h0
+    if discriminant < 0:
+        raise ValueError("The projectile never gets back up to height 0.")
+    total_time = (v0y + math.sqrt(discriminant)) / g
+
+    return {
+        'v0x': v0x,
+        'v0y': v0y,
+        't_max': v0y / g,
+        'max_height': h0 + (v0y * v0y) / (2 * g),
+        'total_time': total_time,
+        'range': v0x * total_time,
+    }
+
+
+def shm(A, omega, phi, t):
+    """Position, velocity and acceleration of x(t) = A·cos(ωt + φ)."""
+    if any(math.isnan(x) for x in [A, omega, t]):
+        raise ValueError("Please enter A, ω, and t.")
+    if not 0 < omega < math.inf:
+        raise ValueError("Angular frequency ω must be positive.")
+
+    phase = omega * t + phi
+    return {
+        'position': A * math.cos(phase),
+        'velocity': -A * omega * math.sin(phase),
+        'acceleration': -A * omega * omega * math.cos(phase),
+        'period': 2 * PI / omega,
+        'frequency': omega / (2 * PI),
+        'max_velocity': A * omega,
+    }
@@ -0,0 +1,170 @@
+"""Time series of simple, damped and driven harmonic motion (requires NumPy).
+
+The oscillator is x'' + 2γx' + ω²x = F·cos(ω_d·t), started from the same
+state as the undamped x(t) = A·cos(ωt + φ): x(0) = A·cos φ and
+x'(0) = -Aω·sin φ. With γ = 0 and F = 0 it reproduces ``shm``.
+
+Every sample is computed from the closed-form solution, not by stepping
+through time, so any stretch of the series can be evaluated on its own.
+``shm_chunks`` uses that to produce arbitrarily long series chunk by
+chunk in constant memory; ``save_shm_series`` and ``shm_chart_points``
+stream the chunks to a file or down to a chart-sized sample.
+"""
+
+import math
+
+import numpy as np
+
+from .curves import CHART_BUCKETS, downsample
+
+CHUNK_SIZE = 1 << 20
+MAX_SERIES_SAMPLES = 100_000_000  # what the app lets a chart request
+SERIES_COLUMNS = ['t', 'x', 'v', 'a']
+
+
+class _Oscillator:
+    """Closed-form x(t), v(t) and a(t) for one set of parameters."""
+
+    def __init__(self, A, omega, phi=0.0, damping=0.0, drive=0.0, drive_omega=0.0):
+        if any(math.isnan(x) for x in [A, omega, phi, damping, drive, drive_omega]):
+            raise ValueError("Please enter A, ω and the damping/driving values.")
+        if omega <= 0:
+            raise ValueError("Angular frequency ω must be positive.")
+        if damping < 0:
+            raise ValueError("Damping γ must be zero or positive.")
+        self.omega, self.damping = omega, damping
+        self.drive, self.drive_omega = drive, drive_omega
+
+        # Steady-state response to the drive; undamped resonance grows as t·sin(ωt)
+        self.resonant = drive != 0 and damping == 0 and drive_omega == omega
+        if drive == 0 or self.resonant:
+            self.gain, self.lag = 0.0, 0.0
+            p0 = dp0 = 0.0
+        else:
+            detune = omega * omega - drive_omega * drive_omega
+            self.gain = drive / math.hypot(detune, 2 * damping * drive_omega)
+            self.lag = math.atan2(2 * damping * drive_omega, detune)
+            p0 = self.gain * math.cos(-self.lag)
+            dp0 = -self.gain * drive_omega * math.sin(-self.lag)
+
+        # The free (homogeneous) part carries whatever the drive does not
+        x0 = A * math.cos(phi) - p0
+        v0 = -A * omega * math.sin(phi) - dp0
+        if damping < omega:
+            self.kind = 'under'
+            self.omega1 = math.sqrt(omega * omega - damping * damping)
+            self.c1, self.c2 = x0, (v0 + damping * x0) / self.omega1
+        elif damping == omega:
+            self.kind = 'critical'
+            self.c1, self.c2 = x0, v0 + damping * x0
+        else:
+            self.kind = 'over'
+            root = math.sqrt(damping * damping - omega * omega)
+            self.r1, self.r2 = -damping + root, -damping - root
+            self.c2 = (v0 - self.r1 * x0) / (self.r2 - self.r1)
+            self.c1 = x0 - self.c2
+
+    def __call__(self, t):
+        """x, v and a at every time in the array t."""
+        g = self.damping
+        if self.kind == 'under':
+            decay = np.exp(-g * t) if g else 1.0
+            wt = self.omega1 * t
+            cos, sin = np.cos(wt), np.sin(wt)
+            x = decay * (self.c1 * cos + self.c2 * sin)
+            v = decay * ((self.omega1 * self.c2 - g * self.c1) * cos
+                         - (self.omega1 * self.c1 + g * self.c2) * sin)
+        elif self.kind == 'critical':
+            decay = np.exp(-g * t)
+            x = decay * (self.c1 + self.c2 * t)
+            v = decay * (self.c2 - g * (self.c1 + self.c2 * t))
+        else:
+            e1, e2 = np.exp(self.r1 * t), np.exp(self.r2 * t)
+            x = self.c1 * e1 + self.c2 * e2
+            v = self.r1 * self.c1 * e1 + self.r2 * self.c2 * e2
+
+        if self.drive:
+            wd = self.drive_omega
+            if self.resonant:
+                scale = self.drive / (2 * self.omega)
+                sin, cos = np.sin(wd * t), np.cos(wd * t)
+                x = x + scale * t * sin
+                v = v + scale * (sin + wd * t * cos)
+            else:
+                phase = wd * t - self.lag
+                x = x + self.gain * np.cos(phase)
+                v = v - self.gain * wd * np.sin(phase)
+            force = self.drive * np.cos(wd * t)
+        else:
+            force = 0.0
+
+        # The equation of motion gives a without differentiating again
+        a = force - 2 * g * v - self.omega * self.omega * x
+        return x, v, a
+
+
+def shm_series(t, A, omega, phi=0.0, damping=0.0, drive=0.0, drive_omega=0.0):
+    """x(t), v(t) and a(t) at every time in t; returns a dict of arrays."""
+    t = np.asarray(t, dtype=np.float64)
+    x, v, a = _Oscillator(A, omega, phi, damping, drive, drive_omega)(t)
+    return {'t': t, 'x': np.broadcast_to(x, t.shape), 'v': np.broadcast_to(v, t.shape),
+            'a': np.broadcast_to(a, t.shape)}
+
+
+def shm_chunks(t_start, t_stop, n, chunk_size=CHUNK_SIZE, **params):
+    """Yield the n-sample series over [t_start, t_stop] as dicts of at most chunk_size rows."""
+    if not (math.isfinite(t_start) and math.isfinite(t_stop)) or t_stop <= t_start:
+        raise ValueError("Enter a time range with start < end.")
+    if n < 2:
+        raise ValueError("A time series needs at least 2 samples.")
+    oscillator = _Oscillator(**params)
+    dt = (t_stop - t_start) / (n - 1)
+    for start in range(0, n, chunk_size):
+        t = t_start + np.arange(start, min(start + chunk_size, n)) * dt
+        x, v, a = oscillator(t)
+        yield {'t': t, 'x': x, 'v': v, 'a': a}
+
+
+def save_shm_series(path, t_start, t_stop, n, chunk_size=CHUNK_SIZE, **params):
+    """Stream a series to a .npy file (float64 columns t, x, v, a) or a .csv file.
+
+    The .npy file is a memory-mapped (n, 4) array written chunk by chunk, so
+    only one chunk is ever held in memory.
+    """
+    chunks = shm_chunks(t_start, t_stop, n, chunk_size, **params)
+    if path.lower().endswith('.npy'):
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n, 4))
+        row = 0
+        for chunk in chunks:
+            rows = len(chunk['t'])
+            for i, name in enumerate(SERIES_COLUMNS):
+                out[row:row + rows, i] = chunk[name]
+            row += rows
+        out.flush()
+        del out
+    elif path.lower().endswith('.csv'):
+        with open(path, 'w') as f:
+            f.write(','.join(SERIES_COLUMNS) + '\n')
+            for chunk in chunks:
+                np.savetxt(f, np.column_stack([chunk[name] for name in SERIES_COLUMNS]),
+                           delimiter=',', fmt='%.17g')
+    else:
+        raise ValueError("Save the series as .npy or .csv")
+
+
+def shm_chart_points(t_start, t_stop, n, buckets=CHART_BUCKETS, chunk_size=CHUNK_SIZE, **params):
+    """Downsample an n-sample series for a chart without materializing it.
+
+    Each chunk keeps its share of ``buckets`` (see ``curves.downsample``),
+    chosen on x(t); v and a are taken at the same samples. Returns a dict
+    of t, x, v, a arrays and the number of samples computed.
+    """
+    parts = {name: [] for name in SERIES_COLUMNS}
+    for chunk in shm_chunks(t_start, t_stop, n, chunk_size, **params):
+        share = max(1, buckets * len(chunk['t']) // n)
+        index = downsample(chunk['t'], chunk['x'], share)
+        for name in SERIES_COLUMNS:
+            parts[name].append(chunk[name][index])
+    points = {name: np.concatenate(values) for name, values in parts.items()}
+    points['samples'] = n
+    return points
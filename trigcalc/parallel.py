@@ -0,0 +1,134 @@
+"""Multi-process batch solving over shared memory.
+
+``ParallelSolver`` keeps a process pool and one shared-memory block per
+batch kind. Each call copies the input columns into shared memory once,
+splits the rows into contiguous shards and lets the workers solve their
+shards in place with the ``trigcalc.batch`` solvers. Only the block name
+and a row range are pickled per shard, never the columns, and because
+every shard writes back to its own rows the results come out in the
+original order without a merge step.
+
+Results are identical to a single ``solve_batch`` call on the same rows.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import BATCH_KINDS, case_codes, solve_batch
+
+# Rows per shard; several shards per worker even out uneven shards
+SHARD_ROWS = 1 << 18
+
+
+class _SharedColumns:
+    """A float64 (columns, rows) matrix plus int8 case and error rows in shared memory."""
+
+    def __init__(self, n_columns, n_rows, name=None):
+        self.shape = (n_columns, n_rows)
+        size = 8 * n_columns * n_rows + 2 * n_rows
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.values = np.ndarray(self.shape, np.float64, self.shm.buf)
+        offset = self.values.nbytes
+        self.case = np.ndarray(n_rows, np.int8, self.shm.buf, offset)
+        self.error = np.ndarray(n_rows, np.int8, self.shm.buf, offset + n_rows)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        # Views into the buffer must go before the mapping can be closed
+        del self.values, self.case, self.error
+        self.shm.close()
+
+
+def _solve_shard(kind, name, shape, start, stop):
+    """Worker: solve rows [start, stop) of a shared block in place."""
+    inputs, outputs = BATCH_KINDS[kind]
+    block = _SharedColumns(*shape, name=name)
+    try:
+        rows = slice(start, stop)
+        columns = {col: block.values[i, rows] for i, col in enumerate(inputs)}
+        result = solve_batch(kind, columns, case=block.case[rows])
+        for i, col in enumerate(outputs):
+            block.values[i, rows] = result[col]
+        block.error[rows] = result['error']
+    finally:
+        block.close()
+
+
+class ParallelSolver:
+    """Solve batches on a pool of worker processes.
+
+    Use as a context manager, or call ``close()`` when done::
+
+        with ParallelSolver(workers=8) as solver:
+            result = solver.solve('oblique', columns, case=cases)
+
+    ``solve`` takes and returns the same columns as ``solve_batch``.
+    """
+
+    def __init__(self, workers=None, shard_rows=SHARD_ROWS):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_rows = shard_rows
+        self.pool = ProcessPoolExecutor(self.workers)
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _block(self, kind, n_rows):
+        """Shared block for kind with room for n_rows, reused across calls."""
+        block = self.blocks.get(kind)
+        n_columns = len(BATCH_KINDS[kind][1])
+        if block is None or block.shape[1] != n_rows:
+            if block is not None:
+                block.close()
+                block.shm.unlink()
+            block = self.blocks[kind] = _SharedColumns(n_columns, n_rows)
+        return block
+
+    def solve(self, kind, columns, case=None):
+        """Solve every row of ``columns`` (see ``solve_batch``) across the pool."""
+        inputs, outputs = BATCH_KINDS[kind]
+        given = [columns.get(col) for col in inputs]
+        n = max([np.size(v) for v in given if v is not None] + [0])
+        block = self._block(kind, n)
+
+        for i, values in enumerate(given):
+            block.values[i] = np.nan if values is None else values
+        if kind == 'oblique':
+            block.case[:] = case_codes(case)
+
+        step = max(1, min(self.shard_rows, -(-n // self.workers)))
+        futures = [self.pool.submit(_solve_shard, kind, block.name, block.shape,
+                                    start, min(start + step, n))
+                   for start in range(0, n, step)]
+        for future in futures:
+            future.result()
+
+        result = {col: block.values[i].copy() for i, col in enumerate(outputs)}
+        result['error'] = block.error.copy()
+        return result
+
+    def close(self):
+        self.pool.shutdown()
+        for block in self.blocks.values():
+            block.close()
+            block.shm.unlink()
+        self.blocks.clear()
+
+
+def solve_parallel(kind, columns, case=None, workers=None):
+    """One-off ``solve_batch`` across a temporary pool of worker processes."""
+    with ParallelSolver(workers) as solver:
+        return solver.solve(kind, columns, case)
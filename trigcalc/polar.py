@@ -0,0 +1,59 @@
+"""Polar coordinates, complex number arithmetic and De Moivre's theorem."""
+
+import math
+
+COMPLEX_OPERATIONS = ["add", "subtract", "multiply", "divide", "modulus", "conjugate", "polar"]
+BINARY_COMPLEX_OPERATIONS = ["add", "subtract", "multiply", "divide"]
+
+
+def rect_to_polar(x, y):
+    """Convert (x, y) to (r, θ) with θ in radians."""
+    if math.isnan(x) or math.isnan(y):
+        raise ValueError("Please enter both values.")
+    return math.sqrt(x*x + y*y), math.atan2(y, x)
+
+
+def polar_to_rect(r, theta):
+    """Convert (r, θ) with θ in radians to (x, y)."""
+    if math.isnan(r) or math.isnan(theta):
+        raise ValueError("Please enter both values.")
+    return r * math.cos(theta), r * math.sin(theta)
+
+
+def complex_operation(op, a, b, c=0, d=0):
+    """Apply an operation to Z₁ = a + bi and, for binary ops, Z₂ = c + di.
+
+    Returns a (real, imaginary) pair, except ``modulus`` which returns a
+    float and ``polar`` which returns (r, θ) with θ in radians.
+    """
+    if math.isnan(a) or math.isnan(b):
+        raise ValueError("Please enter Z₁.")
+    if op in BINARY_COMPLEX_OPERATIONS and (math.isnan(c) or math.isnan(d)):
+        raise ValueError("Please enter Z₂.")
+
+    if op == "add":
+        return a + c, b + d
+    if op == "subtract":
+        return a - c, b - d
+    if op == "multiply":
+        return a*c - b*d, a*d + b*c
+    if op == "divide":
+        denom = c*c + d*d
+        if denom < 1e-10:
+            raise ValueError("Cannot divide by zero")
+        return (a*c + b*d) / denom, (b*c - a*d) / denom
+    if op == "modulus":
+        return math.sqrt(a*a + b*b)
+    if op == "conjugate":
+        return a, -b
+    if op == "polar":
+        return math.sqrt(a*a + b*b), math.atan2(b, a)
+    raise ValueError(f"Unknown operation: {op}")
+
+
+def de_moivre(theta, n):
+    """(cos θ + i·sin θ)ⁿ as a (real, imaginary) pair, θ in radians."""
+    if math.isnan(theta) or math.isnan(n):
+        raise ValueError("Please enter both values.")
+    new_theta = n * theta
+    return math.cos(new_theta), math.sin(new_theta)
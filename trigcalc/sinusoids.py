@@ -0,0 +1,145 @@
+"""Sinusoidal functions: parsing, building and real-world models."""
+
+import functools
+import math
+
+from .expressions import FUNCTIONS, free_variables, parse_expression
+from .utils import PI, format_number
+
+
+SINUSOID_FUNCTIONS = ['sin', 'cos', 'tan', 'csc', 'sec', 'cot']
+SINUSOID_CACHE_SIZE = 256
+
+_FORM_ERROR = "Use the form y = A·f(B(x - C)) + D with f one of sin, cos, tan, csc, sec, cot."
+
+
+def _affine(node, unknown):
+    """(a, b) such that the AST node equals a·u + b, where u is the subtree ``unknown``."""
+    if node == unknown:
+        return 1.0, 0.0
+    kind = node[0]
+    if kind == 'num':
+        return 0.0, node[1]
+    if kind == 'var':
+        raise ValueError(_FORM_ERROR)
+    if kind == 'neg':
+        a, b = _affine(node[1], unknown)
+        return -a, -b
+    if kind == 'call':
+        a, b = _affine(node[2], unknown)
+        if a:
+            raise ValueError(_FORM_ERROR)
+        return 0.0, FUNCTIONS[node[1]](b)
+
+    a1, b1 = _affine(node[1], unknown)
+    a2, b2 = _affine(node[2], unknown)
+    if kind == '+':
+        return a1 + a2, b1 + b2
+    if kind == '-':
+        return a1 - a2, b1 - b2
+    if kind == '*' and not (a1 and a2):
+        return a1 * b2 + a2 * b1, b1 * b2
+    if kind == '/' and not a2:
+        return a1 / b2, b1 / b2
+    if kind == '^' and not (a1 or a2):
+        return 0.0, math.pow(b1, b2)
+    raise ValueError(_FORM_ERROR)
+
+
+def _outer_calls(node, name):
+    """The outermost function calls in an AST whose argument contains the variable."""
+    if node[0] == 'call' and name in free_variables(node[2]):
+        return [node]
+    calls = []
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            calls += _outer_calls(child, name)
+    return calls
+
+
+@functools.lru_cache(maxsize=SINUSOID_CACHE_SIZE)
+def sinusoid_parameters(equation):
+    """(func, A, B, C, D) of an equation y = A·f(B(x - C)) + D.
+
+    The right-hand side may be written in any equivalent way the
+    expression parser reads: "-sin x", ".5cos(2x - π/3) + 1",
+    "3 - 2tan(π(x + 1)/4)". Any single variable name works.
+    """
+    rhs = equation.split('=')
+    if len(rhs) > 2:
+        raise ValueError(_FORM_ERROR)
+    tree = parse_expression(rhs[-1])
+    names = free_variables(tree)
+    if len(names) != 1:
+        raise ValueError(_FORM_ERROR if names else "The equation has no variable.")
+    calls = set(_outer_calls(tree, names[0]))
+    if len(calls) != 1:
+        raise ValueError(_FORM_ERROR)
+    call = calls.pop()
+    if call[1] not in SINUSOID_FUNCTIONS:
+        raise ValueError(_FORM_ERROR)
+
+    try:
+        A, D = _affine(tree, call)
+        B, shift = _affine(call[2], ('var', names[0]))
+    except (ZeroDivisionError, OverflowError):
+        raise ValueError("The equation's constants cannot be evaluated.") from None
+    if A == 0 or B == 0:
+        raise ValueError("A and B must not be zero.")
+    # + 0.0 turns -0.0 into 0
+    return call[1], A, B, -shift / B + 0.0, D + 0.0
+
+
+def parse_sinusoid(equation):
+    """Read f, A, B, C and D from an equation like 'y = 2sin(3x - π/2) + 1'."""
+    func_type, A, B, C, D = sinusoid_parameters(equation)
+    amplitude = abs(A)
+    bounded = func_type in ('sin', 'cos')
+    return {
+        'func': func_type, 'A': A, 'B': B, 'C': C, 'D': D,
+        'amplitude': amplitude,
+        'period': (PI if func_type in ('tan', 'cot') else 2 * PI) / abs(B),
+        'maximum': D + amplitude if bounded else math.inf,
+        'minimum': D - amplitude if bounded else -math.inf,
+    }
+
+
+def build_sinusoid(func, A, period, C=0, D=0):
+    """Build y = A f(B(x - C)) + D from amplitude, period and shifts."""
+    if not math.isfinite(period) or period == 0:
+        raise ValueError("Please enter a valid period.")
+
+    B = 2 * PI / period
+
+    eq_parts = ["y = "]
+    if A != 1:
+        eq_parts.append(str(format_number(A)))
+    eq_parts.append(f"{func}(")
+    if B != 1:
+        eq_parts.append(format_number(B, 4))
+    if C != 0:
+        eq_parts.append(f"(x {'-' if C > 0 else '+'} {format_number(abs(C))})")
+    else:
+        eq_parts.append("x")
+    eq_parts.append(")")
+    if D != 0:
+        eq_parts.append(f" {'+' if D > 0 else '-'} {format_number(abs(D))}")
+
+    return {'equation': "".join(eq_parts), 'A': A, 'B': B, 'C': C, 'D': D, 'period': period}
+
+
+def sinusoid_model(max_val, min_val, period, max_time):
+    """Cosine model through a maximum at max_time with the given range and period."""
+    if any(math.isnan(x) for x in [max_val, min_val, period, max_time]):
+        raise ValueError("Please enter all values.")
+    if max_val <= min_val:
+        raise ValueError("Maximum must be greater than minimum.")
+    if not math.isfinite(period) or period == 0:
+        raise ValueError("Please enter a valid period.")
+
+    A = (max_val - min_val) / 2
+    D = (max_val + min_val) / 2
+    B = 2 * PI / period
+
+    equation = f"y = {format_number(A)}cos({format_number(B, 4)}(x - {max_time})) + {format_number(D)}"
+    return {'equation': equation, 'A': A, 'B': B, 'C': max_time, 'D': D, 'period': period}
@@ -0,0 +1,419 @@
+"""Trig equations in one unknown, solved over an interval (requires NumPy).
+
+``solve_equation`` takes equations such as "2sin(3x - π/4) = 1",
+"2sin²θ − sinθ − 1 = 0" or "sin x + cos x = 1" and returns every solution
+in [lo, hi). Equations that reduce algebraically are solved exactly:
+
+* a polynomial of degree 1 or 2 in one function f(aθ + b) gives real roots
+  u, and each f(aθ + b) = u is counted into the interval from its
+  principal values and period (``batch.family_solutions``);
+* two functions of the same argument where one only appears in even powers
+  are first reduced to one through cos² = 1 - sin², sec² = 1 + tan² and
+  csc² = 1 + cot² (and the same identities the other way round);
+* a·sin u + b·cos u + c = 0 is R·sin(u + φ) = -c.
+
+Anything else is solved numerically. The equation is evaluated with NumPy
+on a grid over the interval, dense enough for at least ``SAMPLES_PER_PERIOD``
+points per period of its fastest trig function. Each sign change is
+refined with Brent's method, and refined points where the equation is not
+near zero (the poles of tan, sec, ...) are dropped, as are points where a
+term of the equation is itself undefined or beyond ``POLE_LIMIT``. A root where the
+equation touches zero without crossing it is only found if it falls on
+the grid.
+
+Results are cached per normalized equation (constants folded, the unknown
+renamed), so repeating a query, or asking an equivalent one, is a lookup.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+from .batch import family_solutions, solution_families
+from .expressions import BINARY_OPERATORS, FUNCTIONS, free_variables, parse_expression
+from .utils import PI, format_number
+
+SOLVER_CACHE_SIZE = 256
+SCAN_POINTS = 1 << 14
+MAX_SCAN_POINTS = 1 << 22
+SAMPLES_PER_PERIOD = 64
+MAX_ITERATIONS = 100
+ROOT_TOLERANCE = 1e-15
+# A numeric root where a function or quotient of the unknown is larger than
+# this sits on a pole that cancels out ("tan x = sec x" at 90°), not a zero
+POLE_LIMIT = 1 / math.sqrt(np.finfo(np.float64).eps)
+
+TRIG = ('sin', 'cos', 'tan', 'csc', 'sec', 'cot')
+INVERSE = tuple('arc' + name for name in TRIG) + tuple('a' + name for name in TRIG)
+
+# f -> (g, α, β) with f² = α + β·g², for when f only appears in even powers
+SQUARES = {
+    'cos': ('sin', 1.0, -1.0), 'sin': ('cos', 1.0, -1.0),
+    'sec': ('tan', 1.0, 1.0), 'tan': ('sec', -1.0, 1.0),
+    'csc': ('cot', 1.0, 1.0), 'cot': ('csc', -1.0, 1.0),
+}
+
+NUMPY_FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'csc': lambda x: 1 / np.sin(x), 'sec': lambda x: 1 / np.cos(x),
+    'cot': lambda x: np.cos(x) / np.sin(x),
+    'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan,
+    'arccsc': lambda x: np.arcsin(1 / x), 'arcsec': lambda x: np.arccos(1 / x),
+    'arccot': lambda x: PI / 2 - np.arctan(x),
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'sqrt': np.sqrt, 'abs': np.abs, 'exp': np.exp, 'ln': np.log, 'log': np.log10,
+}
+for _name in TRIG:
+    NUMPY_FUNCTIONS['a' + _name] = NUMPY_FUNCTIONS['arc' + _name]
+
+NUMPY_OPERATORS = {'+': np.add, '-': np.subtract, '*': np.multiply, '/': np.divide, '^': np.power}
+
+UNKNOWN = ('var', 'θ')
+
+
+class _Irreducible(Exception):
+    """The equation has no algebraic reduction; solve it numerically."""
+
+
+def _apply(name, x, degrees):
+    """A named function of a constant, with trig in degrees if ``degrees``."""
+    if degrees and name in TRIG:
+        x = x * PI / 180
+    y = FUNCTIONS[name](x)
+    return y * 180 / PI if degrees and name in INVERSE else y
+
+
+def _normalize(node, degrees):
+    """The AST with constant subtrees folded to numbers and the unknown named θ."""
+    kind = node[0]
+    if kind == 'num':
+        return node
+    if kind == 'var':
+        return UNKNOWN
+    children = tuple(_normalize(child, degrees) if isinstance(child, tuple) else child
+                     for child in node[1:])
+    node = (kind,) + children
+    operands = [child for child in children if isinstance(child, tuple)]
+    if any(child[0] != 'num' for child in operands):
+        return node
+    try:
+        if kind == 'neg':
+            value = -operands[0][1]
+        elif kind == 'call':
+            value = _apply(node[1], operands[0][1], degrees)
+        else:
+            value = BINARY_OPERATORS[kind](operands[0][1], operands[1][1])
+    except (ValueError, ZeroDivisionError, OverflowError):
+        raise ValueError("The equation's constants cannot be evaluated.") from None
+    return ('num', float(value))
+
+
+def _equation_tree(equation, degrees):
+    """Normalized AST of lhs - rhs (or of the expression, if there is no '=')."""
+    sides = equation.split('=')
+    if len(sides) > 2:
+        raise ValueError("Enter a single equation with one '='.")
+    trees = [parse_expression(side) for side in sides]
+    tree = trees[0] if len(trees) == 1 else ('-', trees[0], trees[1])
+    names = free_variables(tree)
+    if len(names) != 1:
+        raise ValueError("The equation must have exactly one unknown." if names
+                         else "The equation has no unknown.")
+    return _normalize(tree, degrees)
+
+
+def _trig_calls(node):
+    """Distinct trig calls whose argument contains the unknown, outermost only."""
+    if node[0] == 'call' and node[1] in TRIG and free_variables(node[2]):
+        return [node]
+    calls = []
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            calls += [call for call in _trig_calls(child) if call not in calls]
+    return calls
+
+
+def _polynomial(node, atoms):
+    """{exponents: coefficient} of an AST as a polynomial in the ``atoms`` subtrees."""
+    if node in atoms:
+        return {tuple(int(atom == node) for atom in atoms): 1.0}
+    kind = node[0]
+    if kind == 'num':
+        return {(0,) * len(atoms): node[1]} if node[1] else {}
+    if kind in ('var', 'call'):
+        raise _Irreducible
+    if kind == 'neg':
+        return {e: -c for e, c in _polynomial(node[1], atoms).items()}
+
+    left = _polynomial(node[1], atoms)
+    right = _polynomial(node[2], atoms)
+    if kind in ('+', '-'):
+        sign = 1.0 if kind == '+' else -1.0
+        result = dict(left)
+        for e, c in right.items():
+            result[e] = result.get(e, 0.0) + sign * c
+        return {e: c for e, c in result.items() if c}
+    if kind == '*':
+        return _multiply(left, right)
+
+    constant = right.get((0,) * len(atoms), 0.0)
+    if len(right) > (1 if constant else 0):
+        raise _Irreducible
+    if kind == '/':
+        if not constant:
+            raise ValueError("Division by zero")
+        return {e: c / constant for e, c in left.items()}
+    if constant != int(constant) or not 0 <= constant <= 4:
+        raise _Irreducible
+    result = {(0,) * len(atoms): 1.0}
+    for _ in range(int(constant)):
+        result = _multiply(result, left)
+    return result
+
+
+def _multiply(left, right):
+    result = {}
+    for e1, c1 in left.items():
+        for e2, c2 in right.items():
+            e = tuple(a + b for a, b in zip(e1, e2))
+            result[e] = result.get(e, 0.0) + c1 * c2
+    return {e: c for e, c in result.items() if c}
+
+
+def _affine(node):
+    """(a, b) with node = a·θ + b and a ≠ 0."""
+    poly = _polynomial(node, (UNKNOWN,))
+    if any(e[0] > 1 for e in poly) or not poly.get((1,)):
+        raise _Irreducible
+    return poly[(1,)], poly.get((0,), 0.0)
+
+
+def _reduce(tree, degrees):
+    """(func, a, b, coefficients, reduction) for an equation that is a polynomial in f(aθ + b).
+
+    ``coefficients`` are c0, c1, c2, ... of c0 + c1·u + c2·u² + ... = 0.
+    """
+    calls = _trig_calls(tree)
+    if not calls or len(calls) > 2 or len({call[2] for call in calls}) != 1:
+        raise _Irreducible
+    a, b = _affine(calls[0][2])
+    poly = _polynomial(tree, tuple(calls))
+    names = [call[1] for call in calls]
+
+    if len(calls) == 1:
+        return names[0], a, b, _coefficients(poly, 0), "polynomial"
+
+    for keep in (0, 1):
+        drop = 1 - keep
+        other, alpha, beta = SQUARES[names[drop]]
+        if other == names[keep] and all(e[drop] % 2 == 0 for e in poly):
+            # f^(2m)·g^q -> (α + β·g²)^m·g^q
+            single = {}
+            for e, c in poly.items():
+                for i in range(e[drop] // 2 + 1):
+                    term = c * math.comb(e[drop] // 2, i) * alpha ** (e[drop] // 2 - i) * beta ** i
+                    power = e[keep] + 2 * i
+                    single[power] = single.get(power, 0.0) + term
+            poly = {(p,): c for p, c in single.items() if c}
+            return names[keep], a, b, _coefficients(poly, 0), f"polynomial via {names[drop]}²"
+
+    if set(names) == {'sin', 'cos'} and all(sum(e) <= 1 for e in poly):
+        s = names.index('sin')
+        c0 = poly.get((0, 0), 0.0)
+        c_sin = poly.get(tuple(int(i == s) for i in range(2)), 0.0)
+        c_cos = poly.get(tuple(int(i != s) for i in range(2)), 0.0)
+        # c_sin·sin u + c_cos·cos u = R·sin(u + φ)
+        R, phi = math.hypot(c_sin, c_cos), math.atan2(c_cos, c_sin)
+        if degrees:
+            phi = phi * 180 / PI
+        return 'sin', a, b + phi, [c0, R], "a·sin + b·cos"
+    raise _Irreducible
+
+
+def _coefficients(poly, index):
+    degree = max((e[index] for e in poly), default=0)
+    coefficients = [0.0] * (degree + 1)
+    for e, c in poly.items():
+        coefficients[e[index]] += c
+    return coefficients
+
+
+def _real_roots(coefficients):
+    """Real roots of c0 + c1·u + c2·u², without the cancellation of the textbook formula."""
+    while len(coefficients) > 1 and coefficients[-1] == 0:
+        coefficients = coefficients[:-1]
+    if len(coefficients) > 3:
+        raise _Irreducible
+    if len(coefficients) == 1:
+        if coefficients[0] == 0:
+            raise ValueError("The equation holds for every θ.")
+        return []
+    if len(coefficients) == 2:
+        return [-coefficients[0] / coefficients[1]]
+    c, b, a = coefficients
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return []
+    if disc == 0:
+        return [-b / (2 * a)]
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    return sorted({q / a, c / q})
+
+
+def _solve_exact(tree, lo, hi, degrees):
+    func, a, b, coefficients, reduction = _reduce(tree, degrees)
+    roots = np.array(_real_roots(coefficients), dtype=np.float64)
+    first, second, period, _ = solution_families(func, roots)
+    if degrees:
+        first, second, period = first * 180 / PI, second * 180 / PI, 360.0 if period == 2 * PI else 180.0
+
+    # f(aθ + b) = u at aθ + b = base + period·n
+    first, second, period = (first - b) / a, (second - b) / a, period / abs(a)
+    # Widen the interval by a rounding error so that solutions at lo are not lost
+    tolerance = 1e-10 * max(1.0, abs(lo), abs(hi))
+    values = family_solutions(first, second, period, lo - tolerance, hi - tolerance)['values']
+    values = np.unique(np.maximum(values, lo))
+    values[np.abs(values) < tolerance] = 0.0
+
+    bases = np.concatenate([first, second])
+    bases = np.unique(np.mod(bases[~np.isnan(bases)], period))
+    argument = ("θ" if a == 1 else "-θ" if a == -1 else f"{format_number(a, 4)}θ") \
+        + (f" {'+' if b > 0 else '-'} {format_number(abs(b), 4)}" if b else "")
+    return {
+        'solutions': tuple(float(v) for v in values), 'method': 'exact',
+        'reduction': f"{reduction} in {func}({argument})",
+        'families': tuple((float(base), float(period)) for base in bases),
+    }
+
+
+def _numpy_function(node, degrees):
+    """Turn a normalized AST into a NumPy function of θ."""
+    kind = node[0]
+    if kind == 'num':
+        value = node[1]
+        return lambda x: value
+    if kind == 'var':
+        return lambda x: x
+    if kind == 'neg':
+        operand = _numpy_function(node[1], degrees)
+        return lambda x: -operand(x)
+    if kind == 'call':
+        fn = NUMPY_FUNCTIONS[node[1]]
+        operand = _numpy_function(node[2], degrees)
+        if degrees and node[1] in TRIG:
+            return lambda x: fn(operand(x) * (PI / 180))
+        if degrees and node[1] in INVERSE:
+            return lambda x: fn(operand(x)) * (180 / PI)
+        return lambda x: fn(operand(x))
+    op = NUMPY_OPERATORS[kind]
+    left = _numpy_function(node[1], degrees)
+    right = _numpy_function(node[2], degrees)
+    return lambda x: op(left(x), right(x))
+
+
+def _brent(f, a, b, fa, fb):
+    """Root of f between a and b, where fa and fb differ in sign (Brent's method)."""
+    eps = np.finfo(np.float64).eps
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(MAX_ITERATIONS):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * eps * abs(b) + ROOT_TOLERANCE
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            break
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation, or the secant when a == c
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = float(f(b))
+    return b, fb
+
+
+def _fastest_rate(node, degrees):
+    """Largest |a| over the trig calls f(aθ + b) in an AST, in radians per unit of θ."""
+    rate = 0.0
+    for call in _trig_calls(node):
+        try:
+            a, _ = _affine(call[2])
+        except _Irreducible:
+            a = 1.0
+        rate = max(rate, abs(a) * (PI / 180 if degrees else 1.0), _fastest_rate(call[2], degrees))
+    return rate
+
+
+def _pole_terms(node):
+    """Calls and quotients in an AST that depend on the unknown."""
+    terms = [node] if node[0] in ('call', '/') and free_variables(node) else []
+    for child in node[1:]:
+        if isinstance(child, tuple):
+            terms += _pole_terms(child)
+    return terms
+
+
+def _solve_numeric(tree, lo, hi, degrees):
+    f = _numpy_function(tree, degrees)
+    terms = [_numpy_function(term, degrees) for term in _pole_terms(tree)]
+    periods = (hi - lo) * _fastest_rate(tree, degrees) / (2 * PI)
+    points = int(min(max(SCAN_POINTS, periods * SAMPLES_PER_PERIOD), MAX_SCAN_POINTS))
+    x = np.linspace(lo, hi, points)
+    with np.errstate(all='ignore'):
+        y = np.broadcast_to(f(x), x.shape).astype(np.float64)
+        sign = np.sign(y)
+        crossing = np.flatnonzero(np.isfinite(y[:-1]) & np.isfinite(y[1:]) & (sign[:-1] * sign[1:] < 0))
+        roots = list(x[:-1][y[:-1] == 0])
+        for i in crossing:
+            root, value = _brent(f, float(x[i]), float(x[i + 1]), float(y[i]), float(y[i + 1]))
+            # A pole also changes sign, but the equation grows instead of vanishing near it
+            if abs(value) <= min(abs(y[i]), abs(y[i + 1])) and abs(value) < 1e-6:
+                roots.append(root)
+        # Removable poles: the equation tends to 0 but is undefined there
+        roots = [r for r in roots
+                 if all(abs(float(term(r))) <= POLE_LIMIT for term in terms)]
+    return {
+        'solutions': tuple(sorted(float(r) for r in roots if lo <= r < hi)), 'method': 'numeric',
+        'reduction': f"Brent's method on {points:,} samples", 'families': (),
+    }
+
+
+@functools.lru_cache(maxsize=SOLVER_CACHE_SIZE)
+def _solve(tree, lo, hi, degrees):
+    try:
+        return _solve_exact(tree, lo, hi, degrees)
+    except _Irreducible:
+        return _solve_numeric(tree, lo, hi, degrees)
+
+
+def solve_equation(equation, lo, hi, degrees=False):
+    """Every solution in [lo, hi) of an equation in one unknown (see module docstring).
+
+    Trig functions take the unknown in degrees if ``degrees``. Returns the
+    sorted ``solutions``, the ``method`` ('exact' or 'numeric'), a
+    description of the ``reduction`` used and, for exact solutions, the
+    ``families`` of (base, period) pairs meaning θ = base + period·n.
+    """
+    if not (math.isfinite(lo) and math.isfinite(hi)) or hi <= lo:
+        raise ValueError("Enter an interval with start < end.")
+    return dict(_solve(_equation_tree(equation, degrees), float(lo), float(hi), bool(degrees)))
@@ -0,0 +1,228 @@
+"""Dominant periods of long signals by Welch's method (requires NumPy).
+
+A signal is streamed in chunks and cut into Hann-windowed segments of
+``segment`` samples overlapping by half. The averaged power spectrum of
+the segments (``welch_spectrum``) shows which frequencies dominate, and
+only one segment and the running average are ever held in memory, so the
+length of the signal does not matter.
+
+The spectrum alone gives neither phase nor an exact frequency, so
+``dominant_sinusoids`` makes a second pass. For every peak it projects
+each whole segment onto e^{-iωt} at the peak's frequency: the phase of
+those projections drifts linearly by however far the frequency is off,
+and a line through them gives the frequency correction and the phase at
+t = 0. Each peak is then reported as y = A cos(B(t - C)) + D.
+
+Signals come from CSV files (one column, read with pyarrow), ``.npy``
+files (memory-mapped) or raw binary files of a given dtype (memory-mapped).
+Missing samples (empty cells, NaN) keep their place in time: the mean is
+taken over the samples present, and the gaps count as the mean in every
+segment.
+"""
+
+import os
+
+import numpy as np
+
+from .curves import CHART_BUCKETS, downsample
+from .fitting import CHUNK_SIZE, csv_chunks
+from .utils import PI, format_number
+
+DEFAULT_SEGMENT = 1 << 16
+BINARY_DTYPES = ["float64", "float32", "int32", "int16", "uint16", "int8", "uint8"]
+
+
+def signal_chunks(source, dtype="float64", column=None, chunk_size=CHUNK_SIZE):
+    """Yield a signal as float64 chunks from a CSV, .npy or raw binary file.
+
+    ``source`` is a path or an uploaded file object. CSV files need the
+    ``column`` to read; 2-D .npy arrays take ``column`` as an index
+    (default 0). Anything else is read as raw ``dtype`` values. Paths are
+    memory-mapped; file objects are read from their buffer without a copy.
+    Missing samples stay in place as NaN.
+    """
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '')
+    ext = os.path.splitext(str(name))[1].lower()
+    if ext == '.csv':
+        if column is None:
+            raise ValueError("Choose the CSV column that holds the signal.")
+        for _, y in csv_chunks(source, column, chunk_size=chunk_size, skip_missing=False):
+            yield y
+        return
+
+    if ext == '.npy':
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        data = np.load(source, mmap_mode='r' if isinstance(source, (str, os.PathLike)) else None)
+        if data.ndim == 2:
+            data = data[:, column or 0]
+        elif data.ndim != 1:
+            raise ValueError("A .npy signal must be a 1-D array or a table of columns.")
+    elif dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported sample type: {dtype}")
+    elif isinstance(source, (str, os.PathLike)):
+        if os.path.getsize(source) < np.dtype(dtype).itemsize:
+            raise ValueError("The file holds no samples.")
+        data = np.memmap(source, dtype=dtype, mode='r')
+    else:
+        buffer = source.getbuffer()
+        data = np.frombuffer(buffer, dtype=dtype, count=len(buffer) // np.dtype(dtype).itemsize)
+
+    for start in range(0, len(data), chunk_size):
+        yield np.asarray(data[start:start + chunk_size], dtype=np.float64)
+
+
+def _centered(values, mean):
+    """values - mean, with missing (NaN) samples set to 0."""
+    centered = values - mean
+    centered[np.isnan(centered)] = 0
+    return centered
+
+
+def _segments(chunks, length, hop):
+    """Yield (first sample index, segment) for each full segment in a chunk stream.
+
+    If the stream is shorter than one segment, it is yielded whole instead.
+    """
+    buffer = np.empty(0)
+    start = 0  # sample index of buffer[0]
+    found = False
+    for chunk in chunks:
+        buffer = np.concatenate([buffer, chunk]) if len(buffer) else chunk
+        offset = 0
+        while len(buffer) - offset >= length:
+            yield start + offset, buffer[offset:offset + length]
+            found = True
+            offset += hop
+        buffer = buffer[offset:]
+        start += offset
+    if not found and len(buffer):
+        yield start, buffer
+
+
+def welch_spectrum(chunks, segment=DEFAULT_SEGMENT, spacing=1.0):
+    """Averaged power spectrum of a chunk stream (50% overlapping Hann segments).
+
+    Returns ``frequency`` (cycles per time unit, with ``spacing`` time
+    units between samples) and ``power`` arrays, plus the number of
+    ``samples`` present (not NaN), their ``mean``, the ``segment`` length
+    used and how many ``segments`` were averaged.
+    """
+    if not spacing > 0:
+        raise ValueError("The sample spacing must be positive.")
+    if segment < 8 or segment & (segment - 1):
+        raise ValueError("The segment length must be a power of 2 (at least 8).")
+
+    stats = {'samples': 0, 'sum': 0.0}
+
+    def counted():
+        for chunk in chunks:
+            present = chunk[~np.isnan(chunk)]
+            stats['samples'] += len(present)
+            stats['sum'] += float(present.sum())
+            yield chunk
+
+    power = window = None
+    count = 0
+    for _, values in _segments(counted(), segment, segment // 2):
+        if window is None:
+            window = np.hanning(len(values))
+            power = np.zeros(len(values) // 2 + 1)
+        present = values[~np.isnan(values)]
+        mean = present.mean() if len(present) else 0.0
+        power += np.abs(np.fft.rfft(_centered(values, mean) * window)) ** 2
+        count += 1
+    n = stats['samples']
+    if n < 8:
+        raise ValueError("The signal needs at least 8 samples.")
+    return {
+        'frequency': np.fft.rfftfreq(len(window), spacing), 'power': power / count,
+        'samples': n, 'mean': stats['sum'] / n, 'segment': len(window), 'segments': count,
+    }
+
+
+def spectral_peaks(power, peaks=3):
+    """Bins of the strongest local maxima of a power spectrum, strongest first.
+
+    Each bin comes with its offset (-0.5 to 0.5) from a parabola through
+    the log power around it.
+    """
+    inner = power[1:-1]
+    local = np.flatnonzero((inner > power[:-2]) & (inner >= power[2:]) & (inner > 0)) + 1
+    found = []
+    for k in local[np.argsort(power[local])[::-1][:peaks]]:
+        left, mid, right = np.log(power[k - 1:k + 2] + 1e-300)
+        curve = left - 2 * mid + right
+        found.append((int(k), float(0.5 * (left - right) / curve) if curve < 0 else 0.0))
+    return found
+
+
+def dominant_sinusoids(chunks, peaks=3, segment=DEFAULT_SEGMENT, spacing=1.0,
+                       buckets=CHART_BUCKETS):
+    """The strongest periodic components of a signal, as sinusoids.
+
+    ``chunks`` is a function returning a fresh iterator of float64 chunks
+    (see ``signal_chunks``); the signal is read twice. Time runs from 0 at
+    the first sample in steps of ``spacing``. Returns ``components``, a
+    list of dicts with A, B, C, D (as in y = A cos(B(t - C)) + D), period,
+    frequency, the ``share`` of the signal's power within one bin of the
+    peak and the ``equation``; and the Welch spectrum downsampled to
+    ``buckets`` for a chart.
+    """
+    spectrum = welch_spectrum(chunks(), segment, spacing)
+    power, length = spectrum['power'], spectrum['segment']
+    D = spectrum['mean']
+    found = spectral_peaks(power, peaks)
+    if not found:
+        raise ValueError("No periodic component found; the signal may be constant.")
+
+    # Second pass: whole segments projected onto each peak's e^{-iωt}
+    omegas = np.array([2 * PI * (k + shift) / length for k, shift in found])
+    window = np.hanning(length)
+    tau = np.arange(length)
+    kernels = np.concatenate([window[:, None] * np.cos(omegas * tau[:, None]),
+                              window[:, None] * -np.sin(omegas * tau[:, None])], axis=1)
+    starts, projections = [], []
+    for start, values in _segments(chunks(), length, length):
+        starts.append(start)
+        projections.append(_centered(values, D) @ kernels)
+
+    starts = np.array(starts, dtype=np.float64)
+    projections = np.array(projections)
+    z = (projections[:, :len(omegas)] + 1j * projections[:, len(omegas):]) \
+        * np.exp(-1j * np.outer(starts, omegas))
+    centers = starts + (length - 1) / 2
+
+    total_power = power.sum()
+    components = []
+    for j, (k, _) in enumerate(found):
+        # arg z = δ·t_center - φ for y = A cos((ω + δ)t - φ)
+        phases = np.unwrap(np.angle(z[:, j]))
+        weights = np.abs(z[:, j])
+        if len(centers) > 1 and weights.sum() > 0:
+            drift, offset = np.polyfit(centers, phases, 1, w=weights)
+        else:
+            drift, offset = 0.0, phases[0]
+        omega = omegas[j] + drift
+        coherent = np.mean(z[:, j] * np.exp(-1j * (drift * centers + offset)))
+        A = 2 * abs(coherent) / window.sum()
+        phi = -offset
+
+        B = omega / spacing
+        period = 2 * PI / B
+        C = (phi / omega) % (2 * PI / omega) * spacing
+        components.append({
+            'A': float(A), 'B': float(B), 'C': float(C), 'D': float(D),
+            'period': float(period), 'frequency': float(1 / period),
+            'share': float(power[max(k - 1, 0):k + 2].sum() / total_power),
+            'equation': f"y = {format_number(A)}cos({format_number(B, 4)}(x - {format_number(C)}))"
+                        f" + {format_number(D)}",
+        })
+
+    frequency = spectrum['frequency']
+    index = downsample(frequency, power, buckets)
+    return {
+        'components': components, 'samples': spectrum['samples'],
+        'segment': length, 'segments': spectrum['segments'],
+        'frequency': frequency[index], 'power': power[index],
+    }
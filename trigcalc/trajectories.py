@@ -0,0 +1,214 @@
+"""Projectile trajectories with air resistance (requires NumPy).
+
+The motion is integrated with classical fixed-step RK4 for a whole array of
+launch angles at once: every step advances all trajectories with a handful
+of array operations, so a sweep costs about as much as one trajectory.
+Position and velocity are stored as complex numbers (x + iy), which halves
+the number of array operations per step.
+
+Drag is per unit mass: ``'linear'`` gives a = -k·v and ``'quadratic'``
+gives a = -k·|v|·v, plus gravity. A trajectory lands where it first
+crosses y = 0 going down; the crossing is interpolated within the step.
+"""
+
+import math
+
+import numpy as np
+
+from .curves import CHART_BUCKETS, downsample
+from .utils import PI
+
+DRAG_MODELS = ["none", "linear", "quadratic"]
+DEFAULT_STEPS = 10_000
+
+# Landings and heights are checked once per block of steps, not every step
+_BLOCK = 32
+
+# Trajectories still in the air after ``steps`` steps get up to this many
+# times as many before they are reported as never landing
+_STEP_CAP = 4
+MAX_STEPS = 10 * DEFAULT_STEPS
+
+
+def _flight_time(v0, angles, h0, g, drag, model):
+    """Upper bound on the longest flight time over the angles.
+
+    Drag shortens the climb and lowers the peak (no lower than with drag on
+    the vertical motion alone), but the fall from the peak can take longer
+    than in a vacuum: from rest, a drop of H at terminal velocity v_t takes
+    at most H / v_t + v_t / g. Returns 0 if no angle climbs above y = 0.
+    """
+    vy = v0 * np.sin(angles * PI / 180)
+    if drag == 0:
+        discriminant = vy * vy + 2 * g * h0
+        times = (vy + np.sqrt(np.maximum(discriminant, 0))) / g
+        return float(times.max())
+    terminal = _terminal_velocity(g, drag, model)
+    vy = np.maximum(vy, 0)
+    if model == "linear":
+        climb = np.log1p(vy / terminal) / drag
+        peak = h0 + (vy - g * climb) / drag
+    else:
+        climb = terminal / g * np.arctan(vy / terminal)
+        peak = h0 + terminal * terminal / (2 * g) * np.log1p((vy / terminal) ** 2)
+    if not (peak > 0).any():
+        return 0.0
+    return float((climb + np.maximum(peak, 0) / terminal + terminal / g).max())
+
+
+def _terminal_velocity(g, drag, model):
+    return g / drag if model == "linear" else math.sqrt(g / drag)
+
+
+def _stable_step(v0, g, drag, model):
+    """Longest time step that keeps RK4 stable and accurate under drag."""
+    if model == "linear":
+        return 1 / drag
+    return 1 / (2 * drag * max(v0, _terminal_velocity(g, drag, model)))
+
+
+def simulate_trajectories(v0, angle, h0=0, g=9.81, drag=0.0, model="quadratic",
+                          steps=DEFAULT_STEPS, dt=None, record=False):
+    """Integrate projectiles launched at every angle in ``angle`` (degrees).
+
+    ``dt`` defaults to a bound on the longest flight time divided by
+    ``steps`` (plus 5%), so every trajectory lands within about ``steps``
+    steps; strong drag takes more, shorter steps to keep RK4 stable. Integration stops once all have landed; any still in the air get
+    up to ``_STEP_CAP`` times as many steps.
+
+    Returns a dict of arrays over the angles: ``range``, ``max_height``
+    and ``flight_time`` (NaN if it never came back down to y = 0) plus
+    ``dt``. With ``record=True`` it also returns ``t`` and the ``x`` and
+    ``y`` paths as (time step, angle) arrays up to the last landing.
+    """
+    angles = np.atleast_1d(np.asarray(angle, dtype=np.float64))
+    if not (v0 > 0 and g > 0):
+        raise ValueError("Velocity and gravity must be positive.")
+    if model not in DRAG_MODELS:
+        raise ValueError(f"Unknown drag model: {model}")
+    if not drag >= 0:
+        raise ValueError("Drag coefficient must be zero or positive.")
+    if model == "none":
+        drag = 0.0
+    if dt is None:
+        flight = 1.05 * _flight_time(v0, angles, h0, g, drag, model)
+        dt = flight / steps
+        if not dt > 0:
+            raise ValueError("The projectile never reaches the ground (y = 0).")
+        if drag > 0 and dt > _stable_step(v0, g, drag, model):
+            dt = _stable_step(v0, g, drag, model)
+            steps = math.ceil(flight / dt)
+            if steps > MAX_STEPS:
+                raise ValueError("The drag is too strong to simulate this flight; "
+                                 "lower the drag or the launch height.")
+
+    n = len(angles)
+    vel = v0 * np.exp(1j * (angles * PI / 180))
+    gravity = -1j * g
+    quadratic = model == "quadratic"
+
+    def accel(v):
+        if drag == 0:
+            return np.full_like(v, gravity)
+        a = v * (abs(v) * -drag) if quadratic else v * -drag
+        a += gravity
+        return a
+
+    ring = np.empty((_BLOCK + 1, n), dtype=np.complex128)
+    ring[0] = 1j * h0
+    path = [ring[0].copy()] if record else None
+
+    max_height = np.full(n, float(h0))
+    flight_time = np.full(n, np.nan)
+    landing_x = np.full(n, np.nan)
+    flying = np.ones(n, dtype=bool)
+    half, sixth = dt / 2, dt / 6
+
+    step, last = 0, steps * _STEP_CAP
+    while step < last and flying.any():
+        block = min(_BLOCK, last - step)
+        for i in range(1, block + 1):
+            k1 = accel(vel)
+            v2 = vel + half * k1
+            k2 = accel(v2)
+            v3 = vel + half * k2
+            k3 = accel(v3)
+            v4 = vel + dt * k3
+            k4 = accel(v4)
+            # x' = v, so the position stages are the intermediate velocities
+            np.add(ring[i - 1], sixth * (vel + 2 * (v2 + v3) + v4), out=ring[i])
+            vel += sixth * (k1 + 2 * (k2 + k3) + k4)
+
+        y = ring[:block + 1].imag
+        np.maximum(max_height, y.max(axis=0), out=max_height)
+        down = (y[:-1] >= 0) & (y[1:] < 0) & flying
+        cols = np.flatnonzero(down.any(axis=0))
+        if len(cols):
+            rows = down[:, cols].argmax(axis=0)
+            y0, y1 = y[rows, cols], y[rows + 1, cols]
+            frac = y0 / (y0 - y1)
+            x0, x1 = ring[rows, cols].real, ring[rows + 1, cols].real
+            landing_x[cols] = x0 + frac * (x1 - x0)
+            flight_time[cols] = (step + rows + frac) * dt
+            flying[cols] = False
+
+        if record:
+            path.append(ring[1:block + 1].copy())
+        ring[0] = ring[block]
+        step += block
+
+    # A trajectory still in the air may not have reached its peak
+    max_height[flying & (vel.imag > 0)] = np.nan
+
+    result = {'range': landing_x, 'max_height': max_height,
+              'flight_time': flight_time, 'dt': dt}
+    if record:
+        positions = np.concatenate([p.reshape(-1, n) for p in path])
+        result['t'] = np.arange(len(positions)) * dt
+        result['x'] = positions.real
+        result['y'] = positions.imag
+    return result
+
+
+def optimal_angle(v0, h0=0, g=9.81, drag=0.0, model="quadratic",
+                  angles=1000, steps=DEFAULT_STEPS):
+    """Launch angle in (0°, 90°) with the longest range, from one sweep.
+
+    ``angles`` evenly spaced angles are simulated together; returns a dict
+    with the best ``angle``, its ``range`` and the full sweep (``angles``,
+    ``ranges``).
+    """
+    sweep = np.linspace(0, 90, angles + 2)[1:-1]
+    result = simulate_trajectories(v0, sweep, h0, g, drag, model, steps)
+    ranges = result['range']
+    if np.isnan(ranges).all():
+        raise ValueError("No launch angle reaches the ground (y = 0).")
+    best = int(np.nanargmax(ranges))
+    return {'angle': float(sweep[best]), 'range': float(ranges[best]),
+            'angles': sweep, 'ranges': ranges}
+
+
+def trajectory_path(v0, angle, h0=0, g=9.81, drag=0.0, model="quadratic",
+                    buckets=CHART_BUCKETS):
+    """Simulate one launch for display.
+
+    Returns its range, max_height and flight_time (NaN if it never lands)
+    and the path up to landing, downsampled to ``x`` and ``y`` arrays.
+    """
+    if any(math.isnan(x) for x in [v0, angle, h0, g, drag]):
+        raise ValueError("Please enter velocity and angle.")
+    result = simulate_trajectories(v0, angle, h0, g, drag, model, record=True)
+    x, y = result['x'][:, 0], result['y'][:, 0]
+    landed = not math.isnan(result['flight_time'][0])
+    if landed:
+        # Drop the samples below ground and end exactly at the landing point
+        above = np.flatnonzero(result['t'] < result['flight_time'][0])
+        x = np.append(x[above], result['range'][0])
+        y = np.append(y[above], 0.0)
+    index = downsample(x, y, buckets)
+    return {
+        'x': x[index], 'y': y[index], 'landed': landed,
+        'range': float(result['range'][0]),
+        'max_height': float(result['max_height'][0]),
+        'flight_time': float(result['flight_time'][0]),
+    }
@@ -0,0 +1,206 @@
+"""Right and oblique triangle solvers.
+
+All angles are in degrees. Missing values are passed as NaN, which is what
+``parse_number`` returns for empty input.
+"""
+
+import math
+import re
+
+from .utils import to_radians, to_degrees, parse_number
+
+NAN = float('nan')
+
+OBLIQUE_CASES = ["AAS", "ASA", "SSA", "SAS", "SSS"]
+
+
+def solve_right_triangle(a=NAN, b=NAN, c=NAN, A=NAN, B=NAN):
+    """Solve a right triangle (C = 90°) from any two values including a side."""
+    sides_count = sum([not math.isnan(x) for x in [a, b, c]])
+    angles_count = sum([not math.isnan(x) for x in [A, B]])
+
+    if sides_count == 0:
+        raise ValueError("At least one side is required.")
+    if sides_count + angles_count < 2:
+        raise ValueError("Please provide at least two values.")
+
+    if sides_count >= 2:
+        if not math.isnan(a) and not math.isnan(b):
+            c = math.sqrt(a*a + b*b)
+        elif not math.isnan(a) and not math.isnan(c):
+            if a >= c:
+                raise ValueError("Side a must be less than hypotenuse c")
+            b = math.sqrt(c*c - a*a)
+        else:
+            if b >= c:
+                raise ValueError("Side b must be less than hypotenuse c")
+            a = math.sqrt(c*c - b*b)
+
+        A = to_degrees(math.asin(max(-1, min(1, a / c))))
+        B = 90 - A
+
+    elif sides_count == 1 and angles_count >= 1:
+        if not math.isnan(A):
+            B = 90 - A
+        else:
+            A = 90 - B
+
+        A_rad = to_radians(A)
+
+        if not math.isnan(a):
+            c = a / math.sin(A_rad)
+            b = a / math.tan(A_rad)
+        elif not math.isnan(b):
+            c = b / math.cos(A_rad)
+            a = b * math.tan(A_rad)
+        else:
+            a = c * math.sin(A_rad)
+            b = c * math.cos(A_rad)
+
+    return {'a': a, 'b': b, 'c': c, 'A': A, 'B': B, 'area': 0.5 * a * b}
+
+
+def elevation_height(distance, angle):
+    """Height seen at an angle of elevation from a horizontal distance."""
+    if math.isnan(distance) or math.isnan(angle):
+        raise ValueError("Please enter both distance and angle.")
+    return distance * math.tan(to_radians(angle))
+
+
+def depression_distance(height, angle):
+    """Horizontal distance seen at an angle of depression from a height."""
+    if math.isnan(height) or math.isnan(angle):
+        raise ValueError("Please enter both height and angle.")
+    return height / math.tan(to_radians(angle))
+
+
+def parse_bearing(bearing_str):
+    """Parse 'N30°E' style or numeric bearings into degrees clockwise from north."""
+    match = re.match(r'([NS])(\d+)[°]?([EW])', bearing_str, re.IGNORECASE)
+    if not match:
+        return parse_number(bearing_str)
+
+    ns = match.group(1).upper()
+    angle = float(match.group(2))
+    ew = match.group(3).upper()
+
+    if ns == 'N' and ew == 'E':
+        return angle
+    elif ns == 'S' and ew == 'E':
+        return 180 - angle
+    elif ns == 'S' and ew == 'W':
+        return 180 + angle
+    else:  # N and W
+        return 360 - angle
+
+
+def bearing_components(distance, bearing):
+    """North/south and east/west components of a distance along a bearing."""
+    if math.isnan(bearing):
+        raise ValueError("Invalid bearing format. Use 'N30°E' or numeric degrees.")
+    ns_comp = distance * math.cos(to_radians(bearing))
+    ew_comp = distance * math.sin(to_radians(bearing))
+    return ns_comp, ew_comp
+
+
+def heron_area(a, b, c):
+    """Triangle area from three sides using Heron's formula."""
+    s = (a + b + c) / 2
+    return math.sqrt(s * (s-a) * (s-b) * (s-c))
+
+
+def solve_oblique(case, a=NAN, b=NAN, c=NAN, A=NAN, B=NAN, C=NAN):
+    """Solve an oblique triangle for one of the AAS/ASA/SSA/SAS/SSS cases.
+
+    Only the values named by the case are read. For an ambiguous SSA input the
+    first solution is returned and the second triangle is solved in full in
+    the ``second`` entry (a dict with the same keys), otherwise None.
+    """
+    second = None
+
+    if case == "AAS":
+        if any(math.isnan(x) for x in [A, B, a]):
+            raise ValueError("Please enter all values.")
+        if A + B >= 180:
+            raise ValueError("Angles A + B must be less than 180°")
+        C = 180 - A - B
+        ratio = a / math.sin(to_radians(A))
+        b = ratio * math.sin(to_radians(B))
+        c = ratio * math.sin(to_radians(C))
+
+    elif case == "ASA":
+        if any(math.isnan(x) for x in [A, B, c]):
+            raise ValueError("Please enter all values.")
+        if A + B >= 180:
+            raise ValueError("Angles A + B must be less than 180°")
+        C = 180 - A - B
+        ratio = c / math.sin(to_radians(C))
+        a = ratio * math.sin(to_radians(A))
+        b = ratio * math.sin(to_radians(B))
+
+    elif case == "SSA":
+        if any(math.isnan(x) for x in [a, b, A]):
+            raise ValueError("Please enter all values.")
+        sin_B = b * math.sin(to_radians(A)) / a
+        if sin_B > 1:
+            raise ValueError("No solution exists (sin B > 1)")
+        B = to_degrees(math.asin(sin_B))
+        C = 180 - A - B
+        if C <= 0:
+            raise ValueError("No valid triangle (angles sum exceeds 180°)")
+        c = a * math.sin(to_radians(C)) / math.sin(to_radians(A))
+        # Check for second solution (ambiguous case)
+        B2 = 180 - B
+        C2 = 180 - A - B2
+        if C2 > 0 and B2 != B:
+            c2 = a * math.sin(to_radians(C2)) / math.sin(to_radians(A))
+            second = {
+                'a': a, 'b': b, 'c': c2, 'A': A, 'B': B2, 'C': C2,
+                'area': heron_area(a, b, c2),
+            }
+
+    elif case == "SAS":
+        if any(math.isnan(x) for x in [a, b, C]):
+            raise ValueError("Please enter all values.")
+        c = math.sqrt(a*a + b*b - 2*a*b*math.cos(to_radians(C)))
+        if c < 1e-10:
+            raise ValueError("Invalid triangle configuration")
+        cos_A = max(-1, min(1, (b*b + c*c - a*a) / (2*b*c)))
+        A = to_degrees(math.acos(cos_A))
+        B = 180 - A - C
+
+    elif case == "SSS":
+        if any(math.isnan(x) for x in [a, b, c]):
+            raise ValueError("Please enter all values.")
+        if a + b <= c or a + c <= b or b + c <= a:
+            raise ValueError("Invalid triangle: sum of any two sides must be greater than the third")
+        cos_A = max(-1, min(1, (b*b + c*c - a*a) / (2*b*c)))
+        cos_B = max(-1, min(1, (a*a + c*c - b*b) / (2*a*c)))
+        A = to_degrees(math.acos(cos_A))
+        B = to_degrees(math.acos(cos_B))
+        C = 180 - A - B
+
+    else:
+        raise ValueError(f"Unknown case: {case}")
+
+    return {
+        'a': a, 'b': b, 'c': c, 'A': A, 'B': B, 'C': C,
+        'area': heron_area(a, b, c),
+        'second': second,
+    }
+
+
+def area_sas(a, b, C):
+    """Triangle area from two sides and the included angle."""
+    if any(math.isnan(x) for x in [a, b, C]):
+        raise ValueError("Please enter all values.")
+    return 0.5 * a * b * math.sin(to_radians(C))
+
+
+def area_sss(a, b, c):
+    """Triangle area and semi-perimeter from three sides."""
+    if any(math.isnan(x) for x in [a, b, c]):
+        raise ValueError("Please enter all values.")
+    if a + b <= c or a + c <= b or b + c <= a:
+        raise ValueError("Invalid triangle")
+    return heron_area(a, b, c), (a + b + c) / 2
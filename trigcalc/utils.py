@@ -0,0 +1,184 @@
+"""Constants and helpers shared by the calculator engine and the UI."""
+
+import functools
+import math
+import re
+
+from .exact import exact_value
+from .expressions import compile_expression
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+PI = math.pi
+
+# ============================================================
+# UTILITY FUNCTIONS
+# ============================================================
+
+PARSE_CACHE_SIZE = 1024
+RADIANS_MAX_DENOMINATOR = 12
+
+# One operand is an optional sign followed by any of a coefficient, a square
+# root (√n or sqrt(n)) and π, multiplied together: "2", "-√3", "2π", "3sqrt(2)"
+_OPERAND = (
+    r'([+-]?)\s*'
+    r'((?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)?\s*'
+    r'(?:√\s*(\d+(?:\.\d*)?|\.\d+)|(?i:sqrt)\(\s*(\d+(?:\.\d*)?|\.\d+)\s*\))?\s*'
+    r'(π|pi|PI)?'
+)
+_NUMBER_RE = re.compile(rf'\s*{_OPERAND}\s*(?:/\s*{_OPERAND}\s*)?')
+
+
+def _operand(sign, coefficient, root, sqrt_arg, pi):
+    """Value of one matched operand, or None if it matched the empty string."""
+    if not (coefficient or root or sqrt_arg or pi):
+        return None
+    value = float(coefficient) if coefficient else 1.0
+    if root or sqrt_arg:
+        value *= math.sqrt(float(root or sqrt_arg))
+    if pi:
+        value *= PI
+    return -value if sign == '-' else value
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_number(s):
+    match = _NUMBER_RE.fullmatch(s)
+    if match is None:
+        # Anything float() understands on its own ("inf", "1_000", ...),
+        # otherwise a full expression such as "3*sqrt(2)" or "(1+√5)/2"
+        try:
+            return float(s)
+        except ValueError:
+            pass
+        try:
+            return compile_expression(s)()
+        except ValueError:
+            return float('nan')
+
+    groups = match.groups()
+    numerator = _operand(*groups[:5])
+    if numerator is None:
+        return float('nan')
+    if groups[5:] == (None,) * 5 and '/' not in s:
+        return numerator
+    denominator = _operand(*groups[5:])
+    if denominator is None or denominator == 0:
+        return float('nan')
+    return numerator / denominator
+
+
+def parse_number(s):
+    """Parse a number string that may contain √, π, fractions or arithmetic.
+
+    Results are memoized per distinct string in a bounded LRU cache;
+    ``parse_number.cache_info()`` reports its hits and misses.
+    """
+    if not s or str(s).strip() == '':
+        return float('nan')
+    return _parse_number(str(s).strip())
+
+
+parse_number.cache_info = _parse_number.cache_info
+parse_number.cache_clear = _parse_number.cache_clear
+
+def to_radians(degrees):
+    """Convert degrees to radians."""
+    return degrees * PI / 180
+
+def to_degrees(radians):
+    """Convert radians to degrees."""
+    return radians * 180 / PI
+
+def format_number(n, decimals=6):
+    """Format a number for display."""
+    if abs(n) < 1e-10:
+        return '0'
+    result = round(n, decimals)
+    if result == int(result):
+        return str(int(result))
+    return str(result).rstrip('0').rstrip('.')
+
+def pi_fraction(m, max_denominator=RADIANS_MAX_DENOMINATOR):
+    """Best (n, d) with n/d ≈ m and d ≤ max_denominator, by continued fractions.
+
+    Only the convergents are tried, so this takes O(log max_denominator)
+    steps whatever the input.
+    """
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    x = m
+    while True:
+        a = math.floor(x)
+        p, q = a * p1 + p0, a * q1 + q0
+        if q > max_denominator:
+            return p1, q1
+        p0, q0, p1, q1 = p1, q1, p, q
+        if x - a < 1e-12:
+            return p1, q1
+        x = 1 / (x - a)
+
+def format_radians(r, max_denominator=RADIANS_MAX_DENOMINATOR):
+    """Format radians as a multiple of π if possible.
+
+    Any multiple n/d of π with d ≤ ``max_denominator`` is recognized, in or
+    beyond [-2π, 2π], when it is within 0.0001 of r/π.
+    """
+    m = r / PI
+    if abs(m) < 1e9:
+        n, d = pi_fraction(m, max_denominator)
+        if n and abs(m - n / d) < 0.0001:
+            return format_pi_multiple(n, d)
+    return f'{format_number(r)} rad'
+
+def format_pi_multiple(n, d=1):
+    """Format the multiple n/d of π: 'π', '-π/6', '7π/12', '3π'."""
+    sign = '-' if n < 0 else ''
+    coefficient = '' if abs(n) == 1 else str(abs(n))
+    return f'{sign}{coefficient}π' if d == 1 else f'{sign}{coefficient}π/{d}'
+
+def get_quadrant(degrees):
+    """Get the quadrant for an angle in degrees."""
+    n = ((degrees % 360) + 360) % 360
+    if n == 0 or n == 360:
+        return '+x axis'
+    elif n == 90:
+        return '+y axis'
+    elif n == 180:
+        return '-x axis'
+    elif n == 270:
+        return '-y axis'
+    elif n < 90:
+        return 'I'
+    elif n < 180:
+        return 'II'
+    elif n < 270:
+        return 'III'
+    else:
+        return 'IV'
+
+def get_reference_angle(degrees):
+    """Get the reference angle in degrees."""
+    n = ((degrees % 360) + 360) % 360
+    if n <= 90:
+        return n
+    elif n <= 180:
+        return 180 - n
+    elif n <= 270:
+        return n - 180
+    else:
+        return 360 - n
+
+def get_exact_value(degrees, func):
+    """Get the exact value of a trig function at a multiple of 15° or 18°."""
+    return exact_value(degrees, func)
+
+def format_complex(re_part, im_part):
+    """Format a complex number for display."""
+    if abs(im_part) < 1e-10:
+        return format_number(re_part)
+    if abs(re_part) < 1e-10:
+        return f"{format_number(im_part)}i"
+    sign = '+' if im_part >= 0 else '-'
+    return f"{format_number(re_part)} {sign} {format_number(abs(im_part))}i"
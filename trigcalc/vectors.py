@@ -0,0 +1,53 @@
+"""Two-dimensional vector operations."""
+
+import math
+
+VECTOR_OPERATIONS = ["add", "subtract", "dot", "cross", "angle"]
+
+
+def magnitude(x, y):
+    """Length of the vector (x, y)."""
+    return math.sqrt(x*x + y*y)
+
+
+def vector_operation(op, ux, uy, vx, vy):
+    """Apply a binary operation to vectors U and V.
+
+    ``op`` is one of add, subtract, dot, cross or angle. The angle between
+    the vectors is returned in radians.
+    """
+    if any(math.isnan(x) for x in [ux, uy, vx, vy]):
+        raise ValueError("Please enter all vector components.")
+
+    if op == "add":
+        rx, ry = ux + vx, uy + vy
+        return {'x': rx, 'y': ry, 'magnitude': magnitude(rx, ry)}
+    if op == "subtract":
+        rx, ry = ux - vx, uy - vy
+        return {'x': rx, 'y': ry, 'magnitude': magnitude(rx, ry)}
+    if op == "dot":
+        return {'dot': ux * vx + uy * vy}
+    if op == "cross":
+        return {'cross': ux * vy - uy * vx}
+    if op == "angle":
+        mag_u = magnitude(ux, uy)
+        mag_v = magnitude(vx, vy)
+        if mag_u < 1e-10 or mag_v < 1e-10:
+            raise ValueError("Cannot find angle with zero vector")
+        dot = ux * vx + uy * vy
+        cos_angle = max(-1, min(1, dot / (mag_u * mag_v)))  # Clamp to [-1, 1]
+        return {'angle': math.acos(cos_angle)}
+    raise ValueError(f"Unknown operation: {op}")
+
+
+def vector_properties(x, y):
+    """Magnitude, direction (radians) and unit vector of (x, y)."""
+    if math.isnan(x) or math.isnan(y):
+        raise ValueError("Please enter both components.")
+
+    mag = magnitude(x, y)
+    if mag > 1e-10:
+        unit = (x / mag, y / mag)
+    else:
+        unit = (0, 0)
+    return {'magnitude': mag, 'direction': math.atan2(y, x), 'unit': unit}